@@ -86,10 +86,12 @@ class MemoryConsolidator:
         stats = {"boosted": 0, "decayed": 0, "removed": 0, "total_processed": 0}
         now = datetime.now(timezone.utc)
 
-        offset = 0
+        # Keyset pagination: updates and deletes made while walking the
+        # store cannot shift later pages the way an OFFSET would.
+        after = None
         batch_size = 100
         while True:
-            memories = self._store.list_all(limit=batch_size, offset=offset)
+            memories = self._store.list_all(limit=batch_size, after=after)
             if not memories:
                 break
 
@@ -101,7 +103,8 @@ class MemoryConsolidator:
 
             if len(memories) < batch_size:
                 break
-            offset += batch_size
+            last = memories[-1]
+            after = (last["updated_at"], last["id"])
 
         # Also purge expired memories
         try:
@@ -43,6 +43,11 @@ class MCPClientTool:
         except Exception:
             logger.exception("Failed to load MCP server configs")
 
+        # Configs are immutable after load — precompute membership set and
+        # the "Available: ..." listing used on every unknown-server error.
+        self._server_names = frozenset(self._server_configs)
+        self._server_names_str = ", ".join(self._server_configs)
+
     # -- Amplifier Tool protocol --------------------------------------------
 
     @property
@@ -123,19 +128,23 @@ class MCPClientTool:
             }
         return ToolResult(success=True, output={"servers": servers})
 
+    def _unknown_server(self, server_name: str) -> ToolResult:
+        """Error result for a missing or unconfigured server name."""
+        return ToolResult(
+            success=False,
+            error={
+                "message": (
+                    f"Server '{server_name}' not configured. "
+                    f"Available: {self._server_names_str}"
+                ),
+            },
+        )
+
     async def _list_tools(self, input: dict[str, Any]) -> ToolResult:  # noqa: A002
         """List tools available on an MCP server."""
         server_name = input.get("server", "")
-        if not server_name or server_name not in self._server_configs:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": (
-                        f"Server '{server_name}' not configured. "
-                        f"Available: {', '.join(self._server_configs)}"
-                    ),
-                },
-            )
+        if server_name not in self._server_names:
+            return self._unknown_server(server_name)
 
         transport = await self._get_connection(server_name)
         result = await transport.send_request(TOOLS_LIST, {})
@@ -147,16 +156,8 @@ class MCPClientTool:
         tool_name = input.get("tool", "")
         arguments = input.get("arguments", {})
 
-        if not server_name or server_name not in self._server_configs:
-            return ToolResult(
-                success=False,
-                error={
-                    "message": (
-                        f"Server '{server_name}' not configured. "
-                        f"Available: {', '.join(self._server_configs)}"
-                    ),
-                },
-            )
+        if server_name not in self._server_names:
+            return self._unknown_server(server_name)
         if not tool_name:
             return ToolResult(
                 success=False,
@@ -199,6 +200,18 @@ class MCPClientTool:
         if server_name in self._connections and self._connections[server_name].is_connected:
             return self._connections[server_name]
 
+        stale = self._connections.pop(server_name, None)
+        if stale is not None:
+            # The server died (exited, EOF, broken pipe): reap it, and make
+            # the replacement process go through the handshake again.
+            self._initialized.discard(server_name)
+            try:
+                await stale.close()
+            except Exception:
+                logger.debug(
+                    "Error closing stale transport for %s", server_name, exc_info=True
+                )
+
         cfg = self._server_configs[server_name]
         transport: Transport
 
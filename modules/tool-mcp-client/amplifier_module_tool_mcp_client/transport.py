@@ -12,6 +12,32 @@ from .protocol import MCPError, build_request, parse_response
 
 logger = logging.getLogger(__name__)
 
+# Largest stdio frame accepted before the server is treated as misbehaving.
+_MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover
+    _orjson = None  # type: ignore[assignment]
+
+
+def _encode_line(message: dict[str, Any]) -> bytes:
+    """Serialize *message* to newline-terminated wire bytes.
+
+    Uses orjson's ``OPT_APPEND_NEWLINE`` when available so encoding and
+    framing happen in a single C call; falls back to stdlib ``json``.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(message, option=_orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(message).encode() + b"\n"
+
+
+def _decode(data: bytes | memoryview) -> Any:
+    """Parse a JSON-RPC frame (orjson when available, else stdlib)."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(bytes(data))
+
 
 # ---------------------------------------------------------------------------
 # Abstract base
@@ -63,6 +89,11 @@ class StdioTransport(Transport):
         self._command = command
         self._env = env
         self._process: asyncio.subprocess.Process | None = None
+        # Cached liveness flag — set by connect(), cleared on EOF, a broken
+        # pipe / timeout in send_request(), or close().
+        self._connected = False
+        # Reusable read buffer; may hold bytes past the current frame.
+        self._scratch = bytearray()
 
     # -- Transport interface ------------------------------------------------
 
@@ -78,6 +109,7 @@ class StdioTransport(Transport):
             stderr=asyncio.subprocess.PIPE,
             env=env,
         )
+        self._connected = True
         logger.info("StdioTransport connected: %s (pid=%s)", self._command[0], self._process.pid)
 
     async def send_request(self, method: str, params: dict[str, Any]) -> Any:
@@ -87,32 +119,69 @@ class StdioTransport(Transport):
             raise MCPError(msg)
 
         request = build_request(method, params)
-        line = json.dumps(request).encode() + b"\n"
-        self._process.stdin.write(line)
-        await self._process.stdin.drain()
-
-        response_line = await asyncio.wait_for(
-            self._process.stdout.readline(),
-            timeout=30,
-        )
-        if not response_line:
-            msg = "MCP server closed stdout unexpectedly"
-            raise MCPError(msg)
-
-        data = json.loads(response_line)
-        return parse_response(data)
+        try:
+            self._process.stdin.write(_encode_line(request))
+            await self._process.stdin.drain()
+
+            response = await asyncio.wait_for(
+                self._read_message(self._process.stdout),
+                timeout=30,
+            )
+        except (OSError, asyncio.TimeoutError):
+            # Dead server (broken pipe / reset) or a stream now out of step
+            # with its requests: either way the caller must reconnect.
+            self._connected = False
+            raise
+        return parse_response(response)
+
+    async def _read_message(self, reader: asyncio.StreamReader) -> Any:
+        """Read and decode the next newline-delimited frame from *reader*.
+
+        Reads in 64 KiB chunks into a persistent ``bytearray`` so several
+        frames can be served from one read, and decodes straight from a
+        view of it.  Only newly read bytes are searched for the newline.
+        """
+        scratch = self._scratch
+        i = scratch.find(b"\n")
+        while i < 0:
+            if len(scratch) > _MAX_FRAME_BYTES:
+                scratch.clear()
+                self._connected = False
+                msg = f"MCP server sent a frame over {_MAX_FRAME_BYTES} bytes"
+                raise MCPError(msg)
+            chunk = await reader.read(65536)
+            if not chunk:
+                self._connected = False
+                msg = "MCP server closed stdout unexpectedly"
+                raise MCPError(msg)
+            start = len(scratch)
+            scratch.extend(chunk)
+            i = scratch.find(b"\n", start)
+        try:
+            with memoryview(scratch)[:i] as frame:
+                return _decode(frame)
+        finally:
+            # Runs after the view is released, so the buffer may shrink
+            del scratch[: i + 1]
 
     async def close(self) -> None:
         """Terminate the subprocess."""
+        self._connected = False
         if self._process:
-            self._process.terminate()
+            if self._process.returncode is None:
+                self._process.terminate()
             await self._process.wait()
             logger.info("StdioTransport closed")
         self._process = None
+        self._scratch.clear()
 
     @property
     def is_connected(self) -> bool:
-        return self._process is not None and self._process.returncode is None
+        return (
+            self._connected
+            and self._process is not None
+            and self._process.returncode is None
+        )
 
 
 # ---------------------------------------------------------------------------
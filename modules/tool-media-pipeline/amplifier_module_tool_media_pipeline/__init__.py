@@ -14,6 +14,7 @@ from typing import Any
 
 from amplifier_core.models import ToolResult  # type: ignore[import-not-found]
 
+from .concurrency import DEFAULT_CONCURRENCY
 from .synthesize import TTSProvider, create_tts_provider
 from .transcribe import TranscriptionProvider, create_transcription_provider
 
@@ -48,6 +49,12 @@ class MediaPipelineTool:
             self._tts = create_tts_provider(self._config.get("tts", {}))
         return self._tts
 
+    async def close(self) -> None:
+        """Close any providers that have been created (HTTP sessions etc.)."""
+        for provider in (self._transcription, self._tts):
+            if provider is not None:
+                await provider.close()
+
     # -- Amplifier Tool protocol ----------------------------------------------
 
     @property
@@ -76,6 +83,14 @@ class MediaPipelineTool:
                     "type": "string",
                     "description": ("Path to audio file (required for 'transcribe')."),
                 },
+                "audio_paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Several audio files to transcribe concurrently "
+                        "(alternative to 'audio_path')."
+                    ),
+                },
                 "text": {
                     "type": "string",
                     "description": ("Text to synthesize (required for 'synthesize')."),
@@ -125,6 +140,24 @@ class MediaPipelineTool:
     # -- action handlers ------------------------------------------------------
 
     async def _transcribe(self, input: dict[str, Any]) -> ToolResult:
+        audio_paths = input.get("audio_paths")
+        if audio_paths is not None:
+            if (
+                not isinstance(audio_paths, list)
+                or not audio_paths
+                or not all(isinstance(p, str) and p for p in audio_paths)
+            ):
+                return ToolResult(
+                    success=False,
+                    error={
+                        "message": (
+                            "Parameter 'audio_paths' must be a non-empty list "
+                            "of file paths."
+                        ),
+                    },
+                )
+            return await self._transcribe_many(audio_paths)
+
         audio_path = input.get("audio_path")
         if not audio_path:
             return ToolResult(
@@ -140,6 +173,22 @@ class MediaPipelineTool:
             output={"text": text, "audio_path": audio_path},
         )
 
+    async def _transcribe_many(self, audio_paths: list[str]) -> ToolResult:
+        transcription = self._config.get("transcription", {})
+        concurrency = int(transcription.get("concurrency", DEFAULT_CONCURRENCY))
+        provider = self._get_transcription_provider()
+        texts = await provider.transcribe_many(audio_paths, concurrency=concurrency)
+
+        return ToolResult(
+            success=True,
+            output={
+                "results": [
+                    {"text": text, "audio_path": path}
+                    for path, text in zip(audio_paths, texts, strict=True)
+                ],
+            },
+        )
+
     async def _synthesize(self, input: dict[str, Any]) -> ToolResult:
         text = input.get("text")
         output_path = input.get("output_path")
@@ -174,7 +223,7 @@ class MediaPipelineTool:
 async def mount(
     coordinator: Any,
     config: dict[str, Any] | None = None,
-) -> None:
+) -> Any:
     """Mount the media pipeline tool into the Amplifier coordinator.
 
     Configuration keys (all optional):
@@ -182,10 +231,13 @@ async def mount(
             provider: "whisper-api" or "local-whisper"
             api_key:  Whisper API key (for whisper-api)
             model:    Model name
+            concurrency: Max in-flight transcriptions for batch calls
         tts:
             provider: "edge-tts", "elevenlabs", or "openai-tts"
             api_key:  API key (for elevenlabs and openai-tts)
             voice:    Voice name/ID
+
+    Returns a cleanup callable that closes the providers' HTTP sessions.
     """
     config = config or {}
     tool = MediaPipelineTool(config=config)
@@ -194,3 +246,9 @@ async def mount(
     coordinator.register_capability("media.pipeline", tool)
 
     logger.info("tool-media-pipeline mounted")
+
+    async def cleanup() -> None:
+        await tool.close()
+        logger.info("tool-media-pipeline unmounted")
+
+    return cleanup
@@ -0,0 +1,59 @@
+"""Small content-addressed LRU cache used to skip duplicate media work."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_CACHE_SIZE = 32
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded mapping that evicts the least recently used entry.
+
+    A *maxsize* of 0 disables caching entirely.
+    """
+
+    __slots__ = ("_maxsize", "_data")
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._maxsize > 0
+
+    def get(self, key: K) -> V | None:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        if self._maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _sha256_file(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+async def file_digest(path: str | Path) -> str:
+    """SHA-256 hex digest of a file's contents, hashed off the event loop."""
+    return await asyncio.to_thread(_sha256_file, Path(path))
@@ -0,0 +1,255 @@
+"""Silence-aware splitting of long audio for chunked transcription.
+
+Uses ``ffmpeg``'s ``silencedetect`` filter as a lightweight VAD: cut points
+are placed in the silence nearest each ~``target_sec`` boundary so words
+are not split, and neighbouring chunks overlap slightly.  Chunks are then
+transcribed concurrently and their texts merged, dropping the words the
+overlap caused to be transcribed twice.  The language detected on the
+first chunk is handed to the rest so they skip language detection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import shutil
+import tempfile
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from .concurrency import DEFAULT_CONCURRENCY, gather_bounded
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGET_SEC = 25.0
+DEFAULT_OVERLAP_SEC = 0.5
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
+# Longest run of words considered when de-duplicating a chunk boundary.
+_MAX_OVERLAP_WORDS = 12
+
+
+# ---------------------------------------------------------------------------
+# ffmpeg helpers
+# ---------------------------------------------------------------------------
+
+
+async def _run(*args: str) -> tuple[bytes, bytes]:
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        msg = f"{args[0]} failed (rc={proc.returncode}): {stderr.decode()[-500:]}"
+        raise RuntimeError(msg)
+    return stdout, stderr
+
+
+async def probe_duration(audio_path: str) -> float:
+    """Return the duration of *audio_path* in seconds (via ``ffprobe``)."""
+    stdout, _ = await _run(
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        audio_path,
+    )
+    return float(stdout.decode().strip())
+
+
+def parse_silences(ffmpeg_log: str) -> list[tuple[float, float]]:
+    """Extract ``(start, end)`` silence intervals from ``silencedetect`` output."""
+    starts = [float(m) for m in _SILENCE_START_RE.findall(ffmpeg_log)]
+    ends = [float(m) for m in _SILENCE_END_RE.findall(ffmpeg_log)]
+    return [(max(0.0, s), e) for s, e in zip(starts, ends, strict=False)]
+
+
+async def detect_silences(
+    audio_path: str,
+    noise_db: int = -35,
+    min_silence_sec: float = 0.3,
+) -> list[tuple[float, float]]:
+    """Run ``silencedetect`` over *audio_path* and return silence intervals."""
+    _, stderr = await _run(
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-i",
+        audio_path,
+        "-af",
+        f"silencedetect=noise={noise_db}dB:d={min_silence_sec}",
+        "-f",
+        "null",
+        "-",
+    )
+    return parse_silences(stderr.decode(errors="replace"))
+
+
+# ---------------------------------------------------------------------------
+# Planning and merging (pure)
+# ---------------------------------------------------------------------------
+
+
+def plan_chunks(
+    duration: float,
+    silences: list[tuple[float, float]],
+    target_sec: float = DEFAULT_TARGET_SEC,
+    overlap: float = DEFAULT_OVERLAP_SEC,
+) -> list[tuple[float, float]]:
+    """Choose ``(start, end)`` spans covering ``[0, duration]``.
+
+    Each cut lands at the midpoint of the silence closest to
+    ``start + target_sec`` within the last 40% of the window; with no
+    silence there it falls back to a hard cut at the target.  The next
+    chunk starts *overlap* seconds before the cut.
+    """
+    midpoints = sorted((s + e) / 2 for s, e in silences)
+    spans: list[tuple[float, float]] = []
+    start = 0.0
+    while duration - start > target_sec:
+        target = start + target_sec
+        earliest = start + target_sec * 0.6
+        window = [m for m in midpoints if earliest <= m <= target]
+        cut = min(window, key=lambda m: target - m) if window else target
+        spans.append((start, cut))
+        start = max(cut - overlap, start + 1.0)
+    spans.append((start, duration))
+    return spans
+
+
+def merge_transcripts(texts: list[str]) -> str:
+    """Join chunk transcripts, dropping words repeated across a boundary.
+
+    For each boundary the longest run of words that ends the previous
+    text and starts the next one (case- and punctuation-insensitive) is
+    removed from the next text.
+    """
+    merged: list[str] = []
+    for text in texts:
+        words = text.split()
+        if merged and words:
+            tail = [_norm(w) for w in merged[-_MAX_OVERLAP_WORDS:]]
+            head = [_norm(w) for w in words[:_MAX_OVERLAP_WORDS]]
+            for n in range(min(len(tail), len(head)), 0, -1):
+                if tail[-n:] == head[:n]:
+                    words = words[n:]
+                    break
+        merged.extend(words)
+    return " ".join(merged)
+
+
+def _norm(word: str) -> str:
+    return word.strip(".,!?;:\"'").lower()
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+
+async def chunk_audio(
+    audio_path: str,
+    out_dir: str,
+    target_sec: float = DEFAULT_TARGET_SEC,
+    overlap: float = DEFAULT_OVERLAP_SEC,
+    duration: float | None = None,
+) -> list[tuple[float, float, str]]:
+    """Split *audio_path* at silences into 16 kHz mono WAVs under *out_dir*.
+
+    Returns ``(start, end, path)`` tuples in time order.
+    """
+    if duration is None:
+        duration = await probe_duration(audio_path)
+    silences = await detect_silences(audio_path)
+    spans = plan_chunks(duration, silences, target_sec, overlap)
+
+    async def _extract(indexed: tuple[int, tuple[float, float]]) -> str:
+        i, (start, end) = indexed
+        chunk_path = str(Path(out_dir) / f"chunk_{i:04d}.wav")
+        await _run(
+            "ffmpeg",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-ss",
+            f"{start:.3f}",
+            "-t",
+            f"{end - start:.3f}",
+            "-i",
+            audio_path,
+            "-ar",
+            "16000",
+            "-ac",
+            "1",
+            "-y",
+            chunk_path,
+        )
+        return chunk_path
+
+    paths = await gather_bounded(_extract, list(enumerate(spans)))
+    return [(s, e, p) for (s, e), p in zip(spans, paths, strict=True)]
+
+
+# (chunk_path, language hint) -> (text, detected language)
+ChunkTranscriber = Callable[
+    [str, str | None], Awaitable[tuple[str, str | None]]
+]
+
+
+async def transcribe_chunked(
+    audio_path: str,
+    transcribe_one: ChunkTranscriber,
+    *,
+    target_sec: float = DEFAULT_TARGET_SEC,
+    overlap: float = DEFAULT_OVERLAP_SEC,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    language: str | None = None,
+    detect_language: bool = True,
+) -> str | None:
+    """Transcribe a long file chunk-by-chunk, concurrently.
+
+    *transcribe_one* takes ``(chunk_path, language)`` and returns
+    ``(text, detected_language)``.  Unless *language* is given, the first
+    chunk is transcribed alone so the language it detects can be passed to
+    the remaining chunks, which then skip detection.  Pass
+    *detect_language* False for transcribers that cannot report a detected
+    language; every chunk then starts at once.
+
+    Returns ``None`` when the file is short enough to transcribe whole,
+    so the caller can fall through to its normal path.
+    """
+    duration = await probe_duration(audio_path)
+    if duration <= target_sec:
+        return None
+
+    tmp_dir = tempfile.mkdtemp(prefix="letsgo-chunks-")
+    try:
+        chunks = await chunk_audio(audio_path, tmp_dir, target_sec, overlap, duration)
+        logger.info(
+            "Transcribing %s in %d chunks (%.0fs)",
+            Path(audio_path).name,
+            len(chunks),
+            duration,
+        )
+        paths = [path for _, _, path in chunks]
+        texts: list[str] = []
+        if language is None and detect_language:
+            first, language = await transcribe_one(paths.pop(0), None)
+            texts.append(first)
+
+        async def _one(path: str) -> str:
+            text, _ = await transcribe_one(path, language)
+            return text
+
+        texts.extend(await gather_bounded(_one, paths, concurrency))
+        return merge_transcripts([t.strip() for t in texts])
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
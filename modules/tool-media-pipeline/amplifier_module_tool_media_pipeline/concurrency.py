@@ -0,0 +1,31 @@
+"""Bounded fan-out helper shared by the transcription and TTS providers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    limit: int = DEFAULT_CONCURRENCY,
+) -> list[R]:
+    """Run ``func(item)`` for every item with at most *limit* in flight.
+
+    Results are returned in input order.  The first exception propagates,
+    matching :func:`asyncio.gather`.
+    """
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _one(item: T) -> R:
+        async with sem:
+            return await func(item)
+
+    return list(await asyncio.gather(*(_one(item) for item in items)))
@@ -0,0 +1,186 @@
+"""Staged decode → VAD → inference pipeline for in-process transcription.
+
+Rather than decoding the whole file, then segmenting it, then running the
+model, the three stages run concurrently and hand work along bounded
+queues::
+
+    ffmpeg (s16le PCM on stdout) → energy VAD → model.transcribe (thread)
+
+so wall-clock time approaches the slowest stage instead of the sum, and
+only a few chunks of PCM are ever held in memory.  The language detected
+on the first chunk is passed to later ones so they skip detection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+from .chunking import DEFAULT_TARGET_SEC
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+_BYTES_PER_SAMPLE = 2  # s16le mono
+FRAME_SEC = 0.1
+_QUEUE_DEPTH = 4
+# RMS (int16 scale) below which a frame counts as silence.
+SILENCE_RMS = 300.0
+
+_EOF = None
+
+
+async def decode_pcm(
+    audio_path: str, frame_sec: float = FRAME_SEC
+) -> AsyncIterator[bytes]:
+    """Yield fixed-size 16 kHz mono s16le frames decoded by ``ffmpeg``.
+
+    Raises ``RuntimeError`` with ffmpeg's stderr once the output ends if
+    ffmpeg exited non-zero (unreadable or corrupt input).
+    """
+    frame_bytes = int(SAMPLE_RATE * frame_sec) * _BYTES_PER_SAMPLE
+    proc = await asyncio.create_subprocess_exec(
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        audio_path,
+        "-f",
+        "s16le",
+        "-ar",
+        str(SAMPLE_RATE),
+        "-ac",
+        "1",
+        "pipe:1",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    # Drain stderr alongside stdout so a chatty ffmpeg can never block on it.
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    try:
+        while True:
+            try:
+                frame = await proc.stdout.readexactly(frame_bytes)
+            except asyncio.IncompleteReadError as exc:
+                if exc.partial:
+                    yield exc.partial
+                break
+            yield frame
+        returncode = await proc.wait()
+        stderr = await stderr_task
+        if returncode != 0:
+            msg = (
+                f"ffmpeg decode failed (rc={returncode}): "
+                f"{stderr.decode(errors='replace').strip()}"
+            )
+            raise RuntimeError(msg)
+    finally:
+        # Only reached with ffmpeg still running if the consumer stopped early
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+        stderr_task.cancel()
+        await asyncio.gather(stderr_task, return_exceptions=True)
+
+
+def _frame_rms(frame: bytes) -> float:
+    import numpy as np
+
+    samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+    return float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+
+
+async def _vad_stage(
+    frames: AsyncIterator[bytes],
+    out: asyncio.Queue[bytes | None],
+    target_sec: float,
+    max_sec: float,
+) -> None:
+    """Group frames into chunks, closing each at the first silence past
+    *target_sec* (or unconditionally at *max_sec*)."""
+    bytes_per_sec = SAMPLE_RATE * _BYTES_PER_SAMPLE
+    buf = bytearray()
+    try:
+        async for frame in frames:
+            buf.extend(frame)
+            seconds = len(buf) / bytes_per_sec
+            if seconds >= max_sec or (
+                seconds >= target_sec and _frame_rms(frame) < SILENCE_RMS
+            ):
+                await out.put(bytes(buf))
+                buf.clear()
+        if buf:
+            await out.put(bytes(buf))
+        await out.put(_EOF)
+    finally:
+        aclose = getattr(frames, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+Infer = Callable[[Any, str | None], tuple[str, str | None]]
+
+
+async def _inference_stage(
+    chunks: asyncio.Queue[bytes | None],
+    infer: Infer,
+    texts: list[str],
+    language: str | None = None,
+    slots: asyncio.Semaphore | None = None,
+) -> None:
+    import numpy as np
+
+    while (chunk := await chunks.get()) is not _EOF:
+        audio = np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768.0
+        async with slots or contextlib.nullcontext():
+            text, detected = await asyncio.to_thread(infer, audio, language)
+        language = language or detected
+        if text:
+            texts.append(text)
+
+
+async def transcribe_pipelined(
+    audio_path: str,
+    infer: Infer,
+    *,
+    target_sec: float = DEFAULT_TARGET_SEC,
+    frames: AsyncIterator[bytes] | None = None,
+    language: str | None = None,
+    slots: asyncio.Semaphore | None = None,
+) -> str:
+    """Transcribe *audio_path* with decode, VAD and inference overlapped.
+
+    *infer* is a blocking callable taking a float32 NumPy waveform at
+    16 kHz and a language hint, returning ``(text, detected_language)``;
+    it runs in a worker thread, holding one of *slots* per chunk when
+    given.  *frames* lets callers supply PCM directly instead of spawning
+    ``ffmpeg``.
+    """
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_QUEUE_DEPTH)
+    texts: list[str] = []
+    source = frames if frames is not None else decode_pcm(audio_path)
+    stages = {
+        asyncio.create_task(
+            _vad_stage(source, chunks, target_sec, max_sec=target_sec + 5.0)
+        ),
+        asyncio.create_task(
+            _inference_stage(chunks, infer, texts, language, slots)
+        ),
+    }
+    # If either stage fails (or we are cancelled), cancel the other rather
+    # than leaving it blocked on the queue with ffmpeg still running.
+    try:
+        done, _ = await asyncio.wait(stages, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in stages:
+            task.cancel()
+        await asyncio.gather(*stages, return_exceptions=True)
+    for task in done:
+        if (exc := task.exception()) is not None:
+            raise exc
+    return " ".join(texts)
@@ -0,0 +1,28 @@
+"""Shared HTTP session factory for the API-backed media providers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Pooled connections per provider session (aiohttp's default is 100).
+HTTP_CONNECTION_LIMIT = 32
+# Keep idle TLS connections to the API warm between calls.
+HTTP_KEEPALIVE_S = 60.0
+# Cache API host DNS lookups for this long.
+HTTP_DNS_CACHE_S = 300
+
+
+def new_client_session() -> Any:
+    """Create an ``aiohttp.ClientSession`` with a tuned, bounded connector.
+
+    Must be called from a running event loop; the caller owns the session
+    and must ``await session.close()`` (which also closes the connector).
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CONNECTION_LIMIT,
+        keepalive_timeout=HTTP_KEEPALIVE_S,
+        ttl_dns_cache=HTTP_DNS_CACHE_S,
+    )
+    return aiohttp.ClientSession(connector=connector)
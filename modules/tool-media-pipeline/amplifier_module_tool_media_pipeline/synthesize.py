@@ -2,15 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import shutil
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import edge_tts
 
+from .cache import DEFAULT_CACHE_SIZE, LRUCache
+from .concurrency import DEFAULT_CONCURRENCY, gather_bounded
+from .session import new_client_session
+
 logger = logging.getLogger(__name__)
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _preallocate(f: Any, size: int) -> None:
+    """Reserve *size* bytes for *f* where the OS and filesystem support it."""
+    if not hasattr(os, "posix_fallocate"):
+        return
+    try:
+        os.posix_fallocate(f.fileno(), 0, size)
+    except OSError:
+        # e.g. EOPNOTSUPP on filesystems without fallocate; not fatal.
+        pass
+
 
 # ---------------------------------------------------------------------------
 # ABC
@@ -20,12 +41,119 @@ logger = logging.getLogger(__name__)
 class TTSProvider(ABC):
     """Abstract base for text-to-speech synthesis."""
 
+    # Subclasses declare their own __slots__ so instances carry no __dict__.
+    __slots__ = ()
+
     @abstractmethod
     async def synthesize(
         self, text: str, output_path: str, voice: str | None = None
     ) -> str:
         """Synthesize *text* to audio at *output_path*. Returns the output path."""
 
+    async def synthesize_many(
+        self,
+        items: list[tuple[str, str]],
+        voice: str | None = None,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[str]:
+        """Synthesize ``(text, output_path)`` pairs; returns paths in order.
+
+        Requests are fanned out with at most *concurrency* in flight.
+        """
+
+        async def _one(item: tuple[str, str]) -> str:
+            text, output_path = item
+            return await self.synthesize(text, output_path, voice=voice)
+
+        return await gather_bounded(_one, items, concurrency)
+
+    async def close(self) -> None:  # noqa: B027
+        """Release any resources held by the provider (no-op by default)."""
+
+
+class _HTTPTTSProvider(TTSProvider):
+    """Base for API-backed providers that share one ``aiohttp`` session.
+
+    Reusing the session keeps the connection pool (and its TLS sessions)
+    warm across calls instead of re-handshaking on every synthesis.
+
+    Results are remembered in an LRU keyed by ``(text, voice, model)`` so
+    repeated requests are served by copying the earlier output file
+    instead of calling (and paying for) the API again.
+    """
+
+    __slots__ = ("_http_session", "_audio_cache")
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self._http_session: Any = None
+        # (text, voice, model) -> (path, size, mtime_ns) of a previous output
+        self._audio_cache: LRUCache[tuple[str, str, str], tuple[str, int, int]] = (
+            LRUCache(cache_size)
+        )
+
+    async def _replay_cached(
+        self, key: tuple[str, str, str], output_path: str
+    ) -> bool:
+        """Copy a cached synthesis to *output_path*; False on miss or stale file."""
+        entry = self._audio_cache.get(key)
+        if entry is None:
+            return False
+        cached_path, size, mtime_ns = entry
+        try:
+            st = os.stat(cached_path)
+        except OSError:
+            return False
+        if (st.st_size, st.st_mtime_ns) != (size, mtime_ns):
+            return False
+        if os.path.abspath(cached_path) != os.path.abspath(output_path):
+            await asyncio.to_thread(shutil.copyfile, cached_path, output_path)
+        logger.info("TTS cache hit (voice=%s)", key[1])
+        return True
+
+    @staticmethod
+    async def _stream_to_file(resp: Any, output_path: str) -> None:
+        """Write the response body to *output_path* as chunks arrive.
+
+        Peak memory stays at one chunk regardless of audio length; blocking
+        file I/O runs off the event loop.  When the server sends a
+        Content-Length the file's blocks are reserved up front, so long
+        outputs are laid out contiguously and a full disk fails before the
+        download rather than midway.  A partial file is removed if the
+        transfer fails.
+        """
+        length = getattr(resp, "content_length", None)
+        f = await asyncio.to_thread(open, output_path, "wb")
+        written = 0
+        try:
+            if isinstance(length, int) and length > 0:
+                await asyncio.to_thread(_preallocate, f, length)
+            async for chunk in resp.content.iter_chunked(_STREAM_CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
+                written += len(chunk)
+            # Drop any reserved tail the body didn't fill (short/compressed body).
+            await asyncio.to_thread(f.truncate, written)
+        except BaseException:
+            f.close()
+            Path(output_path).unlink(missing_ok=True)
+            raise
+        await asyncio.to_thread(f.close)
+
+    def _remember(self, key: tuple[str, str, str], output_path: str) -> None:
+        st = os.stat(output_path)
+        self._audio_cache.put(key, (output_path, st.st_size, st.st_mtime_ns))
+
+    def _get_session(self) -> Any:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = new_client_session()
+        return self._http_session
+
+    async def close(self) -> None:
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
 
 # ---------------------------------------------------------------------------
 # edge-tts (free, no API key)
@@ -35,8 +163,15 @@ class TTSProvider(ABC):
 class EdgeTTSProvider(TTSProvider):
     """Uses the ``edge-tts`` library for free TTS via Microsoft Edge."""
 
-    def __init__(self, voice: str = "en-US-AriaNeural") -> None:
+    __slots__ = ("_voice", "_max_concurrency")
+
+    def __init__(
+        self,
+        voice: str = "en-US-AriaNeural",
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
         self._voice = voice
+        self._max_concurrency = max_concurrency
 
     async def synthesize(
         self, text: str, output_path: str, voice: str | None = None
@@ -48,49 +183,90 @@ class EdgeTTSProvider(TTSProvider):
         await communicate.save(output_path)
         return output_path
 
+    async def synthesize_many(
+        self,
+        items: list[tuple[str, str]],
+        voice: str | None = None,
+        *,
+        concurrency: int | None = None,
+    ) -> list[str]:
+        """Synthesize a batch, opening one Edge session per *distinct* text.
+
+        Repeated utterances (common when narrating sentence by sentence)
+        are synthesized once and copied to their other output paths; the
+        distinct jobs fan out under ``max_concurrency``.
+        """
+        first_path: dict[str, str] = {}
+        unique: list[tuple[str, str]] = []
+        for text, output_path in items:
+            if text not in first_path:
+                first_path[text] = output_path
+                unique.append((text, output_path))
+
+        await super().synthesize_many(
+            unique, voice, concurrency=concurrency or self._max_concurrency
+        )
+        for text, output_path in items:
+            source = first_path[text]
+            if output_path != source:
+                await asyncio.to_thread(shutil.copyfile, source, output_path)
+        return [output_path for _, output_path in items]
+
 
 # ---------------------------------------------------------------------------
 # ElevenLabs
 # ---------------------------------------------------------------------------
 
 
-class ElevenLabsProvider(TTSProvider):
+class ElevenLabsProvider(_HTTPTTSProvider):
     """Calls the ElevenLabs TTS API."""
 
     ELEVENLABS_API_URL = "https://api.elevenlabs.io/v1/text-to-speech"
 
-    def __init__(self, api_key: str, voice_id: str = "21m00Tcm4TlvDq8ikWAM") -> None:
+    ELEVENLABS_MODEL_ID = "eleven_monolingual_v1"
+
+    __slots__ = ("_api_key", "_voice_id")
+
+    def __init__(
+        self,
+        api_key: str,
+        voice_id: str = "21m00Tcm4TlvDq8ikWAM",
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        super().__init__(cache_size)
         self._api_key = api_key
         self._voice_id = voice_id
 
     async def synthesize(
         self, text: str, output_path: str, voice: str | None = None
     ) -> str:
-        import aiohttp
-
         effective_voice_id = voice or self._voice_id
+        key = (text, effective_voice_id, self.ELEVENLABS_MODEL_ID)
+        if await self._replay_cached(key, output_path):
+            return output_path
+
         url = f"{self.ELEVENLABS_API_URL}/{effective_voice_id}"
         logger.info("Synthesizing via ElevenLabs (voice=%s)", effective_voice_id)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url,
-                headers={
-                    "xi-api-key": self._api_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "text": text,
-                    "model_id": "eleven_monolingual_v1",
-                },
-            ) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    msg = f"ElevenLabs API error ({resp.status}): {body}"
-                    raise RuntimeError(msg)
-                audio_bytes = await resp.read()
-
-        Path(output_path).write_bytes(audio_bytes)
+        session = self._get_session()
+        async with session.post(
+            url,
+            headers={
+                "xi-api-key": self._api_key,
+                "Content-Type": "application/json",
+            },
+            json={
+                "text": text,
+                "model_id": self.ELEVENLABS_MODEL_ID,
+            },
+        ) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                msg = f"ElevenLabs API error ({resp.status}): {body}"
+                raise RuntimeError(msg)
+            await self._stream_to_file(resp, output_path)
+
+        self._remember(key, output_path)
         return output_path
 
 
@@ -99,14 +275,21 @@ class ElevenLabsProvider(TTSProvider):
 # ---------------------------------------------------------------------------
 
 
-class OpenAITTSProvider(TTSProvider):
+class OpenAITTSProvider(_HTTPTTSProvider):
     """Calls the OpenAI TTS API."""
 
     OPENAI_TTS_URL = "https://api.openai.com/v1/audio/speech"
 
+    __slots__ = ("_api_key", "_voice", "_model")
+
     def __init__(
-        self, api_key: str, voice: str = "alloy", model: str = "tts-1"
+        self,
+        api_key: str,
+        voice: str = "alloy",
+        model: str = "tts-1",
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ) -> None:
+        super().__init__(cache_size)
         self._api_key = api_key
         self._voice = voice
         self._model = model
@@ -114,31 +297,34 @@ class OpenAITTSProvider(TTSProvider):
     async def synthesize(
         self, text: str, output_path: str, voice: str | None = None
     ) -> str:
-        import aiohttp
-
         effective_voice = voice or self._voice
+        key = (text, effective_voice, self._model)
+        if await self._replay_cached(key, output_path):
+            return output_path
+
         logger.info("Synthesizing via OpenAI TTS (voice=%s)", effective_voice)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.OPENAI_TTS_URL,
-                headers={
-                    "Authorization": f"Bearer {self._api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self._model,
-                    "input": text,
-                    "voice": effective_voice,
-                },
-            ) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    msg = f"OpenAI TTS API error ({resp.status}): {body}"
-                    raise RuntimeError(msg)
-                audio_bytes = await resp.read()
-
-        Path(output_path).write_bytes(audio_bytes)
+        session = self._get_session()
+        async with session.post(
+            self.OPENAI_TTS_URL,
+            headers={
+                "Authorization": f"Bearer {self._api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": self._model,
+                "input": text,
+                "voice": effective_voice,
+                "response_format": "mp3",
+            },
+        ) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                msg = f"OpenAI TTS API error ({resp.status}): {body}"
+                raise RuntimeError(msg)
+            await self._stream_to_file(resp, output_path)
+
+        self._remember(key, output_path)
         return output_path
 
 
@@ -147,31 +333,62 @@ class OpenAITTSProvider(TTSProvider):
 # ---------------------------------------------------------------------------
 
 
+TTSFactory = Callable[[dict[str, Any]], TTSProvider]
+
+
+def _edge_tts_factory(config: dict[str, Any]) -> TTSProvider:
+    return EdgeTTSProvider(
+        voice=config.get("voice", "en-US-AriaNeural"),
+        max_concurrency=int(config.get("max_concurrency", DEFAULT_CONCURRENCY)),
+    )
+
+
+def _elevenlabs_factory(config: dict[str, Any]) -> TTSProvider:
+    return ElevenLabsProvider(
+        api_key=config.get("api_key", ""),
+        voice_id=config.get("voice", "21m00Tcm4TlvDq8ikWAM"),
+        cache_size=int(config.get("cache_size", DEFAULT_CACHE_SIZE)),
+    )
+
+
+def _openai_tts_factory(config: dict[str, Any]) -> TTSProvider:
+    return OpenAITTSProvider(
+        api_key=config.get("api_key", ""),
+        voice=config.get("voice", "alloy"),
+        model=config.get("model", "tts-1"),
+        cache_size=int(config.get("cache_size", DEFAULT_CACHE_SIZE)),
+    )
+
+
+# Provider name -> factory.  Extend via register_tts_provider().
+TTS_PROVIDERS: dict[str, TTSFactory] = {
+    "edge-tts": _edge_tts_factory,
+    "elevenlabs": _elevenlabs_factory,
+    "openai-tts": _openai_tts_factory,
+}
+
+
+def register_tts_provider(name: str, factory: TTSFactory) -> None:
+    """Register (or replace) a TTS provider factory under *name*."""
+    TTS_PROVIDERS[name] = factory
+
+
 def create_tts_provider(config: dict[str, Any]) -> TTSProvider:
     """Create a TTS provider from config.
 
     Config keys:
-        provider: "edge-tts" (default), "elevenlabs", or "openai-tts"
+        provider: "edge-tts" (default), "elevenlabs", "openai-tts", or any
+                  name added with :func:`register_tts_provider`
         api_key:  Required for elevenlabs and openai-tts
         voice:    Voice name/ID (provider-specific defaults)
         model:    Model name (openai-tts only, default: "tts-1")
+        max_concurrency: Parallel edge-tts sessions for batch synthesis
+                  (edge-tts only, default: 8)
+        cache_size: Outputs remembered for replay (API providers, default: 32)
     """
     provider_name = config.get("provider", "edge-tts")
-
-    if provider_name == "edge-tts":
-        voice = config.get("voice", "en-US-AriaNeural")
-        return EdgeTTSProvider(voice=voice)
-
-    if provider_name == "elevenlabs":
-        api_key = config.get("api_key", "")
-        voice_id = config.get("voice", "21m00Tcm4TlvDq8ikWAM")
-        return ElevenLabsProvider(api_key=api_key, voice_id=voice_id)
-
-    if provider_name == "openai-tts":
-        api_key = config.get("api_key", "")
-        voice = config.get("voice", "alloy")
-        model = config.get("model", "tts-1")
-        return OpenAITTSProvider(api_key=api_key, voice=voice, model=model)
-
-    msg = f"Unknown TTS provider: '{provider_name}'"
-    raise ValueError(msg)
+    factory = TTS_PROVIDERS.get(provider_name)
+    if factory is None:
+        msg = f"Unknown TTS provider: '{provider_name}'"
+        raise ValueError(msg)
+    return factory(config)
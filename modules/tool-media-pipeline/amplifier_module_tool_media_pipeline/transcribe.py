@@ -1,16 +1,63 @@
-"""Transcription provider abstraction — Whisper API and local CLI."""
+"""Transcription provider abstraction — Whisper API and local Whisper."""
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import Any
 
+from .cache import DEFAULT_CACHE_SIZE, LRUCache, file_digest
+from .chunking import transcribe_chunked
+from .concurrency import DEFAULT_CONCURRENCY, gather_bounded
+from .pipeline import transcribe_pipelined
+from .session import new_client_session
+
 logger = logging.getLogger(__name__)
 
+try:
+    import faster_whisper as _faster_whisper
+except ImportError:  # pragma: no cover
+    _faster_whisper = None  # type: ignore[assignment]
+
+try:
+    import whisper as _openai_whisper
+except ImportError:  # pragma: no cover
+    _openai_whisper = None  # type: ignore[assignment]
+
 WHISPER_API_URL = "https://api.openai.com/v1/audio/transcriptions"
+# Concurrent Whisper API uploads per provider.
+DEFAULT_MAX_IN_FLIGHT = 4
+
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def _file_chunks(
+    path: Path, chunk_size: int = _UPLOAD_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Yield the bytes of *path* in chunks, reading off the event loop."""
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+    finally:
+        f.close()
+
+
+async def _transcript_key(
+    cache: LRUCache[tuple[str, str], str], audio_path: str, model: str
+) -> tuple[str, str] | None:
+    """``(sha256 of audio, model)`` cache key, or None if *cache* is disabled.
+
+    Skipping the key skips hashing the whole file, which for long recordings
+    is a full extra read.
+    """
+    if not cache.enabled:
+        return None
+    return (await file_digest(audio_path), model)
 
 
 # ---------------------------------------------------------------------------
@@ -21,10 +68,30 @@ WHISPER_API_URL = "https://api.openai.com/v1/audio/transcriptions"
 class TranscriptionProvider(ABC):
     """Abstract base for audio-to-text transcription."""
 
+    # Subclasses declare their own __slots__ so instances carry no __dict__.
+    __slots__ = ()
+
     @abstractmethod
     async def transcribe(self, audio_path: str) -> str:
         """Transcribe audio file at *audio_path* and return text."""
 
+    async def transcribe_many(
+        self,
+        audio_paths: list[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[str]:
+        """Transcribe several files, returning texts in input order.
+
+        The default implementation fans out :meth:`transcribe` calls with
+        at most *concurrency* in flight; providers with a native batch
+        path override this.
+        """
+        return await gather_bounded(self.transcribe, audio_paths, concurrency)
+
+    async def close(self) -> None:  # noqa: B027
+        """Release any resources held by the provider (no-op by default)."""
+
 
 # ---------------------------------------------------------------------------
 # OpenAI Whisper API
@@ -34,37 +101,110 @@ class TranscriptionProvider(ABC):
 class WhisperAPIProvider(TranscriptionProvider):
     """Calls the OpenAI Whisper API for transcription."""
 
-    def __init__(self, api_key: str, model: str = "whisper-1") -> None:
+    __slots__ = (
+        "_api_key",
+        "_model",
+        "_chunk_sec",
+        "_language",
+        "_http_session",
+        "_upload_slots",
+        "_cache",
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "whisper-1",
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        chunk_sec: float = 0.0,
+        language: str | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
         self._api_key = api_key
         self._model = model
+        self._chunk_sec = chunk_sec
+        # ISO-639-1 hint sent with every request; skips server-side detection.
+        self._language = language
+        self._http_session: Any = None
+        # Caps concurrent uploads across chunks and batch calls so fan-out
+        # stays under the API's rate limits.
+        self._upload_slots = asyncio.Semaphore(max(1, max_in_flight))
+        # (sha256 of audio, model) -> transcript
+        self._cache: LRUCache[tuple[str, str], str] = LRUCache(cache_size)
+
+    def _get_session(self) -> Any:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = new_client_session()
+        return self._http_session
 
     async def transcribe(self, audio_path: str) -> str:
+        key = await _transcript_key(self._cache, audio_path, self._model)
+        if key is not None and (cached := self._cache.get(key)) is not None:
+            logger.info("Transcript cache hit: %s", Path(audio_path).name)
+            return cached
+
+        text = None
+        if self._chunk_sec > 0:
+            text = await transcribe_chunked(
+                audio_path,
+                self._transcribe_file,
+                target_sec=self._chunk_sec,
+                language=self._language,
+                # The API response carries no language for us to reuse
+                detect_language=False,
+            )
+        if text is None:
+            text, _ = await self._transcribe_file(audio_path, self._language)
+        if key is not None:
+            self._cache.put(key, text)
+        return text
+
+    async def _transcribe_file(
+        self, audio_path: str, language: str | None = None
+    ) -> tuple[str, str | None]:
+        """Upload one file to the Whisper API; return ``(text, language)``."""
         import aiohttp
 
         path = Path(audio_path)
         logger.info("Transcribing via Whisper API: %s", path.name)
 
-        async with aiohttp.ClientSession() as session:
-            data = aiohttp.FormData()
-            data.add_field(
-                "file",
-                open(path, "rb"),  # noqa: SIM115
-                filename=path.name,
-                content_type="application/octet-stream",
-            )
-            data.add_field("model", self._model)
-
-            async with session.post(
+        session = self._get_session()
+        # Stream the audio as an async multipart part so large files never
+        # block the loop or sit whole in memory.
+        data = aiohttp.MultipartWriter("form-data")
+        file_part = data.append(
+            _file_chunks(path), {"Content-Type": "application/octet-stream"}
+        )
+        file_part.set_content_disposition("form-data", name="file", filename=path.name)
+        model_part = data.append(self._model)
+        model_part.set_content_disposition("form-data", name="model")
+        if language:
+            language_part = data.append(language)
+            language_part.set_content_disposition("form-data", name="language")
+
+        # Chunked transfer-encoding: the body goes out as it is read, so the
+        # request is admitted while the file is still uploading.
+        async with (
+            self._upload_slots,
+            session.post(
                 WHISPER_API_URL,
                 headers={"Authorization": f"Bearer {self._api_key}"},
                 data=data,
-            ) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    msg = f"Whisper API error ({resp.status}): {body}"
-                    raise RuntimeError(msg)
-                result = await resp.json()
-                return result["text"]
+                chunked=True,
+            ) as resp,
+        ):
+            if resp.status != 200:
+                body = await resp.text()
+                msg = f"Whisper API error ({resp.status}): {body}"
+                raise RuntimeError(msg)
+            result = await resp.json()
+            return result["text"], language
+
+    async def close(self) -> None:
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
 
 
 # ---------------------------------------------------------------------------
@@ -72,15 +212,227 @@ class WhisperAPIProvider(TranscriptionProvider):
 # ---------------------------------------------------------------------------
 
 
+def _cuda_available() -> bool:
+    """Whether CTranslate2 can see a CUDA device."""
+    try:
+        import ctranslate2
+    except ImportError:
+        return False
+    return ctranslate2.get_cuda_device_count() > 0
+
+
 class LocalWhisperProvider(TranscriptionProvider):
-    """Shells out to the local ``whisper`` CLI for transcription."""
+    """Local Whisper transcription with a resident in-process model.
+
+    Backends, in order of preference:
+
+    1. ``faster-whisper`` — int8-quantized CTranslate2 model (``int8`` on
+       CPU, ``int8_float16`` on CUDA); :meth:`transcribe_many` runs files
+       through ``BatchedInferencePipeline``.
+    2. ``openai-whisper`` — ``whisper.load_model`` kept in memory.
+    3. The ``whisper`` CLI, when neither package is installed.
+
+    In-process models are loaded once (guarded by an ``asyncio.Lock`` so
+    concurrent first calls don't race) and inference runs in
+    ``asyncio.to_thread``.  With faster-whisper, ``num_workers`` > 1 lets
+    that many transcribes run on the device at once (CTranslate2
+    ``inter_threads``), bounded by a matching semaphore.
+    """
 
-    def __init__(self, model: str = "base") -> None:
+    __slots__ = (
+        "_model",
+        "_language",
+        "_chunk_sec",
+        "_num_workers",
+        "_infer_slots",
+        "_stream_decode",
+        "_batch_size",
+        "_device",
+        "_compute_type",
+        "_whisper_model",
+        "_fp16",
+        "_model_lock",
+        "_infer_lock",
+        "_cache",
+    )
+
+    def __init__(
+        self,
+        model: str = "base",
+        batch_size: int = 16,
+        device: str = "auto",
+        compute_type: str | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        chunk_sec: float = 0.0,
+        stream_decode: bool = False,
+        num_workers: int = 1,
+        language: str | None = None,
+    ) -> None:
         self._model = model
+        self._language = language
+        self._chunk_sec = chunk_sec
+        self._num_workers = max(1, num_workers)
+        # One slot per CTranslate2 worker: concurrent transcribes overlap on
+        # the device up to num_workers and queue here beyond that.
+        self._infer_slots = asyncio.Semaphore(self._num_workers)
+        self._stream_decode = stream_decode
+        self._batch_size = batch_size
+        self._device = device
+        self._compute_type = compute_type
+        self._whisper_model: Any = None
+        self._fp16 = False
+        self._model_lock = asyncio.Lock()
+        # openai-whisper installs per-call hooks on the model; serialize it.
+        self._infer_lock = threading.Lock()
+        # (sha256 of audio, model) -> transcript
+        self._cache: LRUCache[tuple[str, str], str] = LRUCache(cache_size)
+
+    @staticmethod
+    def _backend() -> str:
+        if _faster_whisper is not None:
+            return "faster-whisper"
+        if _openai_whisper is not None:
+            return "openai-whisper"
+        return "cli"
+
+    def _load_model(self) -> Any:
+        """Blocking model load for the active in-process backend."""
+        if _faster_whisper is not None:
+            device = self._device
+            if device == "auto":
+                device = "cuda" if _cuda_available() else "cpu"
+            compute_type = self._compute_type or (
+                "int8_float16" if device == "cuda" else "int8"
+            )
+            logger.info(
+                "Loading faster-whisper model: %s (device=%s, compute_type=%s)",
+                self._model,
+                device,
+                compute_type,
+            )
+            return _faster_whisper.WhisperModel(
+                self._model,
+                device=device,
+                compute_type=compute_type,
+                num_workers=self._num_workers,
+            )
+
+        import torch
+
+        self._fp16 = torch.cuda.is_available()
+        device = None if self._device == "auto" else self._device
+        logger.info("Loading openai-whisper model: %s", self._model)
+        return _openai_whisper.load_model(self._model, device=device)
+
+    async def _ensure_model(self) -> Any:
+        """Load the model on first use (once, off-loop) and keep it resident."""
+        if self._whisper_model is None:
+            async with self._model_lock:
+                if self._whisper_model is None:
+                    self._whisper_model = await asyncio.to_thread(self._load_model)
+        return self._whisper_model
+
+    def _transcribe_in_process(
+        self, audio: Any, language: str | None = None
+    ) -> tuple[str, str | None]:
+        """Blocking inference on a path or 16 kHz float32 waveform (run off-loop).
+
+        Returns ``(text, language)``; passing a known *language* skips the
+        model's detection pass over the first 30 s of log-mel features.
+        """
+        if _faster_whisper is not None:
+            segments, info = self._whisper_model.transcribe(audio, language=language)
+            text = "".join(seg.text for seg in segments).strip()
+            return text, getattr(info, "language", None) or language
+        with self._infer_lock:
+            result = self._whisper_model.transcribe(
+                audio, fp16=self._fp16, language=language
+            )
+        return result["text"].strip(), result.get("language") or language
+
+    def _transcribe_batched(self, audio_paths: list[str]) -> list[str]:
+        """Blocking batched inference over *audio_paths* (run off-loop)."""
+        pipeline = _faster_whisper.BatchedInferencePipeline(model=self._whisper_model)
+        texts: list[str] = []
+        for path in audio_paths:
+            segments, _info = pipeline.transcribe(
+                path, batch_size=self._batch_size, language=self._language
+            )
+            texts.append("".join(seg.text for seg in segments).strip())
+        return texts
+
+    async def transcribe_many(
+        self,
+        audio_paths: list[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[str]:
+        if _faster_whisper is None or not audio_paths:
+            return await super().transcribe_many(audio_paths, concurrency=concurrency)
+
+        keys = [
+            await _transcript_key(self._cache, p, self._model) for p in audio_paths
+        ]
+        texts = [None if key is None else self._cache.get(key) for key in keys]
+        misses = [i for i, text in enumerate(texts) if text is None]
+        if misses:
+            logger.info("Batch-transcribing %d files via faster-whisper", len(misses))
+            await self._ensure_model()
+            async with self._infer_slots:
+                fresh = await asyncio.to_thread(
+                    self._transcribe_batched, [audio_paths[i] for i in misses]
+                )
+            for i, text in zip(misses, fresh, strict=True):
+                texts[i] = text
+                if (key := keys[i]) is not None:
+                    self._cache.put(key, text)
+        return texts  # type: ignore[return-value]
 
     async def transcribe(self, audio_path: str) -> str:
+        key = await _transcript_key(self._cache, audio_path, self._model)
+        if key is not None and (cached := self._cache.get(key)) is not None:
+            logger.info("Transcript cache hit: %s", Path(audio_path).name)
+            return cached
+
+        text = None
+        if self._stream_decode and self._backend() != "cli":
+            logger.info("Pipelined local transcription: %s", Path(audio_path).name)
+            await self._ensure_model()
+            text = await transcribe_pipelined(
+                audio_path,
+                self._transcribe_in_process,
+                language=self._language,
+                slots=self._infer_slots,
+            )
+        elif self._chunk_sec > 0:
+            text = await transcribe_chunked(
+                audio_path,
+                self._transcribe_uncached,
+                target_sec=self._chunk_sec,
+                language=self._language,
+                # Only the in-process backends report a detected language
+                detect_language=self._backend() != "cli",
+            )
+        if text is None:
+            text, _ = await self._transcribe_uncached(audio_path, self._language)
+        if key is not None:
+            self._cache.put(key, text)
+        return text
+
+    async def _transcribe_uncached(
+        self, audio_path: str, language: str | None = None
+    ) -> tuple[str, str | None]:
         logger.info("Transcribing via local whisper: %s", Path(audio_path).name)
 
+        if self._backend() != "cli":
+            await self._ensure_model()
+            async with self._infer_slots:
+                return await asyncio.to_thread(
+                    self._transcribe_in_process, audio_path, language
+                )
+
+        language_args = ["--language", language] if language else []
+
         proc = await asyncio.create_subprocess_exec(
             "whisper",
             audio_path,
@@ -90,6 +442,7 @@ class LocalWhisperProvider(TranscriptionProvider):
             "txt",
             "--output_dir",
             str(Path(audio_path).parent),
+            *language_args,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -102,10 +455,10 @@ class LocalWhisperProvider(TranscriptionProvider):
         # whisper CLI writes a .txt file next to the audio; read it if present
         txt_path = Path(audio_path).with_suffix(".txt")
         if txt_path.exists():
-            return txt_path.read_text(encoding="utf-8").strip()
+            return txt_path.read_text(encoding="utf-8").strip(), language
 
         # Fallback: return stdout
-        return stdout.decode("utf-8").strip()
+        return stdout.decode("utf-8").strip(), language
 
 
 # ---------------------------------------------------------------------------
@@ -113,24 +466,76 @@ class LocalWhisperProvider(TranscriptionProvider):
 # ---------------------------------------------------------------------------
 
 
+TranscriptionFactory = Callable[[dict[str, Any]], TranscriptionProvider]
+
+
+def _whisper_api_factory(config: dict[str, Any]) -> TranscriptionProvider:
+    return WhisperAPIProvider(
+        api_key=config.get("api_key", ""),
+        model=config.get("model", "whisper-1"),
+        cache_size=int(config.get("cache_size", DEFAULT_CACHE_SIZE)),
+        chunk_sec=float(config.get("chunk_sec", 0.0)),
+        language=config.get("language"),
+        max_in_flight=int(config.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)),
+    )
+
+
+def _local_whisper_factory(config: dict[str, Any]) -> TranscriptionProvider:
+    return LocalWhisperProvider(
+        model=config.get("model", "base"),
+        batch_size=int(config.get("batch_size", 16)),
+        device=config.get("device", "auto"),
+        compute_type=config.get("compute_type"),
+        cache_size=int(config.get("cache_size", DEFAULT_CACHE_SIZE)),
+        chunk_sec=float(config.get("chunk_sec", 0.0)),
+        stream_decode=bool(config.get("stream_decode", False)),
+        num_workers=int(config.get("num_workers", 1)),
+        language=config.get("language"),
+    )
+
+
+# Provider name -> factory.  Extend via register_transcription_provider().
+TRANSCRIPTION_PROVIDERS: dict[str, TranscriptionFactory] = {
+    "whisper-api": _whisper_api_factory,
+    "local-whisper": _local_whisper_factory,
+}
+
+
+def register_transcription_provider(name: str, factory: TranscriptionFactory) -> None:
+    """Register (or replace) a transcription provider factory under *name*."""
+    TRANSCRIPTION_PROVIDERS[name] = factory
+
+
 def create_transcription_provider(config: dict[str, Any]) -> TranscriptionProvider:
     """Create a transcription provider from config.
 
     Config keys:
-        provider: "whisper-api" (default) or "local-whisper"
+        provider: "whisper-api" (default), "local-whisper", or any name added
+                  with :func:`register_transcription_provider`
         api_key:  Required for whisper-api
         model:    Whisper model name (default: "whisper-1" for API, "base" for local)
+        batch_size: Batched-inference size for local-whisper (default: 16)
+        device:   "auto" (default), "cpu" or "cuda" — local-whisper only
+        compute_type: CTranslate2 compute type for local-whisper
+                  (default: "int8" on CPU, "int8_float16" on CUDA)
+        cache_size: Transcripts kept in the content-hash LRU (default: 32, 0 = off)
+        chunk_sec: Split audio longer than this many seconds at silences and
+                  transcribe the chunks concurrently (default: 0 = off;
+                  requires ffmpeg/ffprobe on PATH)
+        stream_decode: local-whisper only — overlap ffmpeg decode, VAD and
+                  inference as concurrent stages (default: false; needs
+                  faster-whisper or openai-whisper, and ffmpeg)
+        num_workers: local-whisper only — concurrent faster-whisper inferences
+                  sharing one model (default: 1); size to GPU memory
+        max_in_flight: whisper-api only — concurrent uploads allowed per
+                  provider (default: 4)
+        language: ISO-639-1 code (e.g. "en") to skip language detection;
+                  when unset, chunked/streamed runs detect it on the first
+                  chunk and reuse it for the rest
     """
     provider_name = config.get("provider", "whisper-api")
-
-    if provider_name == "whisper-api":
-        api_key = config.get("api_key", "")
-        model = config.get("model", "whisper-1")
-        return WhisperAPIProvider(api_key=api_key, model=model)
-
-    if provider_name == "local-whisper":
-        model = config.get("model", "base")
-        return LocalWhisperProvider(model=model)
-
-    msg = f"Unknown transcription provider: '{provider_name}'"
-    raise ValueError(msg)
+    factory = TRANSCRIPTION_PROVIDERS.get(provider_name)
+    if factory is None:
+        msg = f"Unknown transcription provider: '{provider_name}'"
+        raise ValueError(msg)
+    return factory(config)
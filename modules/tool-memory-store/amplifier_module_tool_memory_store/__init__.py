@@ -8,7 +8,8 @@ capability so hooks-memory-inject auto-discovers it.
 
 Hardening features:
 
-* **Deduplication** — content-hash check before insert to prevent duplicates.
+* **Deduplication** — content-hash check before insert to prevent duplicates,
+  gated by an in-memory Bloom filter so new content skips the lookup.
 * **TTL / expiry** — optional ``expires_at`` column; expired memories are
   excluded from search and periodically purged by ``purge_expired()``.
 * **Fact store** — subject/predicate/object triples with confidence scoring.
@@ -20,14 +21,25 @@ Hardening features:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
+import heapq
 import json
 import logging
+import math
+import queue
+import re
 import sqlite3
 import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Sequence
 
@@ -117,6 +129,15 @@ _DEFAULT_SENSITIVITY = "public"
 
 STOPWORDS: frozenset = _STOPWORDS  # Public alias for consumers
 
+# Keyword tokens: runs of 3+ word characters (Unicode-aware), so punctuation
+# is dropped by the C regex engine instead of per-word str.strip().
+_WORD_RE = re.compile(r"\w{3,}")
+
+# Literal queries answered by search_literal() without ranking:
+# ``id:<memory id>`` and ``#<tag>``.
+_LITERAL_ID_RE = re.compile(r"id:([0-9a-f]+)")
+_LITERAL_TAG_RE = re.compile(r"#([\w-]+)")
+
 # ---------------------------------------------------------------------------
 # Scoring helpers (mirrors hooks-memory-inject logic)
 # ---------------------------------------------------------------------------
@@ -151,23 +172,54 @@ def _parse_dt(value: Any) -> datetime | None:
     return None
 
 
+@functools.lru_cache(maxsize=64)
+def _update_sql(assignments: tuple[str, ...]) -> str:
+    """``UPDATE`` statement for one set of ``column = ?`` assignments.
+
+    Memoized so repeat field combinations reuse the same string, which is
+    also the sqlite3 statement-cache key.
+    """
+    return f"UPDATE memories SET {', '.join(assignments)} WHERE id = ?"  # noqa: S608
+
+
+@functools.lru_cache(maxsize=8)
+def _decay_rate(half_life_days: float) -> float:
+    """Per-day decay constant: ``exp(-k * age)`` == ``0.5 ** (age / half_life)``."""
+    return math.log(2) / half_life_days
+
+
 def _recency_score(updated_at: Any, half_life_days: float) -> float:
-    """Exponential decay score based on age."""
-    dt = _parse_dt(updated_at)
-    if dt is None:
-        return 0.2
-    now = datetime.now(tz=timezone.utc)
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    age_days = max(0.0, (now - dt).total_seconds() / 86400)
-    return 0.5 ** (age_days / half_life_days)
+    """Exponential decay score based on age.
+
+    *updated_at* may be a Unix timestamp, which skips datetime parsing.
+    """
+    if isinstance(updated_at, (int, float)):
+        timestamp = float(updated_at)
+    else:
+        dt = _parse_dt(updated_at)
+        if dt is None:
+            return 0.2
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        timestamp = dt.timestamp()
+    age_days = max(0.0, (time.time() - timestamp) / 86400)
+    return math.exp(-_decay_rate(half_life_days) * age_days)
 
 
 def _compute_score(
-    item: dict[str, Any], *, match_score: float, cfg: _ScoringConfig
+    item: dict[str, Any],
+    *,
+    match_score: float,
+    cfg: _ScoringConfig,
+    updated_epoch: int | None = None,
 ) -> float:
-    """Weighted sum of match + recency + importance + trust."""
-    recency = _recency_score(item.get("updated_at"), cfg.half_life_days)
+    """Weighted sum of match + recency + importance + trust.
+
+    *updated_epoch* (the row's generated ``updated_epoch`` column, read
+    alongside it) is used in preference to parsing ``updated_at``.
+    """
+    updated = updated_epoch if updated_epoch is not None else item.get("updated_at")
+    recency = _recency_score(updated, cfg.half_life_days)
     importance = float(item.get("importance", 0.5))
     trust = float(item.get("trust", _DEFAULT_TRUST))
     return (
@@ -180,16 +232,40 @@ def _compute_score(
 
 def _extract_keywords(text: str, max_keywords: int = 8) -> list[str]:
     """Extract top keywords from text, filtering stopwords and short tokens."""
-    words = text.lower().split()
-    keywords = [w.strip(".,!?;:'\"()[]{}") for w in words]
-    keywords = [w for w in keywords if len(w) > 2 and w not in _STOPWORDS]
-    seen: set[str] = set()
-    unique: list[str] = []
-    for kw in keywords:
-        if kw not in seen:
-            seen.add(kw)
-            unique.append(kw)
-    return unique[:max_keywords]
+    return list(_cached_keywords(text, max_keywords))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_keywords(text: str, max_keywords: int) -> tuple[str, ...]:
+    """Memoized body of :func:`_extract_keywords`.
+
+    The same prompt is often tokenized several times per turn (inject hook,
+    search, search_ids); a tuple keeps cached results immutable.
+    """
+    tokens = _WORD_RE.findall(text.lower())
+    unique = dict.fromkeys(t for t in tokens if t not in _STOPWORDS)
+    return tuple(unique)[:max_keywords]
+
+
+def _fts_query(keywords: list[str]) -> str:
+    """OR together *keywords* as quoted FTS5 prefix queries.
+
+    Quoting hands each keyword to the FTS5 tokenizer verbatim, so operator
+    characters and bareword keywords (``c++``, ``NOT``, ``foo-bar``) can't
+    raise a MATCH syntax error and knock the search onto the LIKE fallback.
+    The trailing ``*`` lets "deploy" find "deployment" (there is no stemmer).
+    """
+    return " OR ".join('"' + kw.replace('"', '""') + '"*' for kw in keywords)
+
+
+def _allowed_sensitivities(*, allow_private: bool, allow_secret: bool) -> list[str]:
+    """Sensitivity levels that pass :func:`_allow_by_sensitivity`."""
+    allowed = ["public"]
+    if allow_private:
+        allowed.append("private")
+    if allow_secret:
+        allowed.append("secret")
+    return allowed
 
 
 def _allow_by_sensitivity(
@@ -232,21 +308,52 @@ CREATE TABLE IF NOT EXISTS memories (
     session_id TEXT DEFAULT NULL,
     project TEXT DEFAULT NULL,
     accessed_count INTEGER DEFAULT 0,
-    discovery_tokens INTEGER DEFAULT 0
+    discovery_tokens INTEGER DEFAULT 0,
+    updated_epoch INTEGER GENERATED ALWAYS AS (
+        CAST(strftime('%s', updated_at) AS INTEGER)
+    ) VIRTUAL,
+    expires_epoch INTEGER GENERATED ALWAYS AS (
+        CAST(strftime('%s', expires_at) AS INTEGER)
+    ) VIRTUAL
 );
 
 CREATE INDEX IF NOT EXISTS idx_memories_content_hash ON memories(content_hash);
-CREATE INDEX IF NOT EXISTS idx_memories_expires_at ON memories(expires_at);
-CREATE INDEX IF NOT EXISTS idx_memories_type ON memories(type);
-CREATE INDEX IF NOT EXISTS idx_memories_session_id ON memories(session_id);
-CREATE INDEX IF NOT EXISTS idx_memories_project ON memories(project);
-CREATE INDEX IF NOT EXISTS idx_memories_accessed ON memories(accessed_count);
+CREATE INDEX IF NOT EXISTS idx_memories_updated ON memories(updated_at, id);
 
 CREATE TABLE IF NOT EXISTS schema_meta (
     key TEXT PRIMARY KEY,
     value TEXT NOT NULL
 );
 
+-- Row counts kept by trigger so count() is a single-row lookup
+CREATE TABLE IF NOT EXISTS memory_stats (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS memories_count_ai AFTER INSERT ON memories BEGIN
+    UPDATE memory_stats SET value = value + 1 WHERE key = 'total';
+END;
+CREATE TRIGGER IF NOT EXISTS memories_count_ad AFTER DELETE ON memories BEGIN
+    UPDATE memory_stats SET value = value - 1 WHERE key = 'total';
+END;
+
+-- File paths and concepts shredded out of the JSON list columns (kept in
+-- sync by the _LINK_TRIGGERS_SQL triggers) so lookups are index seeks.
+CREATE TABLE IF NOT EXISTS memory_files (
+    file_path TEXT NOT NULL COLLATE NOCASE,
+    role TEXT NOT NULL CHECK (role IN ('read', 'modified')),
+    memory_id TEXT NOT NULL,
+    PRIMARY KEY (file_path, role, memory_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_memory_files_memory ON memory_files(memory_id);
+CREATE TABLE IF NOT EXISTS memory_concepts (
+    concept TEXT NOT NULL COLLATE NOCASE,
+    memory_id TEXT NOT NULL,
+    PRIMARY KEY (concept, memory_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_memory_concepts_memory
+    ON memory_concepts(memory_id);
+
 CREATE TABLE IF NOT EXISTS facts (
     id TEXT PRIMARY KEY,
     subject TEXT NOT NULL,
@@ -258,8 +365,12 @@ CREATE TABLE IF NOT EXISTS facts (
     updated_at TEXT NOT NULL,
     FOREIGN KEY (source_entry_id) REFERENCES memories(id) ON DELETE SET NULL
 );
-CREATE INDEX IF NOT EXISTS idx_facts_subject ON facts(subject);
-CREATE INDEX IF NOT EXISTS idx_facts_predicate ON facts(predicate);
+-- With the unique (subject, predicate, object) index these cover every
+-- bound/unbound combination of a query_facts() pattern.
+CREATE INDEX IF NOT EXISTS idx_facts_pos ON facts(predicate, object, subject);
+CREATE INDEX IF NOT EXISTS idx_facts_osp ON facts(object, subject, predicate);
+-- Unfiltered query_facts() reads newest-first straight off this index
+CREATE INDEX IF NOT EXISTS idx_facts_updated ON facts(updated_at);
 
 CREATE TABLE IF NOT EXISTS memory_journal (
     seq INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -269,7 +380,6 @@ CREATE TABLE IF NOT EXISTS memory_journal (
     detail TEXT DEFAULT ''
 );
 CREATE INDEX IF NOT EXISTS idx_journal_memory_id ON memory_journal(memory_id);
-CREATE INDEX IF NOT EXISTS idx_journal_timestamp ON memory_journal(timestamp);
 """
 
 # Migration: add columns if upgrading from older schema
@@ -286,10 +396,259 @@ _MIGRATIONS_SQL = [
     "ALTER TABLE memories ADD COLUMN project TEXT DEFAULT NULL",
     "ALTER TABLE memories ADD COLUMN accessed_count INTEGER DEFAULT 0",
     "ALTER TABLE memories ADD COLUMN discovery_tokens INTEGER DEFAULT 0",
+    # Unix-epoch views of the ISO timestamps: numeric compares and recency
+    # math without parsing, always consistent with the TEXT columns.
+    "ALTER TABLE memories ADD COLUMN updated_epoch INTEGER GENERATED ALWAYS AS "
+    "(CAST(strftime('%s', updated_at) AS INTEGER)) VIRTUAL",
+    "ALTER TABLE memories ADD COLUMN expires_epoch INTEGER GENERATED ALWAYS AS "
+    "(CAST(strftime('%s', expires_at) AS INTEGER)) VIRTUAL",
+]
+
+# Index changes that depend on migrated columns or existing data
+_POST_MIGRATION_SQL = [
+    "DROP INDEX IF EXISTS idx_memories_expires_at",
+    "DROP INDEX IF EXISTS idx_memories_expires_epoch",
+    # Partial: only TTL'd rows are indexed, so purges touch nothing else
+    "CREATE INDEX IF NOT EXISTS idx_memories_ttl "
+    "ON memories(expires_epoch) WHERE expires_epoch IS NOT NULL",
+    # Timeline filters, each ending in created_at so get_timeline() reads
+    # rows in ORDER BY order and stops at its LIMIT instead of sorting.
+    # session_id / project are NULL for most memories; equality filters
+    # imply IS NOT NULL, so their indexes can be partial.
+    "DROP INDEX IF EXISTS idx_memories_session_id",
+    "DROP INDEX IF EXISTS idx_memories_project",
+    "DROP INDEX IF EXISTS idx_memories_by_session",
+    "DROP INDEX IF EXISTS idx_memories_by_project",
+    "DROP INDEX IF EXISTS idx_memories_type",
+    "CREATE INDEX IF NOT EXISTS idx_memories_created ON memories(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_memories_type_created "
+    "ON memories(type, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_memories_session_created "
+    "ON memories(session_id, created_at) WHERE session_id IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_memories_project_created "
+    "ON memories(project, created_at) WHERE project IS NOT NULL",
+    # Eviction order, so _enforce_limit() streams its victims without a sort
+    "DROP INDEX IF EXISTS idx_memories_accessed",
+    "CREATE INDEX IF NOT EXISTS idx_memories_evict "
+    "ON memories(accessed_count, updated_at, importance)",
+    # Fact triples are unique; keep the first copy of any pre-index duplicates.
+    "DELETE FROM facts WHERE rowid NOT IN "
+    "(SELECT MIN(rowid) FROM facts GROUP BY subject, predicate, object)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_facts_spo "
+    "ON facts(subject, predicate, object)",
+    # Subject lookups are served by the unique index's leading column.
+    "DROP INDEX IF EXISTS idx_facts_subject",
+    # Predicate lookups are served by idx_facts_pos.
+    "DROP INDEX IF EXISTS idx_facts_predicate",
+    # Nothing reads the journal by timestamp (``seq`` already orders it).
+    "DROP INDEX IF EXISTS idx_journal_timestamp",
+    # Seed the trigger-maintained row count (a no-op once it exists)
+    "INSERT OR IGNORE INTO memory_stats (key, value) "
+    "SELECT 'total', COUNT(*) FROM memories",
+]
+
+# JSON list column -> (link table columns, role literal) it is shredded into
+_LINK_COLUMNS = {
+    "files_read": ("memory_files (file_path, role, memory_id)", "'read', "),
+    "files_modified": ("memory_files (file_path, role, memory_id)", "'modified', "),
+    "concepts": ("memory_concepts (concept, memory_id)", ""),
+}
+
+
+def _link_insert_sql(column: str, row: str = "new") -> str:
+    """``INSERT`` copying the strings in *row*.*column* into its link table.
+
+    *row* is ``new`` inside a trigger; any other name scans ``memories``
+    under that alias (the one-time backfill).  Malformed JSON links nothing.
+    """
+    target, role = _LINK_COLUMNS[column]
+    source = "" if row == "new" else f"memories AS {row}, "
+    value = f"{row}.{column}"
+    return (
+        f"INSERT OR IGNORE INTO {target} SELECT j.value, {role}{row}.id "
+        f"FROM {source}json_each(CASE WHEN json_valid({value}) "
+        f"THEN {value} ELSE '[]' END) AS j WHERE j.type = 'text'"
+    )
+
+
+_LINK_TRIGGERS_SQL = [
+    "CREATE TRIGGER IF NOT EXISTS memories_links_ai AFTER INSERT ON memories "
+    f"BEGIN {'; '.join(map(_link_insert_sql, _LINK_COLUMNS))}; END",
+    "CREATE TRIGGER IF NOT EXISTS memories_links_ad AFTER DELETE ON memories "
+    "BEGIN DELETE FROM memory_files WHERE memory_id = old.id; "
+    "DELETE FROM memory_concepts WHERE memory_id = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS memories_files_au "
+    "AFTER UPDATE OF files_read, files_modified ON memories "
+    "WHEN old.files_read IS NOT new.files_read "
+    "OR old.files_modified IS NOT new.files_modified "
+    "BEGIN DELETE FROM memory_files WHERE memory_id = old.id; "
+    f"{_link_insert_sql('files_read')}; {_link_insert_sql('files_modified')}; END",
+    "CREATE TRIGGER IF NOT EXISTS memories_concepts_au "
+    "AFTER UPDATE OF concepts ON memories "
+    "WHEN old.concepts IS NOT new.concepts "
+    "BEGIN DELETE FROM memory_concepts WHERE memory_id = old.id; "
+    f"{_link_insert_sql('concepts')}; END",
 ]
 
-# Current FTS version -- bump when FTS column set changes
-_FTS_VERSION = "2"
+# Digest bytes for content dedup keys (stored hex-encoded)
+_CONTENT_HASH_SIZE = 20
+
+# Hot-path statements shared by store() and the summary writer.  sqlite3
+# caches prepared statements per connection, keyed by SQL text.
+_INSERT_MEMORY_SQL = (
+    "INSERT INTO memories (id, content, content_hash, category, "
+    "importance, trust, sensitivity, tags, created_at, updated_at, "
+    "expires_at, title, subtitle, type, concepts, files_read, "
+    "files_modified, session_id, project, accessed_count, "
+    "discovery_tokens) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_DEDUP_LOOKUP_SQL = "SELECT id FROM memories WHERE content_hash = ?"
+_DEDUP_REFRESH_SQL = "UPDATE memories SET updated_at = ? WHERE id = ?"
+_UPSERT_FACT_SQL = (
+    "INSERT INTO facts (id, subject, predicate, object, "
+    "confidence, source_entry_id, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(subject, predicate, object) DO UPDATE SET "
+    "confidence = excluded.confidence, updated_at = excluded.updated_at"
+)
+
+# Prepared statements kept per connection (sqlite3 default: 128)
+_CACHED_STATEMENTS = 256
+
+_JOURNAL_INSERT_SQL = (
+    "INSERT INTO memory_journal (memory_id, operation, timestamp, detail) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+# Columns of a returned memory record.  Listed explicitly because ``SELECT *``
+# would also return the generated ``updated_epoch`` / ``expires_epoch``.
+_MEMORY_COLUMN_NAMES = (
+    "id", "content", "content_hash", "category", "importance", "trust",
+    "sensitivity", "tags", "created_at", "updated_at", "expires_at", "title",
+    "subtitle", "type", "concepts", "files_read", "files_modified",
+    "session_id", "project", "accessed_count", "discovery_tokens",
+)
+_MEMORY_COLUMNS = ", ".join(_MEMORY_COLUMN_NAMES)
+
+# ``id IN`` list bound as one JSON array: the SQL text is the same for any
+# number of ids, so the prepared statement is reused from sqlite3's cache.
+_JSON_IDS_SQL = "(SELECT value FROM json_each(?))"
+_GET_MANY_SQL = f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id IN {_JSON_IDS_SQL}"
+_DELETE_MANY_SQL = f"DELETE FROM memories WHERE id IN {_JSON_IDS_SQL}"
+_RECORD_ACCESS_SQL = (
+    "UPDATE memories SET accessed_count = accessed_count + 1 "
+    f"WHERE id IN {_JSON_IDS_SQL}"
+)
+
+# UPSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_UPSERT_FACT_RETURNING_SQL = _UPSERT_FACT_SQL + " RETURNING id"
+# Dedup lookup and refresh in one statement
+_DEDUP_REFRESH_RETURNING_SQL = (
+    "UPDATE memories SET updated_at = ? WHERE id = "
+    "(SELECT id FROM memories WHERE content_hash = ? LIMIT 1) RETURNING id"
+)
+
+# Current FTS version -- bump when FTS column set, tokenizer or triggers change
+_FTS_VERSION = "5"
+
+# Re-index only when an indexed column actually changes.  Access counting,
+# importance/trust edits and dedup refreshes update memories constantly and
+# would otherwise each cost an FTS delete + insert.
+_FTS_UPDATE_TRIGGER_SQL = (
+    "CREATE TRIGGER memories_au AFTER UPDATE OF content, title, subtitle "
+    "ON memories WHEN old.content IS NOT new.content "
+    "OR old.title IS NOT new.title OR old.subtitle IS NOT new.subtitle BEGIN "
+    "INSERT INTO memories_fts(memories_fts, rowid, content, title, subtitle) "
+    "VALUES('delete', old.rowid, old.content, old.title, old.subtitle); "
+    "INSERT INTO memories_fts(rowid, content, title, subtitle) "
+    "VALUES (new.rowid, new.content, new.title, new.subtitle); "
+    "END"
+)
+
+# Case-folding, diacritic-insensitive tokenizer ("café" matches "cafe").
+_FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+# Prefix lengths with their own FTS5 index, so the prefix queries built by
+# _fts_query() for short keywords are single index lookups.
+_FTS_PREFIX = "3 4 5"
+
+# Per-connection tuning.  journal_mode=WAL is persistent in the database file
+# and is set once in _init_db; these must be applied on every connection.
+_CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA synchronous=NORMAL",  # WAL-safe; fsync at checkpoint, not per commit
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    # Truncate the WAL back to this size whenever a checkpoint resets it, so
+    # a burst of writes (e.g. a large purge) cannot leave it huge for good.
+    "PRAGMA journal_size_limit=67108864",  # 64 MiB
+)
+
+# Idle read-only connections kept for reuse.
+_DEFAULT_READ_POOL_SIZE = 4
+
+# store() checks for expired rows every this many inserts, and purges them
+# once at least _LAZY_PURGE_MIN_EXPIRED have accrued.  Until then search
+# already hides them.
+_LAZY_PURGE_INTERVAL = 256
+_LAZY_PURGE_MIN_EXPIRED = 64
+
+# purge_expired() deletes in batches of this many rows, committing and
+# releasing the write lock between them, so a mass expiry (and its FTS
+# index deletes) never stalls other writers for long.
+_PURGE_BATCH_SIZE = 1000
+_PURGE_BATCH_SQL = (
+    "DELETE FROM memories WHERE rowid IN "
+    "(SELECT rowid FROM memories WHERE expires_epoch < ? LIMIT ?)"
+)
+
+# Dedup Bloom filter sizing (see _ContentBloom)
+_BLOOM_FP_RATE = 0.01
+_BLOOM_MIN_CAPACITY = 1024
+
+
+class _ContentBloom:
+    """Bloom filter over content-hash digests, gating the dedup lookup.
+
+    ``chash not in bloom`` means the content is definitely new, so
+    :meth:`MemoryStore.store` can skip the ``content_hash`` index probe.
+    Deleted hashes are never removed; they only cause a redundant lookup.
+    Bit positions come from double hashing the digest's two halves.
+    """
+
+    def __init__(self, hashes: Sequence[str]) -> None:
+        self.capacity = max(_BLOOM_MIN_CAPACITY, 2 * len(hashes))
+        self._nbits = math.ceil(
+            -self.capacity * math.log(_BLOOM_FP_RATE) / math.log(2) ** 2
+        )
+        self._nhashes = max(1, round(self._nbits / self.capacity * math.log(2)))
+        self._bits = bytearray((self._nbits + 7) // 8)
+        self.count = 0
+        for chash in hashes:
+            self.add(chash)
+
+    @property
+    def full(self) -> bool:
+        return self.count > self.capacity
+
+    def _positions(self, chash: str) -> Iterator[int]:
+        digest = int(chash, 16)
+        h1 = digest & 0xFFFFFFFFFFFFFFFF
+        h2 = (digest >> 64) | 1
+        return ((h1 + i * h2) % self._nbits for i in range(self._nhashes))
+
+    def add(self, chash: str) -> None:
+        for pos in self._positions(chash):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, chash: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(chash)
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -305,11 +664,34 @@ class MemoryStore:
     can call ``search_v2`` directly.
     """
 
-    def __init__(self, db_path: Path, *, max_memories: int = 0) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_memories: int = 0,
+        read_pool_size: int = _DEFAULT_READ_POOL_SIZE,
+    ) -> None:
         self._db_path = db_path
         self._max_memories = max_memories  # 0 = no limit
         self._write_lock = threading.Lock()
+        # Journal rows for the open write transaction; see ``_commit``.
+        self._journal_buffer: list[tuple[str, str, str, str]] = []
+        # Built lazily by ``_dedup_filter``
+        self._bloom: _ContentBloom | None = None
+        self._bloom_data_version: int | None = None
+        self._inserts_since_purge = 0
+        # Bumped on every write that can change search results; see
+        # ``search_generation``.
+        self._generation = 0
+        self._data_version = 0
         self._init_db()
+        # One long-lived writer (serialized by _write_lock) plus a bounded
+        # pool of idle readers, so calls reuse open files and warm page
+        # caches instead of reconnecting every time.
+        self._rw_conn = self._connect(str(self._db_path))
+        self._ro_pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(
+            maxsize=max(0, read_pool_size)
+        )
 
     # -- init ---------------------------------------------------------------
 
@@ -317,6 +699,11 @@ class MemoryStore:
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         conn = sqlite3.connect(str(self._db_path))
         try:
+            # WAL lets readers proceed while a writer commits and drops the
+            # rollback-journal fsyncs.  Not applicable to in-memory databases.
+            if not str(self._db_path).endswith(":memory:"):
+                conn.execute("PRAGMA journal_mode=WAL")
+            self._configure(conn)
             conn.executescript(_SCHEMA_SQL)
             # Apply column migrations for existing databases
             for sql in _MIGRATIONS_SQL:
@@ -324,6 +711,45 @@ class MemoryStore:
                     conn.execute(sql)
                 except sqlite3.OperationalError:
                     pass  # column already exists
+            for sql in _POST_MIGRATION_SQL:
+                conn.execute(sql)
+            for sql in _LINK_TRIGGERS_SQL:
+                conn.execute(sql)
+            # Databases from before the link tables existed get them filled once
+            if (
+                conn.execute(
+                    "SELECT 1 FROM schema_meta WHERE key = 'links_version'"
+                ).fetchone()
+                is None
+            ):
+                for column in _LINK_COLUMNS:
+                    conn.execute(_link_insert_sql(column, row="m"))
+                conn.execute(
+                    "INSERT INTO schema_meta (key, value) VALUES ('links_version', '1')"
+                )
+            # Rehash rows written under the older SHA-256 (or empty) hash, once:
+            # length() can't use the content_hash index, so this scans the table.
+            if (
+                conn.execute(
+                    "SELECT 1 FROM schema_meta "
+                    "WHERE key = 'content_hash_size' AND value = ?",
+                    (str(_CONTENT_HASH_SIZE),),
+                ).fetchone()
+                is None
+            ):
+                conn.create_function(
+                    "_content_hash", 1, self._content_hash, deterministic=True
+                )
+                conn.execute(
+                    "UPDATE memories SET content_hash = _content_hash(content) "
+                    "WHERE length(content_hash) <> ?",
+                    (_CONTENT_HASH_SIZE * 2,),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO schema_meta (key, value) "
+                    "VALUES ('content_hash_size', ?)",
+                    (str(_CONTENT_HASH_SIZE),),
+                )
             conn.commit()
         finally:
             conn.close()
@@ -333,6 +759,7 @@ class MemoryStore:
     def _ensure_fts(self) -> None:
         """Create or upgrade the FTS5 index to cover content, title, subtitle."""
         conn = sqlite3.connect(str(self._db_path))
+        self._configure(conn)
         try:
             # Check current FTS version
             try:
@@ -362,7 +789,8 @@ class MemoryStore:
             conn.execute(
                 "CREATE VIRTUAL TABLE memories_fts "
                 "USING fts5(content, title, subtitle, "
-                "content='memories', content_rowid='rowid')"
+                "content='memories', content_rowid='rowid', "
+                f"tokenize='{_FTS_TOKENIZER}', prefix='{_FTS_PREFIX}')"
             )
 
             # Create sync triggers
@@ -378,14 +806,7 @@ class MemoryStore:
                 "VALUES('delete', old.rowid, old.content, old.title, old.subtitle); "
                 "END"
             )
-            conn.execute(
-                "CREATE TRIGGER memories_au AFTER UPDATE ON memories BEGIN "
-                "INSERT INTO memories_fts(memories_fts, rowid, content, title, subtitle) "
-                "VALUES('delete', old.rowid, old.content, old.title, old.subtitle); "
-                "INSERT INTO memories_fts(rowid, content, title, subtitle) "
-                "VALUES (new.rowid, new.content, new.title, new.subtitle); "
-                "END"
-            )
+            conn.execute(_FTS_UPDATE_TRIGGER_SQL)
 
             # Populate FTS from existing data
             conn.execute(
@@ -408,45 +829,129 @@ class MemoryStore:
         finally:
             conn.close()
 
-    def _ro_connection(self) -> sqlite3.Connection:
-        """Open a read-only connection."""
-        conn = sqlite3.connect(f"file:{self._db_path}?mode=ro", uri=True)
+    @staticmethod
+    def _configure(conn: sqlite3.Connection) -> None:
+        """Apply the per-connection PRAGMAs in ``_CONNECTION_PRAGMAS``."""
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        # Scored search needs pow(); SQLite only ships it when built with
+        # SQLITE_ENABLE_MATH_FUNCTIONS, so provide it otherwise.
+        try:
+            conn.execute("SELECT pow(0.5, 1.0)")
+        except sqlite3.OperationalError:
+            conn.create_function("pow", 2, math.pow, deterministic=True)
+
+    def _connect(self, database: str, *, uri: bool = False) -> sqlite3.Connection:
+        """Open a tuned connection usable from any (one-at-a-time) thread."""
+        conn = sqlite3.connect(
+            database,
+            uri=uri,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        self._configure(conn)
         conn.row_factory = sqlite3.Row
         return conn
 
-    def _rw_connection(self) -> sqlite3.Connection:
-        """Open a read-write connection."""
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+    @contextmanager
+    def _ro_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool (opened on demand)."""
+        try:
+            conn = self._ro_pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect(f"file:{self._db_path}?mode=ro", uri=True)
+            # Never writes, so skip sqlite3's implicit-transaction handling
+            conn.isolation_level = None
+        try:
+            yield conn
+        finally:
+            try:
+                self._ro_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    @contextmanager
+    def _rw_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared read-write connection; caller holds ``_write_lock``.
+
+        Anything left uncommitted (an early return or an exception) is rolled
+        back so it cannot leak into the next caller's transaction.
+        """
+        conn = self._rw_conn
+        try:
+            yield conn
+        finally:
+            self._journal_buffer.clear()
+            if conn.in_transaction:
+                conn.rollback()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        with self._write_lock:
+            self._rw_conn.close()
+        while True:
+            try:
+                self._ro_pool.get_nowait().close()
+            except queue.Empty:
+                break
 
     # -- journal ------------------------------------------------------------
 
-    def _journal(
-        self, conn: sqlite3.Connection, memory_id: str, operation: str, detail: str = ""
-    ) -> None:
-        """Append an entry to the append-only ``memory_journal`` table.
+    def _journal(self, memory_id: str, operation: str, detail: str = "") -> None:
+        """Queue an entry for the append-only ``memory_journal`` table.
+
+        Called while holding ``_write_lock``; the entry is written by the
+        next :meth:`_commit` and discarded if the transaction is rolled back.
+        """
+        now = datetime.now(tz=timezone.utc).isoformat()
+        self._journal_buffer.append((memory_id, operation, now, detail[:500]))
 
-        Called inside an existing write transaction so no extra locking is
-        needed.  Failures are logged but never raised -- the journal must not
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Flush queued journal entries with one ``executemany`` and commit.
+
+        Journal failures are logged but never raised -- the journal must not
         break primary operations.
         """
-        try:
-            now = datetime.now(tz=timezone.utc).isoformat()
-            conn.execute(
-                "INSERT INTO memory_journal (memory_id, operation, timestamp, detail) "
-                "VALUES (?, ?, ?, ?)",
-                (memory_id, operation, now, detail[:500]),
-            )
-        except Exception:
-            logger.debug("journal write failed for %s/%s", operation, memory_id, exc_info=True)
+        if self._journal_buffer:
+            try:
+                conn.executemany(_JOURNAL_INSERT_SQL, self._journal_buffer)
+            except sqlite3.Error:
+                logger.debug(
+                    "journal write failed for %d entries",
+                    len(self._journal_buffer),
+                    exc_info=True,
+                )
+            self._journal_buffer.clear()
+        conn.commit()
+        self._generation += 1
 
     # -- CRUD ---------------------------------------------------------------
 
     @staticmethod
     def _content_hash(content: str) -> str:
-        """SHA-256 hex digest of *content* for deduplication."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        """BLAKE2b-160 hex digest of *content* for deduplication."""
+        return hashlib.blake2b(
+            content.encode("utf-8"), digest_size=_CONTENT_HASH_SIZE
+        ).hexdigest()
+
+    def _dedup_filter(self, conn: sqlite3.Connection) -> _ContentBloom:
+        """Return the content-hash Bloom filter, rebuilding it if stale.
+
+        Caller holds ``_write_lock``.  ``PRAGMA data_version`` changes when
+        another connection (e.g. another process) commits, whose inserts the
+        filter has not seen; a rebuild is one scan of the hash index.
+        """
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if (
+            self._bloom is None
+            or self._bloom.full
+            or version != self._bloom_data_version
+        ):
+            self._bloom = _ContentBloom(
+                [row[0] for row in conn.execute("SELECT content_hash FROM memories")]
+            )
+            self._bloom_data_version = version
+        return self._bloom
 
     def store(
         self,
@@ -475,13 +980,143 @@ class MemoryStore:
         creating a duplicate.
 
         **TTL**: if *ttl_days* is provided, ``expires_at`` is set.  Expired
-        memories are excluded from search and purged by ``purge_expired()``.
+        memories are excluded from search and purged by ``purge_expired()``,
+        which ``store()`` also runs lazily once enough have accrued.
         """
         chash = self._content_hash(content)
         mem_id = uuid.uuid4().hex[:12]
         now = datetime.now(tz=timezone.utc).isoformat()
-        tag_str = ",".join(tags) if isinstance(tags, list) else (tags or "")
+        row, detail = self._memory_row(
+            mem_id,
+            chash,
+            now,
+            content,
+            category,
+            importance,
+            trust,
+            sensitivity,
+            tags,
+            ttl_days,
+            title=title,
+            subtitle=subtitle,
+            type=type,
+            concepts=concepts,
+            files_read=files_read,
+            files_modified=files_modified,
+            session_id=session_id,
+            project=project,
+            discovery_tokens=discovery_tokens,
+        )
+
+        with self._write_lock, self._rw_connection() as conn:
+            # Dedup check (skipped when the Bloom filter rules it out)
+            bloom = self._dedup_filter(conn)
+            existing = None
+            if chash in bloom:
+                # Refresh the existing memory's timestamp
+                if _HAS_RETURNING:
+                    existing = conn.execute(
+                        _DEDUP_REFRESH_RETURNING_SQL, (now, chash)
+                    ).fetchone()
+                else:
+                    existing = conn.execute(_DEDUP_LOOKUP_SQL, (chash,)).fetchone()
+                    if existing:
+                        conn.execute(_DEDUP_REFRESH_SQL, (now, existing["id"]))
+            if existing:
+                self._journal(existing["id"], "dedup_refresh")
+                self._commit(conn)
+                logger.debug("Dedup hit: refreshed memory %s", existing["id"])
+                return existing["id"]
+
+            conn.execute(_INSERT_MEMORY_SQL, row)
+            bloom.add(chash)
+            self._journal(mem_id, "insert", detail)
+            self._commit(conn)
+            purge_due = self._count_inserts(1)
+
+        self._after_insert(purge_due)
+        return mem_id
+
+    def store_many(self, items: Sequence[dict[str, Any]]) -> list[str]:
+        """Store several memories in one transaction.  Returns their ids.
+
+        Each item holds :meth:`store` arguments by name (``content`` is
+        required).  Deduplication works as in :meth:`store`, against stored
+        memories and within the batch; ids come back in *items* order.
+        """
+        if not items:
+            return []
+        now = datetime.now(tz=timezone.utc).isoformat()
+        hashes = [self._content_hash(item["content"]) for item in items]
+
+        with self._write_lock, self._rw_connection() as conn:
+            bloom = self._dedup_filter(conn)
+            candidates = [h for h in dict.fromkeys(hashes) if h in bloom]
+            existing: dict[str, str] = {}
+            if candidates:
+                existing = {
+                    row["content_hash"]: row["id"]
+                    for row in conn.execute(
+                        "SELECT content_hash, id FROM memories "
+                        f"WHERE content_hash IN {_JSON_IDS_SQL}",
+                        (json.dumps(candidates),),
+                    )
+                }
+
+            ids: list[str] = []
+            rows: list[tuple[Any, ...]] = []
+            for item, chash in zip(items, hashes, strict=True):
+                mem_id = existing.get(chash)
+                if mem_id is None:
+                    mem_id = uuid.uuid4().hex[:12]
+                    row, detail = self._memory_row(mem_id, chash, now, **item)
+                    rows.append(row)
+                    existing[chash] = mem_id
+                    bloom.add(chash)
+                    self._journal(mem_id, "insert", detail)
+                ids.append(mem_id)
+
+            inserted = {row[0] for row in rows}
+            refreshed = [i for i in dict.fromkeys(ids) if i not in inserted]
+            if refreshed:
+                conn.execute(
+                    f"UPDATE memories SET updated_at = ? WHERE id IN {_JSON_IDS_SQL}",
+                    (now, json.dumps(refreshed)),
+                )
+                for mem_id in refreshed:
+                    self._journal(mem_id, "dedup_refresh")
+            if rows:
+                conn.executemany(_INSERT_MEMORY_SQL, rows)
+            self._commit(conn)
+            purge_due = self._count_inserts(len(rows))
 
+        self._after_insert(purge_due)
+        return ids
+
+    @staticmethod
+    def _memory_row(
+        mem_id: str,
+        chash: str,
+        now: str,
+        content: str,
+        category: str = "general",
+        importance: float = 0.5,
+        trust: float = 0.5,
+        sensitivity: str = "public",
+        tags: list[str] | str | None = None,
+        ttl_days: float | None = None,
+        *,
+        title: str = "",
+        subtitle: str = "",
+        type: str = "change",
+        concepts: list[str] | None = None,
+        files_read: list[str] | None = None,
+        files_modified: list[str] | None = None,
+        session_id: str | None = None,
+        project: str | None = None,
+        discovery_tokens: int = 0,
+    ) -> tuple[tuple[Any, ...], str]:
+        """``_INSERT_MEMORY_SQL`` parameters and the journal detail for a new memory."""
         expires_at: str | None = None
         if ttl_days is not None and ttl_days > 0:
             expires_at = (
@@ -496,72 +1131,45 @@ class MemoryStore:
         if not title and content:
             title = content[:80] + ("..." if len(content) > 80 else "")
 
-        concepts_json = json.dumps(concepts or [])
-        files_read_json = json.dumps(files_read or [])
-        files_modified_json = json.dumps(files_modified or [])
-
-        with self._write_lock:
-            conn = self._rw_connection()
-            try:
-                # Dedup check
-                existing = conn.execute(
-                    "SELECT id FROM memories WHERE content_hash = ?", (chash,)
-                ).fetchone()
-                if existing:
-                    # Refresh the existing memory's timestamp
-                    conn.execute(
-                        "UPDATE memories SET updated_at = ? WHERE id = ?",
-                        (now, existing["id"]),
-                    )
-                    self._journal(conn, existing["id"], "dedup_refresh")
-                    conn.commit()
-                    logger.debug("Dedup hit: refreshed memory %s", existing["id"])
-                    return existing["id"]
-
-                conn.execute(
-                    "INSERT INTO memories (id, content, content_hash, category, "
-                    "importance, trust, sensitivity, tags, created_at, updated_at, "
-                    "expires_at, title, subtitle, type, concepts, files_read, "
-                    "files_modified, session_id, project, accessed_count, "
-                    "discovery_tokens) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        mem_id,
-                        content,
-                        chash,
-                        category,
-                        importance,
-                        trust,
-                        sensitivity,
-                        tag_str,
-                        now,
-                        now,
-                        expires_at,
-                        title,
-                        subtitle,
-                        type,
-                        concepts_json,
-                        files_read_json,
-                        files_modified_json,
-                        session_id,
-                        project,
-                        0,
-                        discovery_tokens,
-                    ),
-                )
-                self._journal(
-                    conn, mem_id, "insert",
-                    f"category={category} type={type} sensitivity={sensitivity}",
-                )
-                conn.commit()
-            finally:
-                conn.close()
+        row = (
+            mem_id,
+            content,
+            chash,
+            category,
+            importance,
+            trust,
+            sensitivity,
+            ",".join(tags) if isinstance(tags, list) else (tags or ""),
+            now,
+            now,
+            expires_at,
+            title,
+            subtitle,
+            type,
+            json.dumps(concepts or []),
+            json.dumps(files_read or []),
+            json.dumps(files_modified or []),
+            session_id,
+            project,
+            0,
+            discovery_tokens,
+        )
+        return row, f"category={category} type={type} sensitivity={sensitivity}"
+
+    def _count_inserts(self, n: int) -> bool:
+        """Count *n* inserts; True when a lazy TTL purge is due (write lock held)."""
+        self._inserts_since_purge += n
+        if self._inserts_since_purge < _LAZY_PURGE_INTERVAL:
+            return False
+        self._inserts_since_purge = 0
+        return True
 
-        # Enforce max_memories limit
+    def _after_insert(self, purge_due: bool) -> None:
+        """Lazy TTL purge and ``max_memories`` eviction, outside the write lock."""
+        if purge_due:
+            self.purge_expired(min_expired=_LAZY_PURGE_MIN_EXPIRED)
         self._enforce_limit()
 
-        return mem_id
-
     def update(
         self,
         id: str,
@@ -584,11 +1192,13 @@ class MemoryStore:
         updates: list[str] = ["updated_at = ?"]
         params: list[Any] = [now]
 
+        chash: str | None = None
         if content is not None:
+            chash = self._content_hash(content)
             updates.append("content = ?")
             params.append(content)
             updates.append("content_hash = ?")
-            params.append(self._content_hash(content))
+            params.append(chash)
         if title is not None:
             updates.append("title = ?")
             params.append(title)
@@ -624,38 +1234,51 @@ class MemoryStore:
             params.append(max(0.0, min(1.0, trust)))
 
         params.append(id)
-        query = f"UPDATE memories SET {', '.join(updates)} WHERE id = ?"  # noqa: S608
 
-        with self._write_lock:
-            conn = self._rw_connection()
-            try:
-                cursor = conn.execute(query, params)
-                if cursor.rowcount == 0:
-                    return None
-                self._journal(conn, id, "update")
-                conn.commit()
-            finally:
-                conn.close()
+        with self._write_lock, self._rw_connection() as conn:
+            cursor = conn.execute(_update_sql(tuple(updates)), params)
+            if cursor.rowcount == 0:
+                return None
+            if chash is not None:
+                self._dedup_filter(conn).add(chash)
+            self._journal(id, "update")
+            self._commit(conn)
 
         # Return the updated memory
         records = self.get([id])
         return records[0] if records else None
 
-    def purge_expired(self) -> int:
-        """Delete all memories whose ``expires_at`` has passed.  Returns count."""
-        now = datetime.now(tz=timezone.utc).isoformat()
-        with self._write_lock:
-            conn = self._rw_connection()
-            try:
-                cursor = conn.execute(
-                    "DELETE FROM memories WHERE expires_at IS NOT NULL "
-                    "AND expires_at < ?",
+    def purge_expired(self, *, min_expired: int = 1) -> int:
+        """Delete all memories whose ``expires_at`` has passed.  Returns count.
+
+        With *min_expired* > 1 nothing is deleted (and 0 returned) until at
+        least that many have expired; counting them only reads the TTL index.
+        Rows are deleted in ``_PURGE_BATCH_SIZE`` batches, each its own
+        transaction.
+        """
+        now = int(time.time())
+        if min_expired > 1:
+            with self._ro_connection() as conn:
+                expired = conn.execute(
+                    "SELECT COUNT(*) FROM memories WHERE expires_epoch < ?",
                     (now,),
-                )
+                ).fetchone()[0]
+            if expired < min_expired:
+                return 0
+        deleted = 0
+        while True:
+            with self._write_lock, self._rw_connection() as conn:
+                batch = conn.execute(
+                    _PURGE_BATCH_SQL, (now, _PURGE_BATCH_SIZE)
+                ).rowcount
                 conn.commit()
-                deleted = cursor.rowcount
-            finally:
-                conn.close()
+                if batch:
+                    # Drop stale hashes to keep the false-positive rate down
+                    self._bloom = None
+                    self._generation += 1
+            deleted += batch
+            if batch < _PURGE_BATCH_SIZE:
+                break
         if deleted:
             logger.info("Purged %d expired memories", deleted)
         return deleted
@@ -664,100 +1287,150 @@ class MemoryStore:
         """Get memories by id(s).  Optionally increment access count."""
         if not ids:
             return []
-        placeholders = ",".join("?" for _ in ids)
-        id_list = list(ids)
+        id_json = json.dumps(list(ids))
 
         if _increment_access:
-            with self._write_lock:
-                conn = self._rw_connection()
-                try:
-                    conn.execute(
-                        "UPDATE memories SET accessed_count = accessed_count + 1 "
-                        f"WHERE id IN ({placeholders})",  # noqa: S608
-                        id_list,
-                    )
-                    conn.commit()
-                    cursor = conn.execute(
-                        f"SELECT * FROM memories WHERE id IN ({placeholders})",  # noqa: S608
-                        id_list,
-                    )
-                    return [dict(row) for row in cursor.fetchall()]
-                finally:
-                    conn.close()
+            self._record_access(ids)
 
-        conn = self._ro_connection()
-        try:
-            cursor = conn.execute(
-                f"SELECT * FROM memories WHERE id IN ({placeholders})",  # noqa: S608
-                id_list,
-            )
+        with self._ro_connection() as conn:
+            cursor = conn.execute(_GET_MANY_SQL, (id_json,))
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
     def delete(self, id: str) -> bool:
         """Delete a memory by id. Returns True if deleted."""
-        with self._write_lock:
-            conn = self._rw_connection()
-            try:
-                cursor = conn.execute("DELETE FROM memories WHERE id = ?", (id,))
-                if cursor.rowcount > 0:
-                    self._journal(conn, id, "delete")
-                conn.commit()
-                return cursor.rowcount > 0
-            finally:
-                conn.close()
+        with self._write_lock, self._rw_connection() as conn:
+            cursor = conn.execute("DELETE FROM memories WHERE id = ?", (id,))
+            if cursor.rowcount > 0:
+                self._journal(id, "delete")
+            self._commit(conn)
+            return cursor.rowcount > 0
+
+    def list_all(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        *,
+        after: tuple[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List memory metadata (no full content for large lists).
 
-    def list_all(self, limit: int = 100, offset: int = 0) -> list[dict[str, Any]]:
-        """List memory metadata (no full content for large lists)."""
-        conn = self._ro_connection()
-        try:
+        Newest first.  For deep pagination pass *after* as the
+        ``(updated_at, id)`` of the previous page's last row instead of an
+        *offset*: each page is then an index seek rather than a re-scan of
+        every row before it.  Expired memories are skipped even before they
+        are purged.
+        """
+        conditions = "(expires_epoch IS NULL OR expires_epoch > ?)"
+        params: list[Any] = [int(time.time())]
+        if after is not None:
+            conditions += " AND (updated_at, id) < (?, ?)"
+            params.extend(after)
+        params.extend((limit, offset))
+        with self._ro_connection() as conn:
             cursor = conn.execute(
                 "SELECT id, title, subtitle, type, category, importance, trust, "
                 "sensitivity, tags, concepts, session_id, project, "
                 "accessed_count, discovery_tokens, created_at, updated_at, "
                 "SUBSTR(content, 1, 100) AS content_preview "
-                "FROM memories ORDER BY updated_at DESC LIMIT ? OFFSET ?",
-                (limit, offset),
+                f"FROM memories WHERE {conditions} "  # noqa: S608
+                "ORDER BY updated_at DESC, id DESC LIMIT ? OFFSET ?",
+                params,
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
     def count(self) -> int:
-        """Return total number of memories."""
-        conn = self._ro_connection()
-        try:
-            row = conn.execute("SELECT COUNT(*) AS cnt FROM memories").fetchone()
-            return row["cnt"] if row else 0
-        finally:
-            conn.close()
+        """Return the number of unexpired memories, matching :meth:`list_all`.
+
+        The trigger-maintained total still includes expired rows awaiting
+        purge; those are subtracted via the partial ``idx_memories_ttl``.
+        """
+        with self._ro_connection() as conn:
+            row = conn.execute(
+                "SELECT COALESCE("
+                " (SELECT value FROM memory_stats WHERE key = 'total'), 0)"
+                " - (SELECT count(*) FROM memories"
+                " WHERE expires_epoch IS NOT NULL AND expires_epoch <= ?)",
+                (int(time.time()),),
+            ).fetchone()
+            return row[0]
 
     # -- search (scored contract) --------------------------------------------
 
-    def _search_fts(self, query: str, limit: int) -> list[tuple[dict[str, Any], float]]:
-        """Search via FTS5 with bm25 scoring.  Excludes expired memories."""
-        conn = self._ro_connection()
-        now = datetime.now(tz=timezone.utc).isoformat()
-        try:
+    def _search_fts(
+        self,
+        query: str,
+        *,
+        cfg: _ScoringConfig,
+        limit: int,
+        candidate_limit: int,
+        allowed: list[str],
+        ids_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Scored FTS5 search, ranked and gated entirely in SQL.
+
+        The top *candidate_limit* bm25 matches are scored with the same
+        weighted sum as :func:`_compute_score` (recency from the integer
+        ``updated_epoch``),
+        gated on sensitivity, cut at ``min_score`` and trimmed to *limit*.
+        Ranking touches only the scoring columns; full rows (``content``
+        included) are joined back for the final *limit* only, or just ``id``
+        with *ids_only*.  Excludes expired memories.
+        """
+        columns = (
+            "m.id" if ids_only else ", ".join(f"m.{c}" for c in _MEMORY_COLUMN_NAMES)
+        )
+        params: dict[str, Any] = {
+            "query": query,
+            "now": int(time.time()),
+            "candidate_limit": candidate_limit,
+            "w_match": cfg.w_match,
+            "w_recency": cfg.w_recency,
+            "w_importance": cfg.w_importance,
+            "w_trust": cfg.w_trust,
+            "half_life": cfg.half_life_days,
+            "min_score": cfg.min_score,
+            "limit": limit,
+            "allowed": json.dumps(allowed),
+        }
+        with self._ro_connection() as conn:
             cursor = conn.execute(
-                "SELECT m.*, bm25(memories_fts) AS _bm25 "
-                "FROM memories_fts f "
-                "JOIN memories m ON m.rowid = f.rowid "
-                "WHERE memories_fts MATCH ? "
-                "AND (m.expires_at IS NULL OR m.expires_at > ?) "
-                "ORDER BY rank LIMIT ?",
-                (query, now, limit),
+                "WITH candidates AS ("
+                " SELECT m.rowid AS _rowid, m.updated_epoch, m.importance,"
+                " m.trust, m.sensitivity, f.rank AS _rank,"
+                " 1.0 / (1.0 + max(0.0, bm25(memories_fts))) AS _match"
+                " FROM memories_fts f"
+                " JOIN memories m ON m.rowid = f.rowid"
+                " WHERE memories_fts MATCH :query"
+                " AND (m.expires_epoch IS NULL OR m.expires_epoch > :now)"
+                " ORDER BY f.rank LIMIT :candidate_limit"
+                "), scored AS ("
+                " SELECT c._rowid, c._rank, c._match, ("
+                " :w_match * c._match"
+                " + :w_recency * CASE WHEN c.updated_epoch IS NULL THEN 0.2"
+                " ELSE pow(0.5, max(0.0, :now - c.updated_epoch) / 86400.0"
+                " / :half_life) END"
+                " + :w_importance * COALESCE(c.importance, 0.5)"
+                " + :w_trust * COALESCE(c.trust, 0.5)"
+                " ) AS _score"
+                " FROM candidates c"
+                " WHERE lower(COALESCE(NULLIF(c.sensitivity, ''), 'public'))"
+                " IN (SELECT value FROM json_each(:allowed))"
+                "), top AS ("
+                " SELECT * FROM scored WHERE _score >= :min_score"
+                " ORDER BY _score DESC, _rank LIMIT :limit"
+                ")"
+                f" SELECT {columns}, t._match, t._score FROM top t"
+                " JOIN memories m ON m.rowid = t._rowid"
+                " ORDER BY t._score DESC, t._rank",
+                params,
             )
-            results: list[tuple[dict[str, Any], float]] = []
+            results: list[dict[str, Any]] = []
             for row in cursor.fetchall():
                 d = dict(row)
-                bm25_score = d.pop("_bm25", 0.0)
-                match_score = 1.0 / (1.0 + max(0.0, bm25_score))
-                results.append((d, match_score))
+                d["_score"] = round(d["_score"], 3)
+                d["_match"] = round(d["_match"], 3)
+                results.append(d)
             return results
-        finally:
-            conn.close()
 
     def _search_like(
         self, keywords: list[str], limit: int
@@ -765,53 +1438,35 @@ class MemoryStore:
         """Fallback: LIKE search with keyword hit counting.  Excludes expired."""
         if not keywords:
             return []
-        conn = self._ro_connection()
-        now = datetime.now(tz=timezone.utc).isoformat()
-        try:
-            # Search across content, title, and subtitle
-            field_conditions: list[str] = []
-            params: list[Any] = []
-            for kw in keywords:
-                field_conditions.append(
-                    "(content LIKE ? OR title LIKE ? OR subtitle LIKE ?)"
-                )
-                params.extend([f"%{kw}%", f"%{kw}%", f"%{kw}%"])
-            conditions = " OR ".join(field_conditions)
-            params.extend([now, limit])
+        # Keywords are \w+ runs, so "_" is the only LIKE wildcard to escape.
+        params: dict[str, Any] = {
+            f"k{i}": "%" + kw.replace("_", "\\_") + "%"
+            for i, kw in enumerate(keywords)
+        }
+        params.update(now=int(time.time()), limit=limit)
+        # One predicate per keyword across content, title and subtitle; the
+        # same predicates summed give the keyword hit count.
+        matches = [
+            f"(content LIKE :k{i} ESCAPE '\\' OR title LIKE :k{i} ESCAPE '\\' "
+            f"OR subtitle LIKE :k{i} ESCAPE '\\')"
+            for i in range(len(keywords))
+        ]
+        hits_sql = " + ".join(f"IFNULL({m}, 0)" for m in matches)
+        with self._ro_connection() as conn:
             cursor = conn.execute(
-                f"SELECT * FROM memories WHERE ({conditions}) "  # noqa: S608
-                "AND (expires_at IS NULL OR expires_at > ?) "
-                "ORDER BY updated_at DESC LIMIT ?",
+                f"SELECT {_MEMORY_COLUMNS}, "  # noqa: S608
+                f"updated_epoch AS _updated_epoch, {hits_sql} AS _hits "
+                f"FROM memories WHERE ({' OR '.join(matches)}) "
+                "AND (expires_epoch IS NULL OR expires_epoch > :now) "
+                "ORDER BY updated_at DESC LIMIT :limit",
                 params,
             )
             results: list[tuple[dict[str, Any], float]] = []
             for row in cursor.fetchall():
                 d = dict(row)
-                searchable = (
-                    (d.get("content") or "").lower()
-                    + " " + (d.get("title") or "").lower()
-                    + " " + (d.get("subtitle") or "").lower()
-                )
-                hits = sum(1 for kw in keywords if kw in searchable)
-                match_score = min(0.75, 0.15 + 0.15 * hits)
-                results.append((d, match_score))
+                hits = d.pop("_hits")
+                results.append((d, min(0.75, 0.15 + 0.15 * hits)))
             return results
-        finally:
-            conn.close()
-
-    def _search_raw(
-        self, prompt: str, *, candidate_limit: int
-    ) -> list[tuple[dict[str, Any], float]]:
-        """Run search: try FTS5, fall back to LIKE."""
-        keywords = _extract_keywords(prompt)
-        if not keywords:
-            return []
-        fts_query = " OR ".join(keywords)
-        try:
-            return self._search_fts(fts_query, candidate_limit)
-        except sqlite3.OperationalError:
-            logger.debug("FTS5 not available, falling back to LIKE search")
-            return self._search_like(keywords, candidate_limit)
 
     def _rerank_and_filter(
         self,
@@ -822,7 +1477,7 @@ class MemoryStore:
         allow_private: bool,
         allow_secret: bool,
     ) -> list[dict[str, Any]]:
-        """Score, gate, filter, sort, truncate."""
+        """Score, gate, filter, sort, truncate (LIKE-fallback path only)."""
         scored: list[tuple[dict[str, Any], float]] = []
         for item, match_score in items:
             sensitivity = item.get("sensitivity", _DEFAULT_SENSITIVITY)
@@ -830,13 +1485,18 @@ class MemoryStore:
                 sensitivity, allow_private=allow_private, allow_secret=allow_secret
             ):
                 continue
-            score = _compute_score(item, match_score=match_score, cfg=cfg)
+            score = _compute_score(
+                item,
+                match_score=match_score,
+                cfg=cfg,
+                updated_epoch=item.pop("_updated_epoch", None),
+            )
             if score >= cfg.min_score:
                 item["_score"] = round(score, 3)
                 item["_match"] = round(match_score, 3)
                 scored.append((item, score))
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return [item for item, _ in scored[:limit]]
+        # Partial selection; same order and ties as sorting then slicing
+        return [item for item, _ in heapq.nlargest(limit, scored, key=itemgetter(1))]
 
     def search_v2(
         self,
@@ -848,31 +1508,13 @@ class MemoryStore:
         gating: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
         """Scored search with sensitivity gating."""
-        s = scoring or {}
-        g = gating or {}
-        cfg = _ScoringConfig(
-            w_match=float(s.get("w_match", 0.55)),
-            w_recency=float(s.get("w_recency", 0.20)),
-            w_importance=float(s.get("w_importance", 0.15)),
-            w_trust=float(s.get("w_trust", 0.10)),
-            half_life_days=float(s.get("half_life_days", 21.0)),
-            min_score=float(s.get("min_score", 0.35)),
-        )
-        raw = self._search_raw(prompt, candidate_limit=candidate_limit)
-        results = self._rerank_and_filter(
-            raw,
-            cfg=cfg,
+        return self._search(
+            prompt,
             limit=limit,
-            allow_private=g.get("allow_private", False),
-            allow_secret=g.get("allow_secret", False),
-        )
-
-        # Self-amplifying access tracking — boost retrieved memories
-        result_ids = [m["id"] for m in results if "id" in m]
-        if result_ids:
-            self.get(result_ids, _increment_access=True)
-
-        return results
+            candidate_limit=candidate_limit,
+            scoring=scoring,
+            gating=gating,
+        )
 
     def search_ids(
         self,
@@ -883,45 +1525,178 @@ class MemoryStore:
         gating: dict[str, Any] | None = None,
     ) -> list[str]:
         """Return matching memory ids."""
-        results = self.search_v2(
+        results = self._search(
             prompt,
             limit=candidate_limit,
             candidate_limit=candidate_limit,
             scoring=scoring,
             gating=gating,
+            ids_only=True,
         )
         return [r["id"] for r in results]
 
+    def _search(
+        self,
+        prompt: str,
+        *,
+        limit: int,
+        candidate_limit: int,
+        scoring: dict[str, Any] | None,
+        gating: dict[str, Any] | None,
+        ids_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Shared body of :meth:`search_v2` and :meth:`search_ids`.
+
+        With *ids_only* the FTS path returns ``id``/``_score``/``_match``
+        dicts without reading full rows.
+        """
+        s = scoring or {}
+        g = gating or {}
+        cfg = _ScoringConfig(
+            w_match=float(s.get("w_match", 0.55)),
+            w_recency=float(s.get("w_recency", 0.20)),
+            w_importance=float(s.get("w_importance", 0.15)),
+            w_trust=float(s.get("w_trust", 0.10)),
+            half_life_days=float(s.get("half_life_days", 21.0)),
+            min_score=float(s.get("min_score", 0.35)),
+        )
+        allow_private = g.get("allow_private", False)
+        allow_secret = g.get("allow_secret", False)
+        keywords = _extract_keywords(prompt)
+        if not keywords:
+            return []
+        try:
+            results = self._search_fts(
+                _fts_query(keywords),
+                cfg=cfg,
+                limit=limit,
+                candidate_limit=candidate_limit,
+                allowed=_allowed_sensitivities(
+                    allow_private=allow_private, allow_secret=allow_secret
+                ),
+                ids_only=ids_only,
+            )
+        except sqlite3.OperationalError:
+            logger.debug("FTS5 not available, falling back to LIKE search")
+            results = self._rerank_and_filter(
+                self._search_like(keywords, candidate_limit),
+                cfg=cfg,
+                limit=limit,
+                allow_private=allow_private,
+                allow_secret=allow_secret,
+            )
+
+        # Self-amplifying access tracking — boost retrieved memories
+        result_ids = [m["id"] for m in results if "id" in m]
+        if result_ids:
+            self._record_access(result_ids)
+
+        return results
+
+    def search_literal(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        gating: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Exact ``id:<id>`` or ``#tag`` lookup, skipping FTS ranking.
+
+        Returns ``None`` when *query* is neither form.  Hits are gated and
+        scored like :meth:`search_v2` results (``_match`` is 1.0, no
+        ``min_score`` cut) and count as an access.  Excludes expired memories.
+        """
+        query = query.strip()
+        if m := _LITERAL_ID_RE.fullmatch(query):
+            condition, value = "id = ?", m[1]
+        elif m := _LITERAL_TAG_RE.fullmatch(query):
+            condition = "',' || tags || ',' LIKE ? ESCAPE '\\'"
+            value = "%," + m[1].replace("_", "\\_") + ",%"
+        else:
+            return None
+        g = gating or {}
+        allowed = _allowed_sensitivities(
+            allow_private=g.get("allow_private", False),
+            allow_secret=g.get("allow_secret", False),
+        )
+        with self._ro_connection() as conn:
+            rows = conn.execute(
+                f"SELECT {_MEMORY_COLUMNS}, "  # noqa: S608
+                "updated_epoch AS _updated_epoch "
+                f"FROM memories WHERE {condition} "
+                "AND (expires_epoch IS NULL OR expires_epoch > ?) "
+                "AND lower(COALESCE(NULLIF(sensitivity, ''), 'public')) "
+                f"IN {_JSON_IDS_SQL} "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (value, int(time.time()), json.dumps(allowed), limit),
+            ).fetchall()
+        cfg = _ScoringConfig()
+        results = []
+        for row in rows:
+            item = dict(row)
+            score = _compute_score(
+                item,
+                match_score=1.0,
+                cfg=cfg,
+                updated_epoch=item.pop("_updated_epoch"),
+            )
+            item["_score"] = round(score, 3)
+            item["_match"] = 1.0
+            results.append(item)
+        results.sort(key=itemgetter("_score"), reverse=True)
+        if results:
+            self._record_access([r["id"] for r in results])
+        return results
+
+    def search_generation(self) -> tuple[int, int]:
+        """Token that changes whenever stored memories may have changed.
+
+        Combines a counter of this store's own writes with SQLite's
+        ``data_version``, which moves when another connection (or process)
+        commits.  Access-count bumps from searches do not change it.
+
+        Never waits on ``_write_lock``: while a write holds it, the last
+        ``data_version`` seen is reused.  ``data_version`` is per connection,
+        and only the writer's copy ignores this store's own commits, so it
+        cannot come from a pooled reader.
+        """
+        if self._write_lock.acquire(blocking=False):
+            try:
+                row = self._rw_conn.execute("PRAGMA data_version").fetchone()
+                self._data_version = row[0]
+            finally:
+                self._write_lock.release()
+        return self._generation, self._data_version
+
+    def _record_access(self, ids: Sequence[str]) -> None:
+        """Increment ``accessed_count`` for *ids* without reading them back."""
+        with self._write_lock, self._rw_connection() as conn:
+            conn.execute(_RECORD_ACCESS_SQL, (json.dumps(list(ids)),))
+            conn.commit()
+
     # -- New search operations -----------------------------------------------
 
     def search_by_file(self, file_path: str, *, limit: int = 10) -> list[dict[str, Any]]:
         """Search memories by file path (in files_read or files_modified)."""
-        conn = self._ro_connection()
-        try:
-            pattern = f'%"{file_path}"%'
+        with self._ro_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM memories "
-                "WHERE files_read LIKE ? OR files_modified LIKE ? "
+                f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id IN "  # noqa: S608
+                "(SELECT memory_id FROM memory_files WHERE file_path = ?) "
                 "ORDER BY updated_at DESC LIMIT ?",
-                (pattern, pattern, limit),
+                (file_path, limit),
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
     def search_by_concept(self, concept: str, *, limit: int = 10) -> list[dict[str, Any]]:
         """Search memories by concept tag."""
-        conn = self._ro_connection()
-        try:
+        with self._ro_connection() as conn:
             cursor = conn.execute(
-                "SELECT * FROM memories "
-                "WHERE concepts LIKE ? "
+                f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE id IN "  # noqa: S608
+                "(SELECT memory_id FROM memory_concepts WHERE concept = ?) "
                 "ORDER BY importance DESC, updated_at DESC LIMIT ?",
-                (f'%"{concept}"%', limit),
+                (concept, limit),
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
     def get_timeline(
         self,
@@ -934,9 +1709,9 @@ class MemoryStore:
         """Get memories ordered by creation date, optionally filtered."""
         conditions: list[str] = []
         params: list[Any] = []
-        now = datetime.now(tz=timezone.utc).isoformat()
+        now = int(time.time())
 
-        conditions.append("(expires_at IS NULL OR expires_at > ?)")
+        conditions.append("(expires_epoch IS NULL OR expires_epoch > ?)")
         params.append(now)
 
         if type is not None:
@@ -952,16 +1727,13 @@ class MemoryStore:
         where = " AND ".join(conditions)
         params.append(limit)
 
-        conn = self._ro_connection()
-        try:
+        with self._ro_connection() as conn:
             cursor = conn.execute(
-                f"SELECT * FROM memories WHERE {where} "  # noqa: S608
+                f"SELECT {_MEMORY_COLUMNS} FROM memories WHERE {where} "  # noqa: S608
                 "ORDER BY created_at DESC LIMIT ?",
                 params,
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
     # -- Public scoring API (for hooks-memory-inject and other consumers) ---
 
@@ -1010,30 +1782,27 @@ class MemoryStore:
         """
         if self._max_memories <= 0:
             return
-        with self._write_lock:
-            conn = self._rw_connection()
-            try:
-                row = conn.execute(
-                    "SELECT COUNT(*) AS cnt FROM memories"
-                ).fetchone()
-                total = row["cnt"] if row else 0
-                if total <= self._max_memories:
-                    return
-                to_remove = total - self._max_memories
-                conn.execute(
-                    "DELETE FROM memories WHERE id IN ("
-                    "SELECT id FROM memories "
-                    "ORDER BY accessed_count ASC, updated_at ASC, importance ASC "
-                    f"LIMIT {to_remove})",
-                )
-                conn.commit()
-                logger.info(
-                    "Evicted %d memories to stay under max_memories=%d",
-                    to_remove,
-                    self._max_memories,
-                )
-            finally:
-                conn.close()
+        with self._write_lock, self._rw_connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM memory_stats WHERE key = 'total'"
+            ).fetchone()
+            total = row["value"] if row else 0
+            if total <= self._max_memories:
+                return
+            to_remove = total - self._max_memories
+            conn.execute(
+                "DELETE FROM memories WHERE id IN ("
+                "SELECT id FROM memories "
+                "ORDER BY accessed_count ASC, updated_at ASC, importance ASC "
+                f"LIMIT {to_remove})",
+            )
+            conn.commit()
+            self._generation += 1
+            logger.info(
+                "Evicted %d memories to stay under max_memories=%d",
+                to_remove,
+                self._max_memories,
+            )
 
     # -- Fact Store ----------------------------------------------------------
 
@@ -1053,44 +1822,63 @@ class MemoryStore:
         """
         now = datetime.now(tz=timezone.utc).isoformat()
         fact_id = uuid.uuid4().hex[:12]
+        params = (
+            fact_id,
+            subject,
+            predicate,
+            object_value,
+            confidence,
+            source_entry_id,
+            now,
+            now,
+        )
 
-        with self._write_lock:
-            conn = self._rw_connection()
-            try:
-                existing = conn.execute(
+        with self._write_lock, self._rw_connection() as conn:
+            if _HAS_RETURNING:
+                row = conn.execute(_UPSERT_FACT_RETURNING_SQL, params).fetchone()
+            else:
+                conn.execute(_UPSERT_FACT_SQL, params)
+                row = conn.execute(
                     "SELECT id FROM facts "
                     "WHERE subject = ? AND predicate = ? AND object = ?",
                     (subject, predicate, object_value),
                 ).fetchone()
-                if existing:
-                    conn.execute(
-                        "UPDATE facts SET confidence = ?, updated_at = ? "
-                        "WHERE id = ?",
-                        (confidence, now, existing["id"]),
-                    )
-                    conn.commit()
-                    logger.debug("Fact dedup hit: updated fact %s", existing["id"])
-                    return existing["id"]
+            conn.commit()
+        if row["id"] != fact_id:
+            logger.debug("Fact dedup hit: updated fact %s", row["id"])
+        return row["id"]
 
-                conn.execute(
-                    "INSERT INTO facts (id, subject, predicate, object, "
-                    "confidence, source_entry_id, created_at, updated_at) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        fact_id,
-                        subject,
-                        predicate,
-                        object_value,
-                        confidence,
-                        source_entry_id,
-                        now,
-                        now,
-                    ),
-                )
-                conn.commit()
-            finally:
-                conn.close()
-        return fact_id
+    def store_facts(
+        self,
+        facts: Sequence[tuple[str, str, str, float]],
+        source_entry_id: str | None = None,
+    ) -> int:
+        """Store many ``(subject, predicate, object, confidence)`` triples.
+
+        Same deduplication as :meth:`store_fact`, but one ``executemany``
+        and one commit for the whole batch.  Returns the number of triples
+        written.
+        """
+        if not facts:
+            return 0
+        now = datetime.now(tz=timezone.utc).isoformat()
+        rows = [
+            (
+                uuid.uuid4().hex[:12],
+                subject,
+                predicate,
+                object_value,
+                confidence,
+                source_entry_id,
+                now,
+                now,
+            )
+            for subject, predicate, object_value, confidence in facts
+        ]
+        with self._write_lock, self._rw_connection() as conn:
+            conn.executemany(_UPSERT_FACT_SQL, rows)
+            conn.commit()
+        return len(rows)
 
     def query_facts(
         self,
@@ -1120,27 +1908,20 @@ class MemoryStore:
         where = " AND ".join(conditions)
         params.append(limit)
 
-        conn = self._ro_connection()
-        try:
+        with self._ro_connection() as conn:
             cursor = conn.execute(
                 f"SELECT * FROM facts WHERE {where} "  # noqa: S608
                 "ORDER BY updated_at DESC LIMIT ?",
                 params,
             )
             return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
 
     def delete_fact(self, fact_id: str) -> bool:
         """Delete a fact by id.  Returns True if deleted."""
-        with self._write_lock:
-            conn = self._rw_connection()
-            try:
-                cursor = conn.execute("DELETE FROM facts WHERE id = ?", (fact_id,))
-                conn.commit()
-                return cursor.rowcount > 0
-            finally:
-                conn.close()
+        with self._write_lock, self._rw_connection() as conn:
+            cursor = conn.execute("DELETE FROM facts WHERE id = ?", (fact_id,))
+            conn.commit()
+            return cursor.rowcount > 0
 
     # -- Summarization -------------------------------------------------------
 
@@ -1160,24 +1941,20 @@ class MemoryStore:
         Returns ``{"categories_summarized", "memories_archived",
         "summaries_created"}``.
         """
-        cutoff = (
-            datetime.now(tz=timezone.utc) - timedelta(days=max_age_days)
-        ).isoformat()
+        cutoff = int(time.time() - max_age_days * 86400)
 
         categories_summarized = 0
         memories_archived = 0
-        summaries_created = 0
 
-        # Read old memories grouped by category
-        conn = self._ro_connection()
-        try:
+        # Read old memories grouped by category.  Summaries only keep a
+        # 100-char preview, so full content never leaves SQLite.
+        with self._ro_connection() as conn:
             rows = conn.execute(
-                "SELECT id, content, category FROM memories "
-                "WHERE updated_at < ? ORDER BY category, updated_at",
+                "SELECT id, SUBSTR(content, 1, 100) AS preview, category "
+                "FROM memories "
+                "WHERE updated_epoch < ? ORDER BY category, updated_at",
                 (cutoff,),
             ).fetchall()
-        finally:
-            conn.close()
 
         # Group by category
         groups: dict[str, list[dict[str, Any]]] = {}
@@ -1186,39 +1963,22 @@ class MemoryStore:
             cat = d.get("category", "general")
             groups.setdefault(cat, []).append(d)
 
-        # Summarize categories exceeding max_memories
+        # Build one summary per category exceeding max_memories
+        summaries: list[tuple[str, str]] = []  # (category, content)
+        archived_ids: list[str] = []
         for category, entries in groups.items():
             if len(entries) <= max_memories:
                 continue
-
-            # Build summary content from previews
-            previews = [entry["content"][:100] for entry in entries]
-            summary_content = "; ".join(previews)
-
-            # Store summary as a new memory
-            self.store(
-                content=summary_content,
-                category=f"{category}/summary",
-                importance=0.7,
-            )
-            summaries_created += 1
-
-            # Delete the originals
-            original_ids = [entry["id"] for entry in entries]
-            with self._write_lock:
-                conn = self._rw_connection()
-                try:
-                    placeholders = ",".join("?" for _ in original_ids)
-                    conn.execute(
-                        f"DELETE FROM memories WHERE id IN ({placeholders})",  # noqa: S608
-                        original_ids,
-                    )
-                    conn.commit()
-                finally:
-                    conn.close()
-
+            previews = [entry["preview"] for entry in entries]
+            summaries.append((f"{category}/summary", "; ".join(previews)))
+            archived_ids.extend(entry["id"] for entry in entries)
             memories_archived += len(entries)
             categories_summarized += 1
+        summaries_created = len(summaries)
+
+        if summaries:
+            self._replace_with_summaries(summaries, archived_ids)
+            self._enforce_limit()
 
         logger.info(
             "Summarized %d categories, archived %d memories, created %d summaries",
@@ -1232,17 +1992,371 @@ class MemoryStore:
             "summaries_created": summaries_created,
         }
 
+    def _replace_with_summaries(
+        self, summaries: list[tuple[str, str]], archived_ids: list[str]
+    ) -> None:
+        """Insert *summaries* and delete *archived_ids* in one transaction.
+
+        Summaries are stored as :meth:`store` would store them (importance
+        0.7, auto title, content-hash dedup refreshing an existing copy), but
+        with a single lock acquisition, ``BEGIN IMMEDIATE`` and commit.
+        """
+        now = datetime.now(tz=timezone.utc).isoformat()
+        with self._write_lock, self._rw_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            bloom = self._dedup_filter(conn)
+            rows: list[tuple[Any, ...]] = []
+            for category, content in summaries:
+                chash = self._content_hash(content)
+                existing = None
+                if chash in bloom:
+                    existing = conn.execute(_DEDUP_LOOKUP_SQL, (chash,)).fetchone()
+                if existing:
+                    conn.execute(_DEDUP_REFRESH_SQL, (now, existing["id"]))
+                    self._journal(existing["id"], "dedup_refresh")
+                    continue
+                mem_id = uuid.uuid4().hex[:12]
+                title = content[:80] + ("..." if len(content) > 80 else "")
+                rows.append((mem_id, content, chash, category, 0.7, now, now, title))
+                bloom.add(chash)
+                self._journal(
+                    mem_id, "insert",
+                    f"category={category} type=change sensitivity=public",
+                )
+            conn.executemany(
+                "INSERT INTO memories (id, content, content_hash, category, "
+                "importance, created_at, updated_at, title) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute(_DELETE_MANY_SQL, (json.dumps(archived_ids),))
+            self._commit(conn)
+
 
 # ---------------------------------------------------------------------------
 # MemoryTool -- LLM-callable Amplifier Tool
 # ---------------------------------------------------------------------------
 
 
+# search_memories result cache (see MemoryTool._cached_search)
+_SEARCH_CACHE_SIZE = 128
+_SEARCH_CACHE_TTL_S = 60.0
+
+# Built once and shared by every MemoryTool; treat as read-only.
+_INPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["operation"],
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": [
+                "store_memory",
+                "search_memories",
+                "list_memories",
+                "get_memory",
+                "update_memory",
+                "delete_memory",
+                "search_by_file",
+                "search_by_concept",
+                "get_timeline",
+                "purge_expired",
+                "store_fact",
+                "query_facts",
+                "delete_fact",
+                "summarize_old",
+            ],
+            "description": "The operation to perform.",
+        },
+        "content": {
+            "type": "string",
+            "description": "Memory content (for store_memory, update_memory).",
+        },
+        "category": {
+            "type": "string",
+            "description": "Category tag (for store_memory, update_memory).",
+        },
+        "importance": {
+            "type": "number",
+            "description": "Importance 0-1 (for store_memory, update_memory).",
+        },
+        "sensitivity": {
+            "type": "string",
+            "enum": ["public", "private", "secret"],
+            "description": "Sensitivity level (for store_memory, update_memory).",
+        },
+        "tags": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Tags (for store_memory, update_memory).",
+        },
+        "query": {
+            "type": "string",
+            "description": (
+                "Search query (for search_memories). 'id:<id>' or '#tag' "
+                "look up that memory or tag directly."
+            ),
+        },
+        "id": {
+            "type": "string",
+            "description": "Memory id (for get_memory / update_memory / delete_memory).",
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Max results (for search/list/query_facts/timeline).",
+        },
+        "offset": {
+            "type": "integer",
+            "description": "Offset (for list_memories).",
+        },
+        "cursor": {
+            "type": "string",
+            "description": (
+                "next_cursor from a previous list_memories page; "
+                "faster than offset for deep pages."
+            ),
+        },
+        "min_score": {
+            "type": "number",
+            "description": "Minimum score threshold (for search_memories).",
+        },
+        "ttl_days": {
+            "type": "number",
+            "description": (
+                "Time-to-live in days (for store_memory). "
+                "Memory expires and is excluded from search after this."
+            ),
+        },
+        # -- Rich metadata fields --
+        "title": {
+            "type": "string",
+            "description": "Short title for the memory (for store_memory, update_memory).",
+        },
+        "subtitle": {
+            "type": "string",
+            "description": (
+                "Secondary description (for store_memory, update_memory)."
+            ),
+        },
+        "type": {
+            "type": "string",
+            "enum": OBSERVATION_TYPES,
+            "description": (
+                "Observation type (for store_memory, update_memory, get_timeline). "
+                "One of: bugfix, feature, refactor, change, discovery, decision."
+            ),
+        },
+        "concepts": {
+            "type": "array",
+            "items": {"type": "string", "enum": CONCEPT_TYPES},
+            "description": (
+                "Concept tags (for store_memory, update_memory). "
+                "Values: how-it-works, why-it-exists, what-changed, "
+                "problem-solution, gotcha, pattern, trade-off."
+            ),
+        },
+        "files_read": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                "File paths read during this observation "
+                "(for store_memory, update_memory)."
+            ),
+        },
+        "files_modified": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": (
+                "File paths modified (for store_memory, update_memory)."
+            ),
+        },
+        "session_id": {
+            "type": "string",
+            "description": (
+                "Session identifier (for store_memory, get_timeline)."
+            ),
+        },
+        "project": {
+            "type": "string",
+            "description": (
+                "Project identifier (for store_memory, get_timeline)."
+            ),
+        },
+        "discovery_tokens": {
+            "type": "integer",
+            "description": (
+                "Estimated token cost of the discovery (for store_memory)."
+            ),
+        },
+        "file_path": {
+            "type": "string",
+            "description": "File path to search for (for search_by_file).",
+        },
+        "concept": {
+            "type": "string",
+            "enum": CONCEPT_TYPES,
+            "description": "Concept to search for (for search_by_concept).",
+        },
+        # -- Fact fields (unchanged) --
+        "subject": {
+            "type": "string",
+            "description": (
+                "Fact subject (for store_fact / query_facts)."
+            ),
+        },
+        "predicate": {
+            "type": "string",
+            "description": (
+                "Fact predicate (for store_fact / query_facts)."
+            ),
+        },
+        "object_value": {
+            "type": "string",
+            "description": (
+                "Fact object value (for store_fact / query_facts)."
+            ),
+        },
+        "confidence": {
+            "type": "number",
+            "description": (
+                "Confidence 0-1 for a fact triple (for store_fact)."
+            ),
+        },
+        "source_entry_id": {
+            "type": "string",
+            "description": (
+                "Memory id that sourced this fact (for store_fact)."
+            ),
+        },
+        "fact_id": {
+            "type": "string",
+            "description": "Fact id (for delete_fact).",
+        },
+        "min_confidence": {
+            "type": "number",
+            "description": (
+                "Minimum confidence filter (for query_facts)."
+            ),
+        },
+        "max_age_days": {
+            "type": "number",
+            "description": (
+                "Max age in days for summarize_old (default 30)."
+            ),
+        },
+    },
+}
+
+
+# Numeric tool-input fields and the type each is coerced to, once, on parse.
+_NUMERIC_INPUTS: dict[str, type] = {
+    "importance": float,
+    "trust": float,
+    "ttl_days": float,
+    "min_score": float,
+    "confidence": float,
+    "min_confidence": float,
+    "max_age_days": float,
+    "limit": int,
+    "offset": int,
+    "discovery_tokens": int,
+}
+
+
+@dataclass(slots=True)
+class _MemoryInput:
+    """Parsed tool input.  ``None`` means the caller did not supply the field."""
+
+    operation: str = ""
+    id: str | None = None
+    content: str | None = None
+    query: str | None = None
+    category: str | None = None
+    importance: float | None = None
+    trust: float | None = None
+    sensitivity: str | None = None
+    tags: list[str] | None = None
+    ttl_days: float | None = None
+    limit: int | None = None
+    offset: int | None = None
+    cursor: str | None = None
+    min_score: float | None = None
+    title: str | None = None
+    subtitle: str | None = None
+    type: str | None = None
+    concepts: list[str] | None = None
+    files_read: list[str] | None = None
+    files_modified: list[str] | None = None
+    session_id: str | None = None
+    project: str | None = None
+    discovery_tokens: int | None = None
+    file_path: str | None = None
+    concept: str | None = None
+    subject: str | None = None
+    predicate: str | None = None
+    object_value: str | None = None
+    confidence: float | None = None
+    source_entry_id: str | None = None
+    fact_id: str | None = None
+    min_confidence: float | None = None
+    max_age_days: float | None = None
+
+    @classmethod
+    def from_dict(cls, raw: dict[str, Any]) -> _MemoryInput:
+        """Build from raw tool input, coercing numeric fields.
+
+        Unknown keys are ignored.  Raises ``ValueError`` naming the field
+        when a numeric value cannot be coerced.
+        """
+        values: dict[str, Any] = {}
+        for name in cls.__slots__:
+            value = raw.get(name)
+            if value is None:
+                continue
+            coerce = _NUMERIC_INPUTS.get(name)
+            if coerce is not None:
+                try:
+                    value = coerce(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"invalid value for {name}: {value!r}") from None
+            values[name] = value
+        return cls(**values)
+
+
+def _given(value: Any, default: Any) -> Any:
+    """*value* unless the caller omitted it, else the operation's *default*."""
+    return default if value is None else value
+
+
 class MemoryTool:
     """Amplifier Tool wrapping MemoryStore for LLM use."""
 
     def __init__(self, store: MemoryStore) -> None:
         self._store = store
+        # (generation, query, limit, min_score) -> (monotonic time, results)
+        self._search_cache: OrderedDict[
+            tuple[Any, ...], tuple[float, list[dict[str, Any]]]
+        ] = OrderedDict()
+        # get_memory ids awaiting the next batched fetch; see _get_coalesced
+        self._pending_gets: dict[
+            str, list[asyncio.Future[dict[str, Any] | None]]
+        ] = {}
+        # operation name -> bound handler, so execute() is one dict lookup
+        self._ops: dict[str, Callable[[_MemoryInput], Awaitable[ToolResult]]] = {
+            "store_memory": self._op_store_memory,
+            "search_memories": self._op_search_memories,
+            "list_memories": self._op_list_memories,
+            "get_memory": self._op_get_memory,
+            "update_memory": self._op_update_memory,
+            "delete_memory": self._op_delete_memory,
+            "search_by_file": self._op_search_by_file,
+            "search_by_concept": self._op_search_by_concept,
+            "get_timeline": self._op_get_timeline,
+            "purge_expired": self._op_purge_expired,
+            "store_fact": self._op_store_fact,
+            "query_facts": self._op_query_facts,
+            "delete_fact": self._op_delete_fact,
+            "summarize_old": self._op_summarize_old,
+        }
 
     @property
     def name(self) -> str:
@@ -1261,457 +2375,420 @@ class MemoryTool:
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            "type": "object",
-            "required": ["operation"],
-            "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": [
-                        "store_memory",
-                        "search_memories",
-                        "list_memories",
-                        "get_memory",
-                        "update_memory",
-                        "delete_memory",
-                        "search_by_file",
-                        "search_by_concept",
-                        "get_timeline",
-                        "purge_expired",
-                        "store_fact",
-                        "query_facts",
-                        "delete_fact",
-                        "summarize_old",
-                    ],
-                    "description": "The operation to perform.",
-                },
-                "content": {
-                    "type": "string",
-                    "description": "Memory content (for store_memory, update_memory).",
-                },
-                "category": {
-                    "type": "string",
-                    "description": "Category tag (for store_memory, update_memory).",
-                },
-                "importance": {
-                    "type": "number",
-                    "description": "Importance 0-1 (for store_memory, update_memory).",
-                },
-                "sensitivity": {
-                    "type": "string",
-                    "enum": ["public", "private", "secret"],
-                    "description": "Sensitivity level (for store_memory, update_memory).",
-                },
-                "tags": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Tags (for store_memory, update_memory).",
-                },
-                "query": {
-                    "type": "string",
-                    "description": "Search query (for search_memories).",
-                },
-                "id": {
-                    "type": "string",
-                    "description": "Memory id (for get_memory / update_memory / delete_memory).",
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Max results (for search/list/query_facts/timeline).",
-                },
-                "offset": {
-                    "type": "integer",
-                    "description": "Offset (for list_memories).",
-                },
-                "min_score": {
-                    "type": "number",
-                    "description": "Minimum score threshold (for search_memories).",
-                },
-                "ttl_days": {
-                    "type": "number",
-                    "description": (
-                        "Time-to-live in days (for store_memory). "
-                        "Memory expires and is excluded from search after this."
-                    ),
-                },
-                # -- Rich metadata fields --
-                "title": {
-                    "type": "string",
-                    "description": "Short title for the memory (for store_memory, update_memory).",
-                },
-                "subtitle": {
-                    "type": "string",
-                    "description": (
-                        "Secondary description (for store_memory, update_memory)."
-                    ),
-                },
-                "type": {
-                    "type": "string",
-                    "enum": OBSERVATION_TYPES,
-                    "description": (
-                        "Observation type (for store_memory, update_memory, get_timeline). "
-                        "One of: bugfix, feature, refactor, change, discovery, decision."
-                    ),
-                },
-                "concepts": {
-                    "type": "array",
-                    "items": {"type": "string", "enum": CONCEPT_TYPES},
-                    "description": (
-                        "Concept tags (for store_memory, update_memory). "
-                        "Values: how-it-works, why-it-exists, what-changed, "
-                        "problem-solution, gotcha, pattern, trade-off."
-                    ),
-                },
-                "files_read": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": (
-                        "File paths read during this observation "
-                        "(for store_memory, update_memory)."
-                    ),
-                },
-                "files_modified": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": (
-                        "File paths modified (for store_memory, update_memory)."
-                    ),
-                },
-                "session_id": {
-                    "type": "string",
-                    "description": (
-                        "Session identifier (for store_memory, get_timeline)."
-                    ),
-                },
-                "project": {
-                    "type": "string",
-                    "description": (
-                        "Project identifier (for store_memory, get_timeline)."
-                    ),
-                },
-                "discovery_tokens": {
-                    "type": "integer",
-                    "description": (
-                        "Estimated token cost of the discovery (for store_memory)."
-                    ),
-                },
-                "file_path": {
-                    "type": "string",
-                    "description": "File path to search for (for search_by_file).",
-                },
-                "concept": {
-                    "type": "string",
-                    "enum": CONCEPT_TYPES,
-                    "description": "Concept to search for (for search_by_concept).",
-                },
-                # -- Fact fields (unchanged) --
-                "subject": {
-                    "type": "string",
-                    "description": (
-                        "Fact subject (for store_fact / query_facts)."
-                    ),
-                },
-                "predicate": {
-                    "type": "string",
-                    "description": (
-                        "Fact predicate (for store_fact / query_facts)."
-                    ),
-                },
-                "object_value": {
-                    "type": "string",
-                    "description": (
-                        "Fact object value (for store_fact / query_facts)."
-                    ),
-                },
-                "confidence": {
-                    "type": "number",
-                    "description": (
-                        "Confidence 0-1 for a fact triple (for store_fact)."
-                    ),
-                },
-                "source_entry_id": {
-                    "type": "string",
-                    "description": (
-                        "Memory id that sourced this fact (for store_fact)."
-                    ),
-                },
-                "fact_id": {
-                    "type": "string",
-                    "description": "Fact id (for delete_fact).",
-                },
-                "min_confidence": {
-                    "type": "number",
-                    "description": (
-                        "Minimum confidence filter (for query_facts)."
-                    ),
-                },
-                "max_age_days": {
-                    "type": "number",
-                    "description": (
-                        "Max age in days for summarize_old (default 30)."
-                    ),
-                },
-            },
-        }
+        return _INPUT_SCHEMA
 
     async def execute(self, input: dict[str, Any]) -> ToolResult:  # noqa: A002
         """Execute a memory operation.  Returns ``ToolResult`` per protocol."""
         op = input.get("operation", "")
-
+        handler = self._ops.get(op)
+        if handler is None:
+            return ToolResult(
+                success=False,
+                error={"message": f"unknown operation: {op}"},
+            )
         try:
-            if op == "store_memory":
-                content = input.get("content", "")
-                if not content:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "content is required for store_memory"},
-                    )
-                mem_id = self._store.store(
-                    content=content,
-                    category=input.get("category", "general"),
-                    importance=float(input.get("importance", 0.5)),
-                    sensitivity=input.get("sensitivity", "public"),
-                    tags=input.get("tags"),
-                    ttl_days=input.get("ttl_days"),
-                    title=input.get("title", ""),
-                    subtitle=input.get("subtitle", ""),
-                    type=input.get("type", "change"),
-                    concepts=input.get("concepts"),
-                    files_read=input.get("files_read"),
-                    files_modified=input.get("files_modified"),
-                    session_id=input.get("session_id"),
-                    project=input.get("project"),
-                    discovery_tokens=int(input.get("discovery_tokens", 0)),
-                )
-                return ToolResult(
-                    success=True, output={"id": mem_id, "status": "stored"}
-                )
+            args = _MemoryInput.from_dict(input)
+        except ValueError as exc:
+            return ToolResult(success=False, error={"message": str(exc)})
+        try:
+            return await handler(args)
+        except Exception:
+            logger.exception("Unexpected error in memory tool")
+            return ToolResult(
+                success=False,
+                error={"message": "An internal error occurred. Check logs."},
+            )
 
-            if op == "search_memories":
-                query = input.get("query", "")
-                if not query:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "query is required for search_memories"},
-                    )
-                limit = int(input.get("limit", 10))
-                min_score = float(input.get("min_score", 0.0))
-                scoring = {"min_score": min_score} if min_score else None
-                results = self._store.search_v2(query, limit=limit, scoring=scoring)
-                return ToolResult(
-                    success=True,
-                    output={"results": results, "count": len(results)},
-                )
+    # -- Operation handlers (``args`` is the parsed tool input) -------------
 
-            if op == "list_memories":
-                limit = int(input.get("limit", 100))
-                offset = int(input.get("offset", 0))
-                memories = self._store.list_all(limit=limit, offset=offset)
-                total = self._store.count()
-                return ToolResult(
-                    success=True, output={"memories": memories, "total": total}
-                )
+    async def _op_store_memory(self, args: _MemoryInput) -> ToolResult:
+        content = args.content
+        if not content:
+            return ToolResult(
+                success=False,
+                error={"message": "content is required for store_memory"},
+            )
+        mem_id = await asyncio.to_thread(
+            self._store.store,
+            content=content,
+            category=_given(args.category, "general"),
+            importance=_given(args.importance, 0.5),
+            sensitivity=_given(args.sensitivity, "public"),
+            tags=args.tags,
+            ttl_days=args.ttl_days,
+            title=_given(args.title, ""),
+            subtitle=_given(args.subtitle, ""),
+            type=_given(args.type, "change"),
+            concepts=args.concepts,
+            files_read=args.files_read,
+            files_modified=args.files_modified,
+            session_id=args.session_id,
+            project=args.project,
+            discovery_tokens=_given(args.discovery_tokens, 0),
+        )
+        return ToolResult(
+            success=True, output={"id": mem_id, "status": "stored"}
+        )
 
-            if op == "get_memory":
-                mem_id = input.get("id", "")
-                if not mem_id:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "id is required for get_memory"},
-                    )
-                records = self._store.get([mem_id], _increment_access=True)
-                if not records:
-                    return ToolResult(
-                        success=False,
-                        error={"message": f"memory {mem_id} not found"},
-                    )
-                return ToolResult(success=True, output=records[0])
-
-            if op == "update_memory":
-                mem_id = input.get("id", "")
-                if not mem_id:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "id is required for update_memory"},
-                    )
-                importance_raw = input.get("importance")
-                trust_raw = input.get("trust")
-                updated = self._store.update(
-                    mem_id,
-                    content=input.get("content"),
-                    title=input.get("title"),
-                    subtitle=input.get("subtitle"),
-                    type=input.get("type"),
-                    concepts=input.get("concepts"),
-                    files_read=input.get("files_read"),
-                    files_modified=input.get("files_modified"),
-                    category=input.get("category"),
-                    importance=float(importance_raw) if importance_raw is not None else None,
-                    tags=input.get("tags"),
-                    sensitivity=input.get("sensitivity"),
-                    trust=float(trust_raw) if trust_raw is not None else None,
-                )
-                if updated is None:
-                    return ToolResult(
-                        success=False,
-                        error={"message": f"memory {mem_id} not found"},
-                    )
-                return ToolResult(
-                    success=True,
-                    output={"memory": updated, "status": "updated"},
-                )
+    async def _op_search_memories(self, args: _MemoryInput) -> ToolResult:
+        # Search is case-insensitive and keyword based, so normalizing here
+        # only makes "Foo  bar " and "foo bar" share a cache entry.
+        query = " ".join((args.query or "").lower().split())
+        if not query:
+            return ToolResult(
+                success=False,
+                error={"message": "query is required for search_memories"},
+            )
+        limit = _given(args.limit, 10)
+        min_score = _given(args.min_score, 0.0)
+        results = await asyncio.to_thread(
+            self._store.search_literal, query, limit=limit
+        )
+        if results is None:
+            results = await self._cached_search(query, limit, min_score)
+        return ToolResult(
+            success=True,
+            output={"results": results, "count": len(results)},
+        )
 
-            if op == "delete_memory":
-                mem_id = input.get("id", "")
-                if not mem_id:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "id is required for delete_memory"},
-                    )
-                deleted = self._store.delete(mem_id)
-                return ToolResult(success=True, output={"deleted": deleted})
-
-            if op == "search_by_file":
-                file_path = input.get("file_path", "")
-                if not file_path:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "file_path is required for search_by_file"},
-                    )
-                results = self._store.search_by_file(
-                    file_path, limit=int(input.get("limit", 10))
-                )
-                return ToolResult(
-                    success=True,
-                    output={
-                        "file_path": file_path,
-                        "results": results,
-                        "count": len(results),
-                    },
-                )
+    async def _cached_search(
+        self, query: str, limit: int, min_score: float
+    ) -> list[dict[str, Any]]:
+        """``search_v2`` behind a small LRU, invalidated by any store write.
 
-            if op == "search_by_concept":
-                concept = input.get("concept", "")
-                if not concept:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "concept is required for search_by_concept"},
-                    )
-                results = self._store.search_by_concept(
-                    concept, limit=int(input.get("limit", 10))
+        Entries also expire after ``_SEARCH_CACHE_TTL_S`` so recency scores
+        and TTL expiry cannot go stale.  Hits still count as an access.
+        The cache is only touched on the event loop thread.
+        """
+        generation = await asyncio.to_thread(self._store.search_generation)
+        key = (generation, query, limit, min_score)
+        now = time.monotonic()
+        cached = self._search_cache.get(key)
+        if cached is not None and now - cached[0] < _SEARCH_CACHE_TTL_S:
+            self._search_cache.move_to_end(key)
+            results = cached[1]
+            if results:
+                await asyncio.to_thread(
+                    self._store._record_access, [r["id"] for r in results]
                 )
+        else:
+            scoring = {"min_score": min_score} if min_score else None
+            results = await asyncio.to_thread(
+                self._store.search_v2, query, limit=limit, scoring=scoring
+            )
+            self._search_cache[key] = (now, results)
+            if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        # Callers get their own dicts; the cached ones stay pristine
+        return [dict(r) for r in results]
+
+    async def _op_list_memories(self, args: _MemoryInput) -> ToolResult:
+        limit = _given(args.limit, 100)
+        offset = _given(args.offset, 0)
+        after = None
+        if args.cursor:
+            try:
+                updated_at, mem_id = json.loads(args.cursor)
+            except (TypeError, ValueError):
                 return ToolResult(
-                    success=True,
-                    output={
-                        "concept": concept,
-                        "results": results,
-                        "count": len(results),
-                    },
+                    success=False,
+                    error={"message": f"invalid cursor: {args.cursor!r}"},
                 )
+            after = (str(updated_at), str(mem_id))
+        memories = await asyncio.to_thread(
+            self._store.list_all, limit=limit, offset=offset, after=after
+        )
+        total = await asyncio.to_thread(self._store.count)
+        next_cursor = None
+        if memories and len(memories) == limit:
+            last = memories[-1]
+            next_cursor = json.dumps([last["updated_at"], last["id"]])
+        return ToolResult(
+            success=True,
+            output={
+                "memories": memories,
+                "total": total,
+                "next_cursor": next_cursor,
+            },
+        )
 
-            if op == "get_timeline":
-                results = self._store.get_timeline(
-                    limit=int(input.get("limit", 50)),
-                    type=input.get("type"),
-                    project=input.get("project"),
-                    session_id=input.get("session_id"),
-                )
-                return ToolResult(
-                    success=True,
-                    output={"memories": results, "count": len(results)},
-                )
+    async def _op_get_memory(self, args: _MemoryInput) -> ToolResult:
+        mem_id = args.id
+        if not mem_id:
+            return ToolResult(
+                success=False,
+                error={"message": "id is required for get_memory"},
+            )
+        record = await self._get_coalesced(mem_id)
+        if record is None:
+            return ToolResult(
+                success=False,
+                error={"message": f"memory {mem_id} not found"},
+            )
+        return ToolResult(success=True, output=record)
 
-            if op == "purge_expired":
-                count = self._store.purge_expired()
-                return ToolResult(
-                    success=True, output={"purged": count}
-                )
+    def _get_coalesced(self, mem_id: str) -> asyncio.Future[dict[str, Any] | None]:
+        """Queue *mem_id* for the next batched ``get`` on this event loop.
 
-            # -- Fact operations ------------------------------------------------
-
-            if op == "store_fact":
-                subject = input.get("subject", "")
-                predicate = input.get("predicate", "")
-                obj = input.get("object_value", "")
-                if not subject or not predicate or not obj:
-                    return ToolResult(
-                        success=False,
-                        error={
-                            "message": (
-                                "subject, predicate, and object_value are "
-                                "required for store_fact"
-                            )
-                        },
-                    )
-                fact_id = self._store.store_fact(
-                    subject=subject,
-                    predicate=predicate,
-                    object_value=obj,
-                    confidence=float(input.get("confidence", 1.0)),
-                    source_entry_id=input.get("source_entry_id"),
-                )
-                return ToolResult(
-                    success=True, output={"fact_id": fact_id, "status": "stored"}
-                )
+        Concurrent ``get_memory`` calls issued in the same loop iteration
+        (e.g. parallel tool calls) share one ``store.get`` query.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any] | None] = loop.create_future()
+        if not self._pending_gets:
+            loop.call_soon(self._flush_gets)
+        self._pending_gets.setdefault(mem_id, []).append(future)
+        return future
+
+    def _flush_gets(self) -> None:
+        pending, self._pending_gets = self._pending_gets, {}
+        fetch = asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self._store.get, list(pending), _increment_access=True
+            ),
+        )
+        fetch.add_done_callback(functools.partial(self._resolve_gets, pending))
 
-            if op == "query_facts":
-                facts = self._store.query_facts(
-                    subject=input.get("subject"),
-                    predicate=input.get("predicate"),
-                    object_value=input.get("object_value"),
-                    min_confidence=float(input.get("min_confidence", 0.0)),
-                    limit=int(input.get("limit", 50)),
-                )
-                return ToolResult(
-                    success=True,
-                    output={"facts": facts, "count": len(facts)},
-                )
+    @staticmethod
+    def _resolve_gets(
+        pending: dict[str, list[asyncio.Future[dict[str, Any] | None]]],
+        fetch: asyncio.Future[list[dict[str, Any]]],
+    ) -> None:
+        if fetch.cancelled():
+            # e.g. the executor shut down; waiters must not hang forever
+            for futures in pending.values():
+                for future in futures:
+                    future.cancel()
+            return
+        try:
+            records = {r["id"]: r for r in fetch.result()}
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+        for mem_id, futures in pending.items():
+            record = records.get(mem_id)
+            for future in futures:
+                if not future.done():
+                    future.set_result(None if record is None else dict(record))
+
+    async def _op_update_memory(self, args: _MemoryInput) -> ToolResult:
+        mem_id = args.id
+        if not mem_id:
+            return ToolResult(
+                success=False,
+                error={"message": "id is required for update_memory"},
+            )
+        updated = await asyncio.to_thread(
+            self._store.update,
+            mem_id,
+            content=args.content,
+            title=args.title,
+            subtitle=args.subtitle,
+            type=args.type,
+            concepts=args.concepts,
+            files_read=args.files_read,
+            files_modified=args.files_modified,
+            category=args.category,
+            importance=args.importance,
+            tags=args.tags,
+            sensitivity=args.sensitivity,
+            trust=args.trust,
+        )
+        if updated is None:
+            return ToolResult(
+                success=False,
+                error={"message": f"memory {mem_id} not found"},
+            )
+        return ToolResult(
+            success=True,
+            output={"memory": updated, "status": "updated"},
+        )
 
-            if op == "delete_fact":
-                fact_id = input.get("fact_id", "")
-                if not fact_id:
-                    return ToolResult(
-                        success=False,
-                        error={"message": "fact_id is required for delete_fact"},
-                    )
-                deleted = self._store.delete_fact(fact_id)
-                return ToolResult(success=True, output={"deleted": deleted})
+    async def _op_delete_memory(self, args: _MemoryInput) -> ToolResult:
+        mem_id = args.id
+        if not mem_id:
+            return ToolResult(
+                success=False,
+                error={"message": "id is required for delete_memory"},
+            )
+        deleted = await asyncio.to_thread(self._store.delete, mem_id)
+        return ToolResult(success=True, output={"deleted": deleted})
 
-            # -- Summarization --------------------------------------------------
+    async def _op_search_by_file(self, args: _MemoryInput) -> ToolResult:
+        file_path = args.file_path
+        if not file_path:
+            return ToolResult(
+                success=False,
+                error={"message": "file_path is required for search_by_file"},
+            )
+        results = await asyncio.to_thread(
+            self._store.search_by_file,
+            file_path,
+            limit=_given(args.limit, 10),
+        )
+        return ToolResult(
+            success=True,
+            output={
+                "file_path": file_path,
+                "results": results,
+                "count": len(results),
+            },
+        )
 
-            if op == "summarize_old":
-                stats = self._store.summarize_old(
-                    max_age_days=float(input.get("max_age_days", 30)),
-                    max_memories=int(input.get("limit", 5)),
-                )
-                return ToolResult(success=True, output=stats)
+    async def _op_search_by_concept(self, args: _MemoryInput) -> ToolResult:
+        concept = args.concept
+        if not concept:
+            return ToolResult(
+                success=False,
+                error={"message": "concept is required for search_by_concept"},
+            )
+        results = await asyncio.to_thread(
+            self._store.search_by_concept,
+            concept,
+            limit=_given(args.limit, 10),
+        )
+        return ToolResult(
+            success=True,
+            output={
+                "concept": concept,
+                "results": results,
+                "count": len(results),
+            },
+        )
+
+    async def _op_get_timeline(self, args: _MemoryInput) -> ToolResult:
+        results = await asyncio.to_thread(
+            self._store.get_timeline,
+            limit=_given(args.limit, 50),
+            type=args.type,
+            project=args.project,
+            session_id=args.session_id,
+        )
+        return ToolResult(
+            success=True,
+            output={"memories": results, "count": len(results)},
+        )
 
+    async def _op_purge_expired(self, args: _MemoryInput) -> ToolResult:
+        count = await asyncio.to_thread(self._store.purge_expired)
+        return ToolResult(
+            success=True, output={"purged": count}
+        )
+
+    # -- Fact operations -----------------------------------------------------
+
+    async def _op_store_fact(self, args: _MemoryInput) -> ToolResult:
+        subject = args.subject
+        predicate = args.predicate
+        obj = args.object_value
+        if not subject or not predicate or not obj:
             return ToolResult(
                 success=False,
-                error={"message": f"unknown operation: {op}"},
+                error={
+                    "message": (
+                        "subject, predicate, and object_value are "
+                        "required for store_fact"
+                    )
+                },
             )
-        except Exception:
-            logger.exception("Unexpected error in memory tool")
+        fact_id = await asyncio.to_thread(
+            self._store.store_fact,
+            subject=subject,
+            predicate=predicate,
+            object_value=obj,
+            confidence=_given(args.confidence, 1.0),
+            source_entry_id=args.source_entry_id,
+        )
+        return ToolResult(
+            success=True, output={"fact_id": fact_id, "status": "stored"}
+        )
+
+    async def _op_query_facts(self, args: _MemoryInput) -> ToolResult:
+        facts = await asyncio.to_thread(
+            self._store.query_facts,
+            subject=args.subject,
+            predicate=args.predicate,
+            object_value=args.object_value,
+            min_confidence=_given(args.min_confidence, 0.0),
+            limit=_given(args.limit, 50),
+        )
+        return ToolResult(
+            success=True,
+            output={"facts": facts, "count": len(facts)},
+        )
+
+    async def _op_delete_fact(self, args: _MemoryInput) -> ToolResult:
+        fact_id = args.fact_id
+        if not fact_id:
             return ToolResult(
                 success=False,
-                error={"message": "An internal error occurred. Check logs."},
+                error={"message": "fact_id is required for delete_fact"},
             )
+        deleted = await asyncio.to_thread(self._store.delete_fact, fact_id)
+        return ToolResult(success=True, output={"deleted": deleted})
+
+    # -- Summarization -------------------------------------------------------
+
+    async def _op_summarize_old(self, args: _MemoryInput) -> ToolResult:
+        stats = await asyncio.to_thread(
+            self._store.summarize_old,
+            max_age_days=_given(args.max_age_days, 30.0),
+            max_memories=_given(args.limit, 5),
+        )
+        return ToolResult(success=True, output=stats)
 
 
 # ---------------------------------------------------------------------------
 # Module entry point
 # ---------------------------------------------------------------------------
 
+# Seconds between background purges when ``ttl_autopurge`` is enabled
+_DEFAULT_TTL_RESOLUTION_S = 60.0
+
+
+async def _ttl_sweeper(store: MemoryStore, interval: float) -> None:
+    """Purge expired memories every *interval* seconds until cancelled.
+
+    Expired rows are already hidden from search, timeline and listing, so
+    this only reclaims space -- off the tool call path.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(store.purge_expired)
+        except Exception:
+            logger.debug("Background TTL purge failed", exc_info=True)
 
-async def mount(coordinator: Any, config: dict[str, Any] | None = None) -> None:
-    """Mount tool-memory-store: register as Tool and as memory.store capability."""
+
+async def mount(coordinator: Any, config: dict[str, Any] | None = None) -> Any:
+    """Mount tool-memory-store: register as Tool and as memory.store capability.
+
+    With ``ttl_autopurge`` set, expired memories are also purged in the
+    background every ``ttl_resolution_s`` seconds (default 60).
+
+    Returns a cleanup callable that stops the purger and closes the store's
+    pooled connections.
+    """
     cfg = config or {}
     db_path = Path(cfg.get("db_path", "~/.letsgo/memories.db")).expanduser()
     max_memories = int(cfg.get("max_memories", 0))
 
-    store = MemoryStore(db_path, max_memories=max_memories)
+    store = MemoryStore(
+        db_path,
+        max_memories=max_memories,
+        read_pool_size=int(cfg.get("read_pool_size", _DEFAULT_READ_POOL_SIZE)),
+    )
     tool = MemoryTool(store)
 
+    sweeper: asyncio.Task[None] | None = None
+    if cfg.get("ttl_autopurge"):
+        interval = float(cfg.get("ttl_resolution_s", _DEFAULT_TTL_RESOLUTION_S))
+        sweeper = asyncio.create_task(_ttl_sweeper(store, interval))
+
     # Register as Tool (LLM-callable)
     await coordinator.mount("tools", tool, name="tool-memory-store")
 
@@ -1723,3 +2800,11 @@ async def mount(coordinator: Any, config: dict[str, Any] | None = None) -> None:
         db_path,
         max_memories if max_memories > 0 else "unlimited",
     )
+
+    def cleanup() -> None:
+        if sweeper is not None:
+            sweeper.cancel()
+        store.close()
+        logger.info("tool-memory-store unmounted")
+
+    return cleanup
@@ -6,16 +6,24 @@ eviction, journal, rich metadata, access tracking, and public scoring API.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from amplifier_module_tool_memory_store import MemoryStore
+from amplifier_module_tool_memory_store import (
+    MemoryStore,
+    _compute_score,
+    _ScoringConfig,
+    _update_sql,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -84,6 +92,42 @@ class TestUpdate:
 
         assert hash_before != hash_after
 
+    def test_legacy_content_hashes_are_rehashed_on_open(
+        self, tmp_path: Path
+    ) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Content hashed by an older release")
+        store.close()
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute(
+            "UPDATE memories SET content_hash = ? WHERE id = ?",
+            (hashlib.sha256(b"Content hashed by an older release").hexdigest(), mem_id),
+        )
+        # Databases from older releases predate the migration marker
+        conn.execute("DELETE FROM schema_meta WHERE key = 'content_hash_size'")
+        conn.commit()
+        conn.close()
+
+        store = _make_store(tmp_path)
+
+        assert len(store.get([mem_id])[0]["content_hash"]) == 40
+        assert store.store("Content hashed by an older release") == mem_id
+
+    def test_content_hash_migration_runs_once(self, tmp_path: Path) -> None:
+        _make_store(tmp_path).close()
+        statements: list[str] = []
+        real_connect = sqlite3.connect
+
+        def traced_connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+            conn = real_connect(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with patch("sqlite3.connect", traced_connect):
+            _make_store(tmp_path)
+
+        assert not any("_content_hash(content)" in sql for sql in statements)
+
     def test_update_partial_fields(self, tmp_path: Path) -> None:
         """Updating only some fields should leave others unchanged."""
         store = _make_store(tmp_path)
@@ -117,6 +161,33 @@ class TestUpdate:
         rec = store.get([mem_id])[0]
         assert rec["importance"] == 0.0
 
+    def test_update_reuses_sql_per_field_set(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        first = store.store("Field set one")
+        second = store.store("Field set two")
+        _update_sql.cache_clear()
+
+        store.update(first, title="a", importance=0.9)
+        store.update(second, title="b", importance=0.1)
+        store.update(first, tags=["x"])
+
+        info = _update_sql.cache_info()
+        assert (info.misses, info.hits) == (2, 1)
+        assert store.get([second])[0]["title"] == "b"
+
+    def test_search_generation_does_not_wait_for_writes(
+        self, tmp_path: Path
+    ) -> None:
+        store = _make_store(tmp_path)
+        before = store.search_generation()
+
+        # Returns immediately, from another thread, while a write is in flight
+        with store._write_lock, ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(store.search_generation).result(timeout=5) == before
+
+        store.store("Bumps the generation")
+        assert store.search_generation() != before
+
 
 # ===========================================================================
 # Fact store tests
@@ -162,6 +233,44 @@ class TestFacts:
         assert len(results) == 1
         assert results[0]["confidence"] == 0.95
 
+    def test_store_facts_batch(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        store.store_fact("Python", "version", "3.12", confidence=0.8)
+
+        written = store.store_facts(
+            [
+                ("Python", "version", "3.12", 0.95),
+                ("Python", "is_a", "language", 1.0),
+            ],
+            source_entry_id="mem-1",
+        )
+
+        assert written == 2
+        facts = {f["predicate"]: f for f in store.query_facts(subject="Python")}
+        assert len(facts) == 2
+        assert facts["version"]["confidence"] == 0.95
+        assert facts["is_a"]["source_entry_id"] == "mem-1"
+        assert store.store_facts([]) == 0
+
+    def test_duplicate_facts_are_collapsed_on_open(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        store.store_fact("Python", "version", "3.12")
+        store.close()
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute("DROP INDEX idx_facts_spo")
+        conn.execute(
+            "INSERT INTO facts (id, subject, predicate, object, created_at, "
+            "updated_at) VALUES ('dupe', 'Python', 'version', '3.12', '', '')"
+        )
+        conn.commit()
+        conn.close()
+
+        store = _make_store(tmp_path)
+
+        assert len(store.query_facts(subject="Python")) == 1
+        store.store_fact("Python", "version", "3.12", confidence=0.5)
+        assert store.query_facts(subject="Python")[0]["confidence"] == 0.5
+
     def test_delete_fact(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
         fact_id = store.store_fact("Rust", "has", "borrow_checker")
@@ -198,6 +307,28 @@ class TestFacts:
         assert len(results) == 1
         assert results[0]["source_entry_id"] == mem_id
 
+    @pytest.mark.parametrize(
+        ("where", "index"),
+        [
+            ("subject = ?", "idx_facts_spo"),
+            ("predicate = ?", "idx_facts_pos"),
+            ("object = ?", "idx_facts_osp"),
+            ("predicate = ? AND object = ?", "idx_facts_pos"),
+        ],
+    )
+    def test_fact_patterns_use_an_index(
+        self, tmp_path: Path, where: str, index: str
+    ) -> None:
+        store = _make_store(tmp_path)
+        store.close()
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM facts WHERE {where}",
+            ("x",) * where.count("?"),
+        ).fetchall()
+        conn.close()
+        assert any(index in row[-1] for row in plan)
+
 
 # ===========================================================================
 # File and concept search tests
@@ -252,6 +383,57 @@ class TestFileAndConceptSearch:
         results_none = store.search_by_concept("nonexistent-concept")
         assert len(results_none) == 0
 
+    def test_links_follow_update_and_delete(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store(
+            "Touched both sides", files_read=["a.py"], files_modified=["a.py"]
+        )
+        assert [r["id"] for r in store.search_by_file("A.py")] == [mem_id]
+
+        store.update(mem_id, files_read=["b.py"], files_modified=[], concepts=["x"])
+        assert store.search_by_file("a.py") == []
+        assert [r["id"] for r in store.search_by_file("b.py")] == [mem_id]
+        assert [r["id"] for r in store.search_by_concept("X")] == [mem_id]
+
+        store.delete(mem_id)
+        assert store.search_by_file("b.py") == []
+        assert store.search_by_concept("x") == []
+
+    def test_links_are_backfilled_for_existing_rows(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Legacy row", files_read=["old.py"], concepts=["gotcha"])
+        store.close()
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.executescript(
+            "DROP TABLE memory_files; DROP TABLE memory_concepts; "
+            "DELETE FROM schema_meta WHERE key = 'links_version';"
+        )
+        conn.close()
+
+        store = _make_store(tmp_path)
+        assert [r["id"] for r in store.search_by_file("old.py")] == [mem_id]
+        assert [r["id"] for r in store.search_by_concept("gotcha")] == [mem_id]
+
+    @pytest.mark.parametrize(
+        ("table", "column"),
+        [("memory_files", "file_path"), ("memory_concepts", "concept")],
+    )
+    def test_link_lookups_use_an_index(
+        self, tmp_path: Path, table: str, column: str
+    ) -> None:
+        _make_store(tmp_path)
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        plan = " ".join(
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM memories WHERE id IN "
+                f"(SELECT memory_id FROM {table} WHERE {column} = ?)",
+                ("x",),
+            )
+        )
+        conn.close()
+        assert "SCAN" not in plan
+
 
 # ===========================================================================
 # Timeline tests
@@ -318,6 +500,101 @@ class TestTimeline:
         assert len(timeline) == 1
         assert timeline[0]["id"] != mem_id
 
+    @pytest.mark.parametrize(
+        "where",
+        ["", "AND type = ? ", "AND project = ? ", "AND session_id = ? "],
+    )
+    def test_timeline_reads_in_index_order(self, tmp_path: Path, where: str) -> None:
+        _make_store(tmp_path)
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        plan = [
+            row[3]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM memories "
+                f"WHERE (expires_epoch IS NULL OR expires_epoch > ?) {where}"
+                "ORDER BY created_at DESC LIMIT ?",
+                (0, "x", 5) if where else (0, 5),
+            )
+        ]
+        conn.close()
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+
+# ===========================================================================
+# Epoch timestamp tests
+# ===========================================================================
+
+
+class TestEpochTimestamps:
+    """Expiry and recency use the generated integer epoch columns."""
+
+    def test_expiry_respects_utc_offsets(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Offset expiry memory")
+        # One hour from now, written in UTC-05:00 -- sorts *before* the
+        # current UTC time as a string, but has not passed.
+        later = datetime.now(timezone(timedelta(hours=-5))) + timedelta(hours=1)
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute(
+            "UPDATE memories SET expires_at = ? WHERE id = ?",
+            (later.isoformat(), mem_id),
+        )
+        conn.commit()
+        conn.close()
+
+        assert store.purge_expired() == 0
+        assert [m["id"] for m in store.get_timeline()] == [mem_id]
+
+    def test_pre_epoch_database_is_migrated(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test_memories.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript(
+            # Schema as written before the epoch columns existed
+            "CREATE TABLE memories (id TEXT PRIMARY KEY, content TEXT NOT NULL, "
+            "content_hash TEXT NOT NULL DEFAULT '', category TEXT DEFAULT 'general', "
+            "importance REAL DEFAULT 0.5, trust REAL DEFAULT 0.5, "
+            "sensitivity TEXT DEFAULT 'public', tags TEXT DEFAULT '', "
+            "created_at TEXT NOT NULL, updated_at TEXT NOT NULL, "
+            "expires_at TEXT DEFAULT NULL, title TEXT DEFAULT '', "
+            "subtitle TEXT DEFAULT '', type TEXT DEFAULT 'change', "
+            "concepts TEXT DEFAULT '[]', files_read TEXT DEFAULT '[]', "
+            "files_modified TEXT DEFAULT '[]', session_id TEXT DEFAULT NULL, "
+            "project TEXT DEFAULT NULL, accessed_count INTEGER DEFAULT 0, "
+            "discovery_tokens INTEGER DEFAULT 0);"
+            "CREATE INDEX idx_memories_expires_at ON memories(expires_at);"
+            "CREATE INDEX idx_memories_session_id ON memories(session_id);"
+            "CREATE INDEX idx_memories_project ON memories(project);"
+            "INSERT INTO memories (id, content, created_at, updated_at, expires_at) "
+            "VALUES ('old', 'legacy row', '2020-01-01T00:00:00+00:00', "
+            "'2020-01-01T00:00:00+00:00', '2021-01-01T00:00:00+00:00');"
+        )
+        conn.close()
+
+        store = _make_store(tmp_path)
+        conn = sqlite3.connect(str(db_path))
+
+        # Row counter seeded from the existing rows; count() skips expired ones
+        total_sql = "SELECT value FROM memory_stats WHERE key = 'total'"
+        assert conn.execute(total_sql).fetchone()[0] == 1
+        assert store.count() == 0
+        assert store.purge_expired() == 1
+        assert conn.execute(total_sql).fetchone()[0] == 0
+        indexes = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        conn.close()
+        assert "idx_memories_ttl" in indexes
+        assert "idx_memories_expires_at" not in indexes
+        # Full session/project indexes are swapped for partial ones
+        assert {
+            "idx_memories_session_created",
+            "idx_memories_project_created",
+        } <= indexes
+        assert not {"idx_memories_session_id", "idx_memories_project"} & indexes
+
 
 # ===========================================================================
 # Summarize old tests
@@ -358,6 +635,39 @@ class TestSummarizeOld:
         # Total count should have decreased (originals removed, summary added)
         assert store.count() < initial_count
 
+    def test_summarize_old_multiple_categories(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        old_ids = []
+        for category in ("alpha", "beta"):
+            for i in range(3):
+                mid = store.store(f"{category} note {i}", category=category)
+                _age_memory(tmp_path, mid, days=45)
+                old_ids.append(mid)
+
+        stats = store.summarize_old(max_age_days=30, max_memories=2)
+
+        assert stats == {
+            "categories_summarized": 2,
+            "memories_archived": 6,
+            "summaries_created": 2,
+        }
+        assert store.get(old_ids) == []
+        summaries = {m["category"]: m for m in store.list_all()}
+        assert set(summaries) == {"alpha/summary", "beta/summary"}
+        alpha = store.get([summaries["alpha/summary"]["id"]])[0]
+        assert alpha["content"] == "alpha note 0; alpha note 1; alpha note 2"
+        assert alpha["importance"] == 0.7
+        assert alpha["title"] == alpha["content"]
+
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        journaled = conn.execute(
+            "SELECT COUNT(*) FROM memory_journal WHERE operation = 'insert' "
+            "AND memory_id IN (?, ?)",
+            tuple(m["id"] for m in summaries.values()),
+        ).fetchone()[0]
+        conn.close()
+        assert journaled == 2
+
 
 # ===========================================================================
 # Eviction tests
@@ -412,6 +722,20 @@ class TestJournal:
         assert "update" in operations
         assert "delete" in operations
 
+    def test_rolled_back_journal_entries_are_dropped(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        with store._write_lock, store._rw_connection():
+            store._journal("ghost", "insert")  # never committed
+
+        mem_id = store.store("Journal rollback test content")
+
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        rows = conn.execute(
+            "SELECT memory_id, operation FROM memory_journal ORDER BY seq"
+        ).fetchall()
+        conn.close()
+        assert rows == [(mem_id, "insert")]
+
 
 # ===========================================================================
 # Rich metadata tests
@@ -522,11 +846,27 @@ class TestPublicScoringAPI:
         assert "how" not in keywords
         assert "the" not in keywords
 
+    def test_extract_keywords_strips_punctuation_and_dedupes(self) -> None:
+        keywords = MemoryStore.extract_keywords(
+            '(Deploy) the "deploy" script; déploiement, ok? deploy!'
+        )
+        assert keywords == ["deploy", "script", "déploiement"]
+
     def test_extract_keywords_max_limit(self) -> None:
         text = "alpha bravo charlie delta echo foxtrot golf hotel india juliet"
         keywords = MemoryStore.extract_keywords(text, max_keywords=3)
         assert len(keywords) == 3
 
+    def test_extract_keywords_cache_returns_fresh_lists(self) -> None:
+        first = MemoryStore.extract_keywords("kafka consumer lag alert")
+        first.append("mutated")
+        assert MemoryStore.extract_keywords("kafka consumer lag alert") == [
+            "kafka",
+            "consumer",
+            "lag",
+            "alert",
+        ]
+
     def test_compute_score(self) -> None:
         item = {
             "importance": 0.8,
@@ -537,6 +877,53 @@ class TestPublicScoringAPI:
         assert 0.0 <= score <= 1.0
         assert score > 0.5  # High match + importance + trust + recent
 
+    def test_compute_score_recency_halves_per_half_life(self) -> None:
+        week_old = (datetime.now(timezone.utc) - timedelta(days=7)).isoformat()
+        score = MemoryStore.compute_score(
+            {"updated_at": week_old},
+            match_score=0.0,
+            weights={"match": 0.0, "recency": 1.0, "importance": 0.0, "trust": 0.0},
+            half_life_days=7.0,
+        )
+        assert score == pytest.approx(0.5, abs=1e-4)
+
+    def test_compute_score_prefers_updated_epoch(self) -> None:
+        cfg = _ScoringConfig(
+            w_match=0.0,
+            w_recency=1.0,
+            w_importance=0.0,
+            w_trust=0.0,
+            half_life_days=7.0,
+        )
+        week_old = time.time() - 7 * 86400
+        score = _compute_score(
+            {"updated_at": "not a date", "importance": 0.0, "trust": 0.0},
+            match_score=0.0,
+            cfg=cfg,
+            updated_epoch=int(week_old),
+        )
+        assert score == pytest.approx(0.5, abs=1e-4)
+
+    def test_records_omit_generated_epoch_columns(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store(
+            "Kafka consumer lag runbook", files_read=["lag.md"], concepts=["ops"]
+        )
+        records = [
+            *store.get([mem_id]),
+            *store.search_v2("kafka lag", scoring={"min_score": 0.0}),
+            *store.search_literal(f"id:{mem_id}"),
+            *store.search_by_file("lag.md"),
+            *store.search_by_concept("ops"),
+            *store.get_timeline(),
+            store.update(mem_id, title="Runbook"),
+        ]
+        assert len(records) == 7
+        for record in records:
+            assert not {"updated_epoch", "expires_epoch", "_updated_epoch"} & set(
+                record
+            )
+
     def test_compute_score_with_custom_weights(self) -> None:
         item = {
             "importance": 1.0,
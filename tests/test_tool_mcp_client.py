@@ -220,7 +220,7 @@ class TestStdioTransport:
         mock_proc.stdin.write = MagicMock()
         mock_proc.stdin.drain = AsyncMock()
         mock_proc.stdout = AsyncMock()
-        mock_proc.stdout.readline = AsyncMock(return_value=response_bytes)
+        mock_proc.stdout.read = AsyncMock(return_value=response_bytes)
         mock_proc.returncode = None
 
         transport._process = mock_proc
@@ -242,6 +242,106 @@ class TestStdioTransport:
         mock_proc.terminate.assert_called_once()
         assert not transport.is_connected
 
+    @pytest.mark.asyncio
+    async def test_eof_marks_disconnected(self) -> None:
+        transport = StdioTransport(command=["fake"])
+        mock_proc = MagicMock()
+        mock_proc.stdin = MagicMock()
+        mock_proc.stdin.drain = AsyncMock()
+        mock_proc.stdout = AsyncMock()
+        mock_proc.stdout.read = AsyncMock(return_value=b"")
+        transport._process = mock_proc
+        transport._connected = True
+
+        with pytest.raises(MCPError, match="closed stdout"):
+            await transport.send_request("tools/list", {})
+        assert not transport.is_connected
+
+    @pytest.mark.asyncio
+    async def test_broken_pipe_marks_disconnected(self) -> None:
+        transport = StdioTransport(command=["fake"])
+        mock_proc = MagicMock()
+        mock_proc.stdin = MagicMock()
+        mock_proc.stdin.drain = AsyncMock(side_effect=ConnectionResetError())
+        mock_proc.stdout = AsyncMock()
+        mock_proc.returncode = None
+        transport._process = mock_proc
+        transport._connected = True
+
+        with pytest.raises(ConnectionResetError):
+            await transport.send_request("tools/list", {})
+        assert not transport.is_connected
+        mock_proc.stdout.read.assert_not_awaited()
+
+    def test_exited_process_is_not_connected(self) -> None:
+        transport = StdioTransport(command=["fake"])
+        mock_proc = MagicMock()
+        mock_proc.returncode = None
+        transport._process = mock_proc
+        transport._connected = True
+        assert transport.is_connected
+
+        mock_proc.returncode = 1
+        assert not transport.is_connected
+
+    @pytest.mark.asyncio
+    async def test_read_message_splits_buffered_chunks(self) -> None:
+        transport = StdioTransport(command=["fake"])
+        first = {"jsonrpc": "2.0", "id": 1, "result": {"a": 1}}
+        second = {"jsonrpc": "2.0", "id": 2, "result": {"b": 2}}
+        payload = json.dumps(first).encode() + b"\n" + json.dumps(second).encode()
+
+        reader = AsyncMock()
+        reader.read = AsyncMock(side_effect=[payload, b"\n"])
+
+        assert await transport._read_message(reader) == first
+        assert await transport._read_message(reader) == second
+        assert reader.read.await_count == 2
+        assert transport._scratch == bytearray()
+
+    @pytest.mark.asyncio
+    async def test_read_message_reassembles_split_frame(self) -> None:
+        transport = StdioTransport(command=["fake"])
+        wire = json.dumps({"jsonrpc": "2.0", "id": 1, "result": "x" * 10}).encode()
+
+        reader = AsyncMock()
+        reader.read = AsyncMock(side_effect=[wire[:5], wire[5:20], wire[20:] + b"\n"])
+
+        assert (await transport._read_message(reader))["result"] == "x" * 10
+        assert transport._scratch == bytearray()
+
+    @pytest.mark.asyncio
+    async def test_oversized_frame_disconnects(self) -> None:
+        from amplifier_module_tool_mcp_client import transport as transport_mod
+
+        transport = StdioTransport(command=["fake"])
+        transport._connected = True
+        reader = AsyncMock()
+        reader.read = AsyncMock(return_value=b"x" * 65536)
+
+        with (
+            patch.object(transport_mod, "_MAX_FRAME_BYTES", 100_000),
+            pytest.raises(MCPError, match="over 100000 bytes"),
+        ):
+            await transport._read_message(reader)
+        assert not transport._connected
+        assert transport._scratch == bytearray()
+        assert reader.read.await_count == 2
+
+    def test_encode_line_is_newline_framed(self) -> None:
+        from amplifier_module_tool_mcp_client import transport as transport_mod
+
+        msg = {"jsonrpc": "2.0", "id": 7, "method": "tools/list", "params": {}}
+        line = transport_mod._encode_line(msg)
+        assert line.endswith(b"\n")
+        assert line.count(b"\n") == 1
+        assert json.loads(line) == msg
+
+        with patch.object(transport_mod, "_orjson", None):
+            fallback = transport_mod._encode_line(msg)
+        assert fallback.endswith(b"\n")
+        assert json.loads(fallback) == msg
+
     @pytest.mark.asyncio
     async def test_command_not_found_raises(self) -> None:
         transport = StdioTransport(
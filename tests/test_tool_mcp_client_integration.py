@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -176,6 +176,31 @@ class TestMCPIntegrationFlow:
         # Transport was not re-created — same mock object
         assert tool._connections["test-fs"] is mock
 
+    @pytest.mark.asyncio
+    async def test_dead_connection_is_replaced(self) -> None:
+        """A disconnected transport is closed and a new one re-initialized."""
+        tool = MCPClientTool(config=_make_config())
+        dead = AsyncMock(spec=Transport)
+        dead.is_connected = False
+        tool._connections["test-fs"] = dead
+        tool._initialized.add("test-fs")
+        fresh = _make_mock_transport()
+
+        with patch(
+            "amplifier_module_tool_mcp_client.StdioTransport", return_value=fresh
+        ):
+            result = await tool.execute({
+                "server": "test-fs",
+                "tool": "read_file",
+                "arguments": {"path": "/a"},
+            })
+
+        assert result.success is True
+        dead.close.assert_awaited_once()
+        assert tool._connections["test-fs"] is fresh
+        # The new server process got the initialize handshake again
+        assert fresh.send_request.await_args_list[0].args[0] == "initialize"
+
     @pytest.mark.asyncio
     async def test_mount_creates_working_tool(
         self,
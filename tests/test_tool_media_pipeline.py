@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from amplifier_module_tool_media_pipeline import MediaPipelineTool, mount
+from amplifier_module_tool_media_pipeline.session import (
+    HTTP_CONNECTION_LIMIT,
+    new_client_session,
+)
 from amplifier_module_tool_media_pipeline.synthesize import (
     EdgeTTSProvider,
     ElevenLabsProvider,
@@ -22,6 +28,9 @@ from amplifier_module_tool_media_pipeline.transcribe import (
     create_transcription_provider,
 )
 
+# Patch target prefix for the transcription backends
+_TRANSCRIBE = "amplifier_module_tool_media_pipeline.transcribe"
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -34,6 +43,20 @@ def _make_audio_file(tmp_path: Path, name: str = "voice.ogg") -> Path:
     return audio
 
 
+def _iter_chunks(body: bytes, parts: int = 2) -> Any:
+    """Stand-in for ``resp.content.iter_chunked`` yielding *body* in pieces."""
+
+    def iter_chunked(_size: int) -> Any:
+        async def gen() -> Any:
+            step = max(1, len(body) // parts)
+            for i in range(0, len(body), step):
+                yield body[i : i + step]
+
+        return gen()
+
+    return iter_chunked
+
+
 # ---------------------------------------------------------------------------
 # TranscriptionProvider ABC
 # ---------------------------------------------------------------------------
@@ -53,6 +76,10 @@ class TestTranscriptionProviderABC:
         with pytest.raises(TypeError):
             Incomplete()  # type: ignore[abstract]
 
+    def test_providers_are_slotted(self) -> None:
+        for provider in (WhisperAPIProvider(api_key="sk"), LocalWhisperProvider()):
+            assert not hasattr(provider, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # Factory
@@ -80,6 +107,23 @@ class TestCreateTranscriptionProvider:
         with pytest.raises(ValueError, match="Unknown transcription provider"):
             create_transcription_provider({"provider": "nonexistent"})
 
+    def test_registered_plugin_provider(self) -> None:
+        from amplifier_module_tool_media_pipeline.transcribe import (
+            TRANSCRIPTION_PROVIDERS,
+            register_transcription_provider,
+        )
+
+        register_transcription_provider(
+            "plugin-whisper", lambda cfg: LocalWhisperProvider(model=cfg["model"])
+        )
+        try:
+            provider = create_transcription_provider(
+                {"provider": "plugin-whisper", "model": "tiny"}
+            )
+            assert isinstance(provider, LocalWhisperProvider)
+        finally:
+            TRANSCRIPTION_PROVIDERS.pop("plugin-whisper")
+
 
 # ---------------------------------------------------------------------------
 # WhisperAPIProvider
@@ -113,6 +157,46 @@ class TestWhisperAPIProvider:
         call_args = mock_session.post.call_args
         assert "api.openai.com" in call_args[0][0]
         assert "transcriptions" in call_args[0][0]
+        assert call_args.kwargs["chunked"] is True
+
+    @pytest.mark.asyncio
+    async def test_uploads_bounded_by_max_in_flight(self, tmp_path: Path) -> None:
+        import asyncio
+
+        paths = [str(_make_audio_file(tmp_path, f"{i}.ogg")) for i in range(5)]
+        for i, p in enumerate(paths):
+            Path(p).write_bytes(bytes([i]) * 10)
+        provider = WhisperAPIProvider(api_key="sk-test-key", max_in_flight=2)
+        in_flight = 0
+        peak = 0
+
+        async def enter(*_: Any) -> Any:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        async def leave(*_: Any) -> bool:
+            nonlocal in_flight
+            in_flight -= 1
+            return False
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"text": "ok"})
+        mock_response.__aenter__ = AsyncMock(side_effect=enter)
+        mock_response.__aexit__ = AsyncMock(side_effect=leave)
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.post = MagicMock(return_value=mock_response)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            await provider.transcribe_many(paths)
+
+        assert mock_session.post.call_count == 5
+        assert peak == 2
 
     @pytest.mark.asyncio
     async def test_transcribe_api_error_raises(self, tmp_path: Path) -> None:
@@ -134,6 +218,69 @@ class TestWhisperAPIProvider:
             with pytest.raises(RuntimeError, match="Whisper API error"):
                 await provider.transcribe(str(audio))
 
+    @pytest.mark.asyncio
+    async def test_transcribe_caches_by_content_hash(self, tmp_path: Path) -> None:
+        audio = _make_audio_file(tmp_path, "a.ogg")
+        duplicate = tmp_path / "copy.ogg"
+        duplicate.write_bytes(audio.read_bytes())
+        provider = WhisperAPIProvider(api_key="sk-test-key")
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"text": "cached words"})
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.post = MagicMock(return_value=mock_response)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            first = await provider.transcribe(str(audio))
+            second = await provider.transcribe(str(duplicate))
+
+        assert first == second == "cached words"
+        mock_session.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_skips_hashing(self, tmp_path: Path) -> None:
+        audio = _make_audio_file(tmp_path)
+        provider = WhisperAPIProvider(api_key="sk-test-key", cache_size=0)
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"text": "uncached"})
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.post = MagicMock(return_value=mock_response)
+
+        with (
+            patch("aiohttp.ClientSession", return_value=mock_session),
+            patch(
+                f"{_TRANSCRIBE}.file_digest"
+            ) as digest,
+        ):
+            assert await provider.transcribe(str(audio)) == "uncached"
+            assert await provider.transcribe(str(audio)) == "uncached"
+
+        digest.assert_not_called()
+        assert mock_session.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_file_chunks_streams_whole_file(self, tmp_path: Path) -> None:
+        from amplifier_module_tool_media_pipeline.transcribe import _file_chunks
+
+        audio = tmp_path / "long.ogg"
+        audio.write_bytes(bytes(range(256)) * 1000)
+
+        chunks = [c async for c in _file_chunks(audio, chunk_size=4096)]
+
+        assert b"".join(chunks) == audio.read_bytes()
+        assert max(len(c) for c in chunks) == 4096
+
 
 # ---------------------------------------------------------------------------
 # LocalWhisperProvider
@@ -154,10 +301,13 @@ class TestLocalWhisperProvider:
         )
         mock_proc.returncode = 0
 
-        with patch(
-            "asyncio.create_subprocess_exec",
-            return_value=mock_proc,
-        ) as mock_exec:
+        with (
+            patch(f"{_TRANSCRIBE}._faster_whisper", None),
+            patch(f"{_TRANSCRIBE}._openai_whisper", None),
+            patch(
+                "asyncio.create_subprocess_exec", return_value=mock_proc
+            ) as mock_exec,
+        ):
             result = await provider.transcribe(str(audio))
 
         assert result == "transcribed text output"
@@ -176,10 +326,418 @@ class TestLocalWhisperProvider:
         mock_proc.communicate = AsyncMock(return_value=(b"", b"error occurred"))
         mock_proc.returncode = 1
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_proc):
+        with (
+            patch(f"{_TRANSCRIBE}._faster_whisper", None),
+            patch(f"{_TRANSCRIBE}._openai_whisper", None),
+            patch("asyncio.create_subprocess_exec", return_value=mock_proc),
+        ):
             with pytest.raises(RuntimeError, match="Whisper CLI failed"):
                 await provider.transcribe(str(audio))
 
+    @pytest.mark.asyncio
+    async def test_transcribe_many_batches_in_process(self, tmp_path: Path) -> None:
+        audio_a = _make_audio_file(tmp_path, "a.ogg")
+        audio_b = _make_audio_file(tmp_path, "b.ogg")
+        provider = LocalWhisperProvider(model="base", batch_size=4)
+
+        fake_fw = MagicMock()
+        pipeline = fake_fw.BatchedInferencePipeline.return_value
+        held: list[bool] = []
+
+        def _batched(*args: Any, **kwargs: Any) -> Any:
+            held.append(provider._infer_slots.locked())
+            return [MagicMock(text=f" file{len(held)}")], None
+
+        pipeline.transcribe.side_effect = _batched
+
+        with patch(
+            f"{_TRANSCRIBE}._faster_whisper", fake_fw
+        ):
+            result = await provider.transcribe_many([str(audio_a), str(audio_b)])
+
+        assert result == ["file1", "file2"]
+        assert held == [True, True]
+        fake_fw.WhisperModel.assert_called_once()
+        assert pipeline.transcribe.call_args.kwargs["batch_size"] == 4
+
+    @pytest.mark.asyncio
+    async def test_transcribe_uses_resident_int8_model(self, tmp_path: Path) -> None:
+        audio = _make_audio_file(tmp_path)
+        provider = LocalWhisperProvider(model="small", device="cpu")
+
+        fake_fw = MagicMock()
+        model = fake_fw.WhisperModel.return_value
+        model.transcribe.return_value = ([MagicMock(text=" quantized")], None)
+
+        with patch(
+            f"{_TRANSCRIBE}._faster_whisper", fake_fw
+        ):
+            first = await provider.transcribe(str(audio))
+            second = await provider.transcribe(str(audio))
+
+        assert first == second == "quantized"
+        fake_fw.WhisperModel.assert_called_once_with(
+            "small", device="cpu", compute_type="int8", num_workers=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_num_workers_bounds_concurrent_inference(
+        self, tmp_path: Path
+    ) -> None:
+        import asyncio
+        import threading
+        import time
+
+        paths = [str(_make_audio_file(tmp_path, f"{i}.ogg")) for i in range(4)]
+        for i, p in enumerate(paths):
+            Path(p).write_bytes(bytes([i]) * 10)
+        provider = LocalWhisperProvider(model="small", device="cpu", num_workers=2)
+
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_transcribe(audio: Any, **kwargs: Any) -> Any:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return ([MagicMock(text="x")], None)
+
+        fake_fw = MagicMock()
+        fake_fw.WhisperModel.return_value.transcribe.side_effect = fake_transcribe
+
+        with patch(
+            f"{_TRANSCRIBE}._faster_whisper", fake_fw
+        ):
+            await asyncio.gather(*(provider.transcribe(p) for p in paths))
+
+        assert peak == 2
+        assert fake_fw.WhisperModel.call_args.kwargs["num_workers"] == 2
+
+    @pytest.mark.asyncio
+    async def test_openai_whisper_model_loaded_once_under_concurrency(
+        self, tmp_path: Path
+    ) -> None:
+        import asyncio
+        import sys
+        import types
+
+        paths = [str(_make_audio_file(tmp_path, f"{i}.ogg")) for i in range(3)]
+        for i, p in enumerate(paths):
+            Path(p).write_bytes(bytes([i]) * 10)  # distinct content, no cache hits
+        provider = LocalWhisperProvider(model="tiny")
+
+        fake_whisper = MagicMock()
+        fake_whisper.load_model.return_value.transcribe.return_value = {
+            "text": " in process "
+        }
+        fake_torch = types.SimpleNamespace(
+            cuda=types.SimpleNamespace(is_available=lambda: False)
+        )
+
+        with (
+            patch(f"{_TRANSCRIBE}._faster_whisper", None),
+            patch(
+                f"{_TRANSCRIBE}._openai_whisper",
+                fake_whisper,
+            ),
+            patch.dict(sys.modules, {"torch": fake_torch}),
+            patch("asyncio.create_subprocess_exec") as mock_exec,
+        ):
+            results = await asyncio.gather(*(provider.transcribe(p) for p in paths))
+
+        assert results == ["in process"] * 3
+        fake_whisper.load_model.assert_called_once_with("tiny", device=None)
+        mock_exec.assert_not_called()
+        _, kwargs = fake_whisper.load_model.return_value.transcribe.call_args
+        assert kwargs == {"fp16": False, "language": None}
+
+    @pytest.mark.asyncio
+    async def test_transcribe_many_falls_back_to_cli(self, tmp_path: Path) -> None:
+        audio = _make_audio_file(tmp_path)
+        provider = LocalWhisperProvider(model="base")
+
+        mock_proc = AsyncMock()
+        mock_proc.communicate = AsyncMock(return_value=(b"cli text", b""))
+        mock_proc.returncode = 0
+
+        with (
+            patch(f"{_TRANSCRIBE}._faster_whisper", None),
+            patch(f"{_TRANSCRIBE}._openai_whisper", None),
+            patch("asyncio.create_subprocess_exec", return_value=mock_proc),
+        ):
+            result = await provider.transcribe_many([str(audio)])
+
+        assert result == ["cli text"]
+
+
+# ---------------------------------------------------------------------------
+# Chunked long-form transcription
+# ---------------------------------------------------------------------------
+
+
+class TestChunking:
+    """Silence-aware chunk planning and transcript merging."""
+
+    def test_parse_silences(self) -> None:
+        from amplifier_module_tool_media_pipeline.chunking import parse_silences
+
+        log = (
+            "[silencedetect @ 0x1] silence_start: 10.2\n"
+            "[silencedetect @ 0x1] silence_end: 10.8 | silence_duration: 0.6\n"
+            "[silencedetect @ 0x1] silence_start: -0.01\n"
+            "[silencedetect @ 0x1] silence_end: 0.4 | silence_duration: 0.41\n"
+        )
+        assert parse_silences(log) == [(10.2, 10.8), (0.0, 0.4)]
+
+    def test_plan_cuts_at_silence_near_target(self) -> None:
+        from amplifier_module_tool_media_pipeline.chunking import plan_chunks
+
+        spans = plan_chunks(60.0, [(23.0, 24.0), (47.0, 48.0)], target_sec=25.0)
+        assert spans == [(0.0, 23.5), (23.0, 47.5), (47.0, 60.0)]
+
+    def test_plan_hard_cut_without_silence(self) -> None:
+        from amplifier_module_tool_media_pipeline.chunking import plan_chunks
+
+        spans = plan_chunks(30.0, [], target_sec=25.0, overlap=0.5)
+        assert spans == [(0.0, 25.0), (24.5, 30.0)]
+
+    def test_short_audio_is_single_span(self) -> None:
+        from amplifier_module_tool_media_pipeline.chunking import plan_chunks
+
+        assert plan_chunks(10.0, [], target_sec=25.0) == [(0.0, 10.0)]
+
+    def test_merge_drops_boundary_duplicates(self) -> None:
+        from amplifier_module_tool_media_pipeline.chunking import merge_transcripts
+
+        merged = merge_transcripts(
+            ["the quick brown fox", "Fox jumps over", "over the lazy dog."]
+        )
+        assert merged == "the quick brown fox jumps over the lazy dog."
+
+    @pytest.mark.asyncio
+    async def test_provider_transcribes_chunks_concurrently(
+        self, tmp_path: Path
+    ) -> None:
+        from amplifier_module_tool_media_pipeline import chunking
+
+        audio = _make_audio_file(tmp_path, "long.ogg")
+        provider = WhisperAPIProvider(api_key="sk-test", chunk_sec=25.0)
+        chunks = [(0.0, 25.0, "c0"), (24.5, 49.5, "c1"), (49.0, 60.0, "c2")]
+        texts = {"c0": "one two", "c1": "two three", "c2": "four"}
+        hints: dict[str, str | None] = {}
+
+        async def fake_one(path: str, language: str | None) -> tuple[str, str]:
+            hints[path] = language
+            return texts[path], "en"
+
+        with (
+            patch.object(chunking, "probe_duration", AsyncMock(return_value=60.0)),
+            patch.object(chunking, "chunk_audio", AsyncMock(return_value=chunks)),
+            patch.object(WhisperAPIProvider, "_transcribe_file", side_effect=fake_one),
+        ):
+            result = await provider.transcribe(str(audio))
+
+        assert result == "one two three four"
+        # The API cannot report a detected language, so no chunk waits on c0.
+        assert hints == {"c0": None, "c1": None, "c2": None}
+
+    @pytest.mark.asyncio
+    async def test_in_process_backend_reuses_detected_language(
+        self, tmp_path: Path
+    ) -> None:
+        from amplifier_module_tool_media_pipeline import chunking
+
+        audio = _make_audio_file(tmp_path, "long.ogg")
+        provider = LocalWhisperProvider(chunk_sec=25.0)
+        chunks = [(0.0, 25.0, "c0"), (24.5, 49.5, "c1"), (49.0, 60.0, "c2")]
+        hints: dict[str, str | None] = {}
+
+        async def fake_one(path: str, language: str | None) -> tuple[str, str]:
+            hints[path] = language
+            return path, "en"
+
+        with (
+            patch.object(chunking, "probe_duration", AsyncMock(return_value=60.0)),
+            patch.object(chunking, "chunk_audio", AsyncMock(return_value=chunks)),
+            patch.object(
+                LocalWhisperProvider, "_backend", return_value="faster-whisper"
+            ),
+            patch.object(
+                LocalWhisperProvider, "_transcribe_uncached", side_effect=fake_one
+            ),
+        ):
+            await provider.transcribe(str(audio))
+
+        # Language is detected on the first chunk and reused for the rest.
+        assert hints == {"c0": None, "c1": "en", "c2": "en"}
+
+    @pytest.mark.asyncio
+    async def test_configured_language_skips_detection(self, tmp_path: Path) -> None:
+        from amplifier_module_tool_media_pipeline import chunking
+
+        audio = _make_audio_file(tmp_path, "long.ogg")
+        provider = LocalWhisperProvider(chunk_sec=25.0, language="de")
+        chunks = [(0.0, 25.0, "c0"), (24.5, 40.0, "c1")]
+        hints: list[str | None] = []
+
+        async def fake_one(path: str, language: str | None) -> tuple[str, str]:
+            hints.append(language)
+            return path, "en"
+
+        with (
+            patch.object(chunking, "probe_duration", AsyncMock(return_value=40.0)),
+            patch.object(chunking, "chunk_audio", AsyncMock(return_value=chunks)),
+            patch.object(
+                LocalWhisperProvider, "_transcribe_uncached", side_effect=fake_one
+            ),
+        ):
+            await provider.transcribe(str(audio))
+
+        assert hints == ["de", "de"]
+
+
+class TestPipelinedTranscription:
+    """Decode, VAD and inference stages overlap via bounded queues."""
+
+    @staticmethod
+    async def _frames(pattern: list[bool]):
+        # 0.1 s frames of 16 kHz s16le: loud (speech) or silent
+        loud = (b"\x00\x20" * 1600)
+        quiet = b"\x00\x00" * 1600
+        for is_loud in pattern:
+            yield loud if is_loud else quiet
+
+    @pytest.mark.asyncio
+    async def test_chunks_close_at_silence_after_target(self) -> None:
+        pytest.importorskip("numpy")
+        from amplifier_module_tool_media_pipeline.pipeline import transcribe_pipelined
+
+        seen: list[float] = []
+        hints: list[str | None] = []
+
+        def infer(audio: Any, language: str | None) -> tuple[str, str]:
+            seen.append(len(audio) / 16000)
+            hints.append(language)
+            return f"chunk{len(seen)}", "en"
+
+        # 1.0 s speech, silence, 1.0 s speech, trailing speech
+        pattern = [True] * 10 + [False] + [True] * 10 + [False] + [True] * 3
+        text = await transcribe_pipelined(
+            "unused.ogg", infer, target_sec=1.0, frames=self._frames(pattern)
+        )
+
+        assert text == "chunk1 chunk2 chunk3"
+        assert seen == pytest.approx([1.1, 1.1, 0.3])
+        assert hints == [None, "en", "en"]
+
+    @pytest.mark.asyncio
+    async def test_inference_holds_a_slot(self) -> None:
+        pytest.importorskip("numpy")
+        from amplifier_module_tool_media_pipeline.pipeline import transcribe_pipelined
+
+        slots = asyncio.Semaphore(1)
+        held: list[bool] = []
+
+        def infer(audio: Any, language: str | None) -> tuple[str, str]:
+            held.append(slots.locked())
+            return "chunk", "en"
+
+        await transcribe_pipelined(
+            "unused.ogg",
+            infer,
+            target_sec=0.1,
+            frames=self._frames([True, False] * 5),
+            slots=slots,
+        )
+
+        assert held and all(held)
+        assert not slots.locked()
+
+    @pytest.mark.asyncio
+    async def test_inference_error_propagates(self) -> None:
+        pytest.importorskip("numpy")
+        from amplifier_module_tool_media_pipeline.pipeline import transcribe_pipelined
+
+        def infer(audio: Any, language: str | None) -> tuple[str, str]:
+            raise RuntimeError("model exploded")
+
+        with pytest.raises(RuntimeError, match="model exploded"):
+            await transcribe_pipelined(
+                "unused.ogg",
+                infer,
+                target_sec=0.1,
+                frames=self._frames([True, False] * 50),
+            )
+
+
+    @staticmethod
+    def _fake_ffmpeg(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch, script: str
+    ) -> None:
+        fake = tmp_path / "ffmpeg"
+        fake.write_text(f"#!/bin/sh\n{script}\n")
+        fake.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    @pytest.mark.asyncio
+    async def test_decode_yields_frames_from_ffmpeg(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from amplifier_module_tool_media_pipeline.pipeline import decode_pcm
+
+        # 0.25 s of silence: two full 0.1 s frames and a partial one
+        self._fake_ffmpeg(tmp_path, monkeypatch, "head -c 8000 /dev/zero")
+
+        frames = [f async for f in decode_pcm(str(tmp_path / "voice.ogg"))]
+        assert [len(f) for f in frames] == [3200, 3200, 1600]
+
+    @pytest.mark.asyncio
+    async def test_ffmpeg_failure_raises(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from amplifier_module_tool_media_pipeline.pipeline import decode_pcm
+
+        self._fake_ffmpeg(
+            tmp_path, monkeypatch, "echo 'voice.ogg: Invalid data' >&2; exit 1"
+        )
+
+        with pytest.raises(RuntimeError, match="rc=1.*Invalid data"):
+            async for _ in decode_pcm(str(tmp_path / "voice.ogg")):
+                pass
+
+
+# ---------------------------------------------------------------------------
+# LRUCache
+# ---------------------------------------------------------------------------
+
+
+class TestLRUCache:
+    """LRUCache evicts the least recently used entry."""
+
+    def test_evicts_oldest(self) -> None:
+        from amplifier_module_tool_media_pipeline.cache import LRUCache
+
+        cache: LRUCache[str, str] = LRUCache(2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        assert cache.get("a") == "1"  # refresh "a"
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert len(cache) == 2
+
+    def test_zero_size_disables(self) -> None:
+        from amplifier_module_tool_media_pipeline.cache import LRUCache
+
+        cache: LRUCache[str, str] = LRUCache(0)
+        cache.put("a", "1")
+        assert cache.get("a") is None
+
 
 # ===========================================================================
 # TTS Provider Tests
@@ -205,6 +763,15 @@ class TestTTSProviderABC:
         with pytest.raises(TypeError):
             Incomplete()  # type: ignore[abstract]
 
+    def test_providers_are_slotted(self) -> None:
+        providers = (
+            EdgeTTSProvider(),
+            ElevenLabsProvider(api_key="k"),
+            OpenAITTSProvider(api_key="k"),
+        )
+        for provider in providers:
+            assert not hasattr(provider, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # TTS Factory
@@ -234,6 +801,21 @@ class TestCreateTTSProvider:
         with pytest.raises(ValueError, match="Unknown TTS provider"):
             create_tts_provider({"provider": "nonexistent"})
 
+    def test_registered_plugin_provider(self) -> None:
+        from amplifier_module_tool_media_pipeline.synthesize import (
+            TTS_PROVIDERS,
+            register_tts_provider,
+        )
+
+        register_tts_provider(
+            "plugin-tts", lambda cfg: EdgeTTSProvider(voice=cfg["voice"])
+        )
+        try:
+            provider = create_tts_provider({"provider": "plugin-tts", "voice": "v"})
+            assert isinstance(provider, EdgeTTSProvider)
+        finally:
+            TTS_PROVIDERS.pop("plugin-tts")
+
 
 # ---------------------------------------------------------------------------
 # EdgeTTSProvider
@@ -261,6 +843,34 @@ class TestEdgeTTSProvider:
         mock_cls.assert_called_once_with("Hello world", voice="en-US-AriaNeural")
         mock_communicate.save.assert_awaited_once_with(str(output))
 
+    @pytest.mark.asyncio
+    async def test_synthesize_many_dedupes_repeated_text(self, tmp_path: Path) -> None:
+        provider = EdgeTTSProvider(voice="en-US-AriaNeural", max_concurrency=2)
+
+        def make_communicate(text: str, voice: str) -> Any:
+            comm = MagicMock()
+
+            async def save(path: str) -> None:
+                Path(path).write_bytes(text.encode())
+
+            comm.save = save
+            return comm
+
+        items = [
+            ("Chapter one.", str(tmp_path / "0.mp3")),
+            ("Pause.", str(tmp_path / "1.mp3")),
+            ("Chapter one.", str(tmp_path / "2.mp3")),
+        ]
+        with patch(
+            "amplifier_module_tool_media_pipeline.synthesize.edge_tts.Communicate",
+            side_effect=make_communicate,
+        ) as mock_cls:
+            result = await provider.synthesize_many(items)
+
+        assert result == [path for _, path in items]
+        assert mock_cls.call_count == 2
+        assert (tmp_path / "2.mp3").read_bytes() == b"Chapter one."
+
 
 # ---------------------------------------------------------------------------
 # ElevenLabsProvider
@@ -279,7 +889,7 @@ class TestElevenLabsProvider:
 
         mock_response = MagicMock()
         mock_response.status = 200
-        mock_response.read = AsyncMock(return_value=b"\xff\xfb\x90\x00")
+        mock_response.content.iter_chunked = _iter_chunks(b"\xff\xfb\x90\x00")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=False)
 
@@ -313,7 +923,7 @@ class TestOpenAITTSProvider:
 
         mock_response = MagicMock()
         mock_response.status = 200
-        mock_response.read = AsyncMock(return_value=b"\xff\xfb\x90\x00")
+        mock_response.content.iter_chunked = _iter_chunks(b"\xff\xfb\x90\x00")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=False)
 
@@ -331,6 +941,107 @@ class TestOpenAITTSProvider:
         call_args = mock_session.post.call_args
         assert "api.openai.com" in call_args[0][0]
         assert "speech" in call_args[0][0]
+        assert call_args.kwargs["json"]["response_format"] == "mp3"
+
+    @pytest.mark.asyncio
+    async def test_interrupted_stream_removes_partial_file(
+        self, tmp_path: Path
+    ) -> None:
+        output = tmp_path / "output.mp3"
+        provider = OpenAITTSProvider(api_key="sk-test-key", voice="alloy")
+
+        def broken_iter(_size: int) -> Any:
+            async def gen() -> Any:
+                yield b"\xff\xfb"
+                raise ConnectionResetError("peer went away")
+
+            return gen()
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.content.iter_chunked = broken_iter
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.post = MagicMock(return_value=mock_response)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            with pytest.raises(ConnectionResetError):
+                await provider.synthesize("Hello world", str(output))
+
+        assert not output.exists()
+
+    @pytest.mark.asyncio
+    async def test_preallocated_file_truncated_to_body(self, tmp_path: Path) -> None:
+        output = tmp_path / "output.mp3"
+        provider = OpenAITTSProvider(api_key="sk-test-key", voice="alloy")
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        # Advertised length exceeds the body actually delivered.
+        mock_response.content_length = 4096
+        mock_response.content.iter_chunked = _iter_chunks(b"\xff\xfb\x90\x00")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.post = MagicMock(return_value=mock_response)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            await provider.synthesize("Hello world", str(output))
+
+        assert output.read_bytes() == b"\xff\xfb\x90\x00"
+
+    @pytest.mark.asyncio
+    async def test_repeat_synthesis_replays_cached_file(self, tmp_path: Path) -> None:
+        provider = OpenAITTSProvider(api_key="sk-test-key", voice="alloy")
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.content.iter_chunked = _iter_chunks(b"\xff\xfb\x90\x00")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.post = MagicMock(return_value=mock_response)
+
+        first = tmp_path / "first.mp3"
+        second = tmp_path / "second.mp3"
+        with patch("aiohttp.ClientSession", return_value=mock_session):
+            await provider.synthesize("Hello world", str(first))
+            await provider.synthesize("Hello world", str(second))
+            await provider.synthesize("Different", str(tmp_path / "third.mp3"))
+
+        assert second.read_bytes() == b"\xff\xfb\x90\x00"
+        assert mock_session.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_calls(self, tmp_path: Path) -> None:
+        provider = OpenAITTSProvider(api_key="sk-test-key", voice="alloy")
+
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.content.iter_chunked = _iter_chunks(b"\xff\xfb")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=False)
+
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.close = AsyncMock()
+        mock_session.post = MagicMock(return_value=mock_response)
+
+        with patch("aiohttp.ClientSession", return_value=mock_session) as mock_cls:
+            await provider.synthesize("one", str(tmp_path / "a.mp3"))
+            await provider.synthesize("two", str(tmp_path / "b.mp3"))
+            await provider.close()
+
+        mock_cls.assert_called_once()
+        assert mock_session.post.call_count == 2
+        mock_session.close.assert_awaited_once()
 
 
 # ===========================================================================
@@ -409,6 +1120,46 @@ class TestMediaPipelineTool:
         assert result.success is True
         assert result.output["audio_path"] == str(output)
 
+    @pytest.mark.asyncio
+    async def test_execute_transcribe_many_bounded(self, tmp_path: Path) -> None:
+        import asyncio
+
+        paths = [str(_make_audio_file(tmp_path, f"clip{i}.ogg")) for i in range(6)]
+        tool = MediaPipelineTool(
+            config={"transcription": {"api_key": "sk-test", "concurrency": 2}}
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fake_transcribe(path: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return Path(path).stem
+
+        with patch.object(
+            WhisperAPIProvider, "transcribe", side_effect=fake_transcribe
+        ):
+            result = await tool.execute({"action": "transcribe", "audio_paths": paths})
+
+        assert result.success is True
+        assert [r["text"] for r in result.output["results"]] == [
+            f"clip{i}" for i in range(6)
+        ]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("audio_paths", ["a.wav", [], ["a.wav", 3], {"a": 1}])
+    async def test_execute_rejects_bad_audio_paths(self, audio_paths: Any) -> None:
+        tool = self._make_tool()
+        result = await tool.execute(
+            {"action": "transcribe", "audio_paths": audio_paths}
+        )
+        assert result.success is False
+        assert "audio_paths" in result.error["message"]
+
     @pytest.mark.asyncio
     async def test_execute_unknown_action(self) -> None:
         tool = self._make_tool()
@@ -446,3 +1197,20 @@ class TestMount:
 
         # Check capability was registered
         assert "media.pipeline" in mock_coordinator.capabilities
+
+    @pytest.mark.asyncio
+    async def test_mount_cleanup_closes_providers(self, mock_coordinator: Any) -> None:
+        cleanup = await mount(mock_coordinator, config={})
+        tool = mock_coordinator.mounts[0]["obj"]
+
+        with patch.object(tool, "close", AsyncMock()) as close:
+            await cleanup()
+        close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_provider_sessions_use_a_bounded_connector(self) -> None:
+        session = new_client_session()
+        try:
+            assert session.connector.limit == HTTP_CONNECTION_LIMIT
+        finally:
+            await session.close()
@@ -6,12 +6,15 @@ and the mount() integration.
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+import amplifier_module_tool_memory_store as memory_store_module
 from amplifier_module_tool_memory_store import MemoryStore, MemoryTool, mount
 
 
@@ -96,6 +99,26 @@ class TestMemoryStore:
         assert "private" in sensitivities_p
         assert "secret" not in sensitivities_p
 
+    def test_search_v2_sql_score_matches_python_scorer(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        fresh = store.store("Kafka consumer lag tuning", importance=0.9, trust=0.7)
+        stale = store.store("Kafka partition rebalancing", importance=0.2)
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute(
+            "UPDATE memories SET updated_at = '2024-01-01T00:00:00+00:00' "
+            "WHERE id = ?",
+            (stale,),
+        )
+        conn.commit()
+        conn.close()
+
+        results = store.search_v2("kafka", scoring={"min_score": 0.0})
+
+        assert [r["id"] for r in results] == [fresh, stale]
+        for r in results:
+            expected = MemoryStore.compute_score(r, match_score=r["_match"])
+            assert r["_score"] == pytest.approx(expected, abs=1e-3)
+
     def test_search_v2_min_score_filtering(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
         store.store("unrelated content about cooking pasta recipes")
@@ -121,6 +144,18 @@ class TestMemoryStore:
         assert all(isinstance(i, str) for i in ids)
         assert len(ids) >= 1
 
+    def test_search_ids_matches_search_v2_order(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        store.store("Rust ownership and borrowing", importance=0.9)
+        store.store("Rust async runtimes", importance=0.2)
+
+        ids = store.search_ids("rust", scoring={"min_score": 0.0})
+        results = store.search_v2("rust", limit=50, scoring={"min_score": 0.0})
+
+        assert ids == [r["id"] for r in results]
+        # Both searches count as an access
+        assert all(r["accessed_count"] == 2 for r in store.get(ids))
+
     def test_delete(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
         mem_id = store.store("To be deleted")
@@ -147,6 +182,20 @@ class TestMemoryStore:
             assert "id" in item
             assert "category" in item
 
+    def test_list_all_keyset_pages(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        for i in range(5):
+            store.store(f"Paged memory number {i}")
+
+        seen: list[str] = []
+        after = None
+        while page := store.list_all(limit=2, after=after):
+            seen.extend(m["id"] for m in page)
+            after = (page[-1]["updated_at"], page[-1]["id"])
+
+        assert seen == [m["id"] for m in store.list_all()]
+        assert len(set(seen)) == 5
+
     def test_count(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
         assert store.count() == 0
@@ -159,6 +208,21 @@ class TestMemoryStore:
         store.store("four")
         assert store.count() == 4
 
+    def test_count_skips_unpurged_expired(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        store.store("Still current")
+        expired = store.store("Already expired", ttl_days=1)
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute(
+            "UPDATE memories SET expires_at = '2000-01-01T00:00:00+00:00' "
+            "WHERE id = ?",
+            (expired,),
+        )
+        conn.commit()
+        conn.close()
+
+        assert store.count() == len(store.list_all()) == 1
+
     def test_fts_sync(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
         mem_id = store.store("Elasticsearch indexing performance tuning")
@@ -177,6 +241,91 @@ class TestMemoryStore:
         )
         assert len(results_after) == 0
 
+    def test_fts_follows_indexed_column_updates(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Cassandra compaction strategy", title="Compaction")
+        scoring = {"min_score": 0.0}
+
+        store.update(mem_id, importance=0.9)
+        assert [r["id"] for r in store.search_v2("cassandra", scoring=scoring)] == [
+            mem_id
+        ]
+
+        store.update(mem_id, content="ScyllaDB compaction strategy")
+        assert store.search_v2("cassandra", scoring=scoring) == []
+        assert [r["id"] for r in store.search_v2("scylladb", scoring=scoring)] == [
+            mem_id
+        ]
+
+    def test_fts_v3_update_trigger_is_narrowed(self, tmp_path: Path) -> None:
+        _make_store(tmp_path).close()
+        db = str(tmp_path / "test_memories.db")
+        conn = sqlite3.connect(db)
+        conn.execute("DROP TRIGGER memories_au")
+        conn.execute(
+            "CREATE TRIGGER memories_au AFTER UPDATE ON memories BEGIN "
+            "INSERT INTO memories_fts(memories_fts, rowid, content, title, subtitle) "
+            "VALUES('delete', old.rowid, old.content, old.title, old.subtitle); "
+            "INSERT INTO memories_fts(rowid, content, title, subtitle) "
+            "VALUES (new.rowid, new.content, new.title, new.subtitle); END"
+        )
+        conn.execute("UPDATE schema_meta SET value = '3' WHERE key = 'fts_version'")
+        conn.commit()
+        conn.close()
+
+        store = _make_store(tmp_path)
+        store.close()
+        conn = sqlite3.connect(db)
+        (sql,) = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'memories_au'"
+        ).fetchone()
+        conn.close()
+        assert "UPDATE OF content, title, subtitle" in sql
+
+    def test_search_matches_keyword_prefixes(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Deployment pipeline for the staging cluster")
+
+        results = store.search_v2("deploy", scoring={"min_score": 0.0})
+        assert [r["id"] for r in results] == [mem_id]
+
+    def test_search_ignores_diacritics(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Meeting notes from the café about résumé formats")
+
+        results = store.search_v2("cafe resume", scoring={"min_score": 0.0})
+        assert [r["id"] for r in results] == [mem_id]
+
+    def test_search_with_fts_operators_uses_fts(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Operator characters in the prompt must not break the MATCH query."""
+        store = _make_store(tmp_path)
+        mem_id = store.store("Notes on c++ templates and NOT operator overloads")
+
+        def _no_like(*_: Any, **__: Any) -> Any:
+            raise AssertionError("fell back to LIKE search")
+
+        monkeypatch.setattr(store, "_search_like", _no_like)
+        results = store.search_v2(
+            'c++ "templates" NOT (operator', scoring={"min_score": 0.0}
+        )
+        assert [r["id"] for r in results] == [mem_id]
+
+    def test_like_fallback_counts_keyword_hits(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        both = store.store("Rollout plan for the deploy script")
+        one = store.store("Deploy checklist", title="")
+        # "_" in a keyword is literal, not a LIKE wildcard
+        lookalike = store.store("deployXscript is not a snake_case match")
+
+        keywords = ["deploy", "script", "deploy_script"]
+        results = {m["id"]: match for m, match in store._search_like(keywords, 10)}
+        assert results[both] == pytest.approx(0.45)
+        assert results[one] == pytest.approx(0.30)
+        assert results[lookalike] == pytest.approx(0.45)
+        assert all("_hits" not in m for m, _ in store._search_like(["deploy"], 10))
+
     def test_get_empty_ids(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
         assert store.get([]) == []
@@ -185,6 +334,15 @@ class TestMemoryStore:
         store = _make_store(tmp_path)
         assert store.get(["nonexistent"]) == []
 
+    def test_get_many_ids(self, tmp_path: Path) -> None:
+        """Id lists are bound as one parameter, past SQLite's variable limit."""
+        store = _make_store(tmp_path)
+        mem_id = store.store("Needle among many ids")
+        ids = [f"missing{i}" for i in range(40_000)] + [mem_id]
+
+        assert [r["id"] for r in store.get(ids)] == [mem_id]
+        assert store.get(ids, _increment_access=True)[0]["accessed_count"] == 1
+
     def test_store_with_tags(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
         mem_id = store.store(
@@ -203,6 +361,58 @@ class TestMemoryStore:
         assert id1 == id2
         assert store.count() == 1
 
+    def test_store_many(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        existing = store.store("Already stored before the batch")
+
+        ids = store.store_many([
+            {"content": "Batch item one", "category": "batch", "tags": ["a"]},
+            {"content": "Already stored before the batch"},
+            {"content": "Batch item one"},
+            {"content": "Batch item two", "ttl_days": 3, "type": "bogus"},
+        ])
+
+        assert ids[1] == existing
+        assert ids[0] == ids[2]
+        assert len(set(ids)) == 3
+        assert store.count() == 3
+        records = {r["id"]: r for r in store.get(ids)}
+        assert records[ids[0]]["category"] == "batch"
+        assert records[ids[0]]["tags"] == "a"
+        assert records[ids[3]]["expires_at"] is not None
+        assert records[ids[3]]["type"] == "change"
+        assert store.store("Batch item two") == ids[3]
+        assert store.store_many([]) == []
+
+    def test_deduplication_refreshes_updated_at(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Refreshed on duplicate store")
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute("UPDATE memories SET updated_at = '2024-01-01T00:00:00+00:00'")
+        conn.commit()
+        conn.close()
+
+        assert store.store("Refreshed on duplicate store") == mem_id
+        assert store.get([mem_id])[0]["updated_at"] > "2025"
+
+    def test_deduplication_after_update(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        mem_id = store.store("Content before the edit")
+        store.update(mem_id, content="Content after the edit")
+
+        assert store.store("Content after the edit") == mem_id
+        assert store.count() == 1
+
+    def test_deduplication_sees_other_connections(self, tmp_path: Path) -> None:
+        """Rows committed by another writer are not hidden by the Bloom gate."""
+        store = _make_store(tmp_path)
+        store.store("Warm up the dedup filter")
+        other = MemoryStore(tmp_path / "test_memories.db")
+        mem_id = other.store("Written by another process")
+
+        assert store.store("Written by another process") == mem_id
+        assert store.count() == 2
+
     def test_ttl_expiry(self, tmp_path: Path) -> None:
         """Store with ttl_days, then verify purge_expired removes it."""
         store = _make_store(tmp_path)
@@ -226,6 +436,87 @@ class TestMemoryStore:
         assert purged == 1
         assert store.get([mem_id]) == []
 
+    def test_purge_expired_min_expired(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        ids = [store.store(f"Short-lived memory {i}", ttl_days=1) for i in range(2)]
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute(
+            "UPDATE memories SET expires_at = '2000-01-01T00:00:00+00:00' "
+            "WHERE id = ?",
+            (ids[0],),
+        )
+        conn.commit()
+
+        assert store.purge_expired(min_expired=2) == 0
+        assert conn.execute("SELECT count(*) FROM memories").fetchone()[0] == 2
+        assert store.count() == 1
+
+        conn.execute("UPDATE memories SET expires_at = '2000-01-01T00:00:00+00:00'")
+        conn.commit()
+        conn.close()
+        assert store.purge_expired(min_expired=2) == 2
+
+    def test_purge_expired_in_batches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(memory_store_module, "_PURGE_BATCH_SIZE", 2)
+        store = _make_store(tmp_path)
+        for i in range(5):
+            store.store(f"Batch-expired memory {i}", ttl_days=1)
+        store.store("Keeps no TTL")
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        conn.execute(
+            "UPDATE memories SET expires_at = '2000-01-01T00:00:00+00:00' "
+            "WHERE expires_at IS NOT NULL"
+        )
+        conn.commit()
+        conn.close()
+
+        assert store.purge_expired() == 5
+        assert store.count() == 1
+
+    def test_database_uses_wal(self, tmp_path: Path) -> None:
+        _make_store(tmp_path)
+        conn = sqlite3.connect(str(tmp_path / "test_memories.db"))
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        assert mode == "wal"
+
+    def test_wal_size_is_bounded(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        with store._write_lock, store._rw_connection() as conn:
+            limit = conn.execute("PRAGMA journal_size_limit").fetchone()[0]
+        store.close()
+        assert 0 < limit <= 64 * 1024 * 1024
+
+    def test_read_connections_are_pooled(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        with store._ro_connection() as first:
+            pass
+        with store._ro_connection() as second:
+            pass
+        assert first is second
+        store.close()
+
+    def test_uncommitted_write_is_rolled_back(self, tmp_path: Path) -> None:
+        """An aborted write on the shared connection must not leak."""
+        store = _make_store(tmp_path)
+        with pytest.raises(RuntimeError):
+            with store._write_lock, store._rw_connection() as conn:
+                conn.execute(
+                    "INSERT INTO schema_meta (key, value) VALUES ('leak', 'x')"
+                )
+                raise RuntimeError("boom")
+
+        store.store("A later committed write")
+        with store._ro_connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM schema_meta WHERE key = 'leak'"
+            ).fetchone()
+        assert row is None
+
 
 # ===========================================================================
 # MemoryTool tests
@@ -274,6 +565,97 @@ class TestMemoryTool:
         assert "count" in result.output
         assert result.output["count"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_search_memories_is_cached_until_a_write(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = _make_store(tmp_path)
+        tool = MemoryTool(store)
+        store.store("Terraform state locking notes")
+        calls = 0
+        search_v2 = store.search_v2
+
+        def _counting(*args: Any, **kwargs: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            return search_v2(*args, **kwargs)
+
+        monkeypatch.setattr(store, "search_v2", _counting)
+        search = {"operation": "search_memories", "query": "terraform"}
+
+        first = await tool.execute(search)
+        second = await tool.execute(search)
+        assert calls == 1
+        assert second.output == first.output
+        # Case and whitespace differences share the entry
+        await tool.execute({**search, "query": "  Terraform "})
+        assert calls == 1
+
+        # A write from another connection invalidates the cache too
+        MemoryStore(tmp_path / "test_memories.db").store("Terraform workspaces")
+        third = await tool.execute(search)
+        assert calls == 2
+        assert third.output["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_store_calls_run_off_the_event_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = _make_store(tmp_path)
+        tool = MemoryTool(store)
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        store_memory = store.store
+
+        def _recording(*args: Any, **kwargs: Any) -> Any:
+            threads.append(threading.get_ident())
+            return store_memory(*args, **kwargs)
+
+        monkeypatch.setattr(store, "store", _recording)
+        result = await tool.execute({
+            "operation": "store_memory",
+            "content": "Written from a worker thread",
+        })
+
+        assert result.success is True
+        assert threads and loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_memory_calls_share_one_query(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        store = _make_store(tmp_path)
+        tool = MemoryTool(store)
+        ids = [store.store(f"Batched memory {i}") for i in range(3)]
+        batches: list[list[str]] = []
+        get = store.get
+
+        def _recording(batch: list[str], **kwargs: Any) -> Any:
+            batches.append(list(batch))
+            return get(batch, **kwargs)
+
+        monkeypatch.setattr(store, "get", _recording)
+        results = await asyncio.gather(
+            *(tool.execute({"operation": "get_memory", "id": i}) for i in ids),
+            tool.execute({"operation": "get_memory", "id": ids[0]}),
+            tool.execute({"operation": "get_memory", "id": "missing"}),
+        )
+
+        assert batches == [[*ids, "missing"]]
+        assert [r.output["id"] for r in results[:4]] == [*ids, ids[0]]
+        assert results[4].success is False
+
+    @pytest.mark.asyncio
+    async def test_cancelled_get_fetch_releases_waiters(self) -> None:
+        loop = asyncio.get_running_loop()
+        waiters = [loop.create_future() for _ in range(2)]
+        fetch = loop.create_future()
+        fetch.cancel()
+
+        MemoryTool._resolve_gets({"a": waiters[:1], "b": waiters[1:]}, fetch)
+
+        assert all(w.cancelled() for w in waiters)
+
     @pytest.mark.asyncio
     async def test_list_memories_operation(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
@@ -297,6 +679,53 @@ class TestMemoryTool:
         assert "total" in result.output
         assert result.output["total"] == 2
         assert len(result.output["memories"]) == 2
+        assert result.output["next_cursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_search_memories_literal_queries(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        tool = MemoryTool(store)
+        tagged = store.store("Rollout checklist", tags=["deploy_prod", "ops"])
+        store.store("Private deploy notes", tags=["deploy_prod"], sensitivity="private")
+        store.store("Unrelated", tags=["deploy"])
+
+        by_tag = await tool.execute({
+            "operation": "search_memories",
+            "query": "#deploy_prod",
+        })
+        assert [r["id"] for r in by_tag.output["results"]] == [tagged]
+        assert by_tag.output["results"][0]["_match"] == 1.0
+
+        by_id = await tool.execute({
+            "operation": "search_memories",
+            "query": f"id:{tagged}",
+        })
+        assert [r["id"] for r in by_id.output["results"]] == [tagged]
+        assert store.get([tagged])[0]["accessed_count"] == 2
+
+        assert store.search_literal("rollout checklist") is None
+
+    @pytest.mark.asyncio
+    async def test_list_memories_cursor(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        tool = MemoryTool(store)
+        for i in range(3):
+            store.store(f"Cursor listing memory {i}")
+
+        first = await tool.execute({"operation": "list_memories", "limit": 2})
+        assert first.output["next_cursor"] is not None
+        second = await tool.execute({
+            "operation": "list_memories",
+            "limit": 2,
+            "cursor": first.output["next_cursor"],
+        })
+        ids = [m["id"] for m in first.output["memories"]]
+        ids += [m["id"] for m in second.output["memories"]]
+        assert sorted(ids) == sorted(m["id"] for m in store.list_all())
+        assert second.output["next_cursor"] is None
+
+        bad = await tool.execute({"operation": "list_memories", "cursor": "nope"})
+        assert bad.success is False
 
     @pytest.mark.asyncio
     async def test_get_memory_operation(self, tmp_path: Path) -> None:
@@ -350,6 +779,39 @@ class TestMemoryTool:
         result = await tool.execute({"operation": "do_something_weird"})
         assert result.success is False
 
+    @pytest.mark.asyncio
+    async def test_numeric_inputs_are_coerced_once(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        tool = MemoryTool(store)
+
+        stored = await tool.execute({
+            "operation": "store_memory",
+            "content": "coerced importance",
+            "importance": "0.9",
+        })
+        assert stored.success is True
+        assert store.get([stored.output["id"]])[0]["importance"] == 0.9
+
+        listed = await tool.execute({"operation": "list_memories", "limit": "1"})
+        assert len(listed.output["memories"]) == 1
+
+        bad = await tool.execute({
+            "operation": "search_memories",
+            "query": "coerced",
+            "limit": "ten",
+        })
+        assert bad.success is False
+        assert "limit" in bad.error["message"]
+
+    def test_every_schema_operation_has_a_handler(self, tmp_path: Path) -> None:
+        tool = MemoryTool(_make_store(tmp_path))
+        operations = tool.input_schema["properties"]["operation"]["enum"]
+        assert sorted(operations) == sorted(tool._ops)
+
+    def test_input_schema_is_shared(self, tmp_path: Path) -> None:
+        store = _make_store(tmp_path)
+        assert MemoryTool(store).input_schema is MemoryTool(store).input_schema
+
     @pytest.mark.asyncio
     async def test_store_memory_missing_content(self, tmp_path: Path) -> None:
         store = _make_store(tmp_path)
@@ -429,3 +891,51 @@ class TestMount:
         assert hasattr(cap, "search_v2")
         assert hasattr(cap, "search_ids")
         assert hasattr(cap, "get")
+
+    @pytest.mark.asyncio
+    async def test_mount_cleanup_closes_store(
+        self, tmp_path: Path, mock_coordinator: Any
+    ) -> None:
+        cleanup = await mount(
+            mock_coordinator,
+            config={"db_path": str(tmp_path / "memories.db")},
+        )
+        store = mock_coordinator.capabilities["memory.store"]
+
+        cleanup()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.store("after close")
+
+    @pytest.mark.asyncio
+    async def test_mount_ttl_autopurge(
+        self, tmp_path: Path, mock_coordinator: Any
+    ) -> None:
+        db_path = tmp_path / "memories.db"
+        cleanup = await mount(
+            mock_coordinator,
+            config={
+                "db_path": str(db_path),
+                "ttl_autopurge": True,
+                "ttl_resolution_s": 0.01,
+            },
+        )
+        store = mock_coordinator.capabilities["memory.store"]
+        mem_id = store.store("Expires right away", ttl_days=1)
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "UPDATE memories SET expires_at = '2000-01-01T00:00:00+00:00' "
+            "WHERE id = ?",
+            (mem_id,),
+        )
+        conn.commit()
+        conn.close()
+
+        assert store.list_all() == []  # hidden before the sweep
+        for _ in range(100):
+            if store.count() == 0:
+                break
+            await asyncio.sleep(0.01)
+        cleanup()
+
+        assert store.count() == 0